@@ -7,6 +7,10 @@ setup(
 
     python_requires=">=3.8",
     install_requires=['requests>=2.25.1'],
+    entry_points={
+        'console_scripts': ['tbcs-upload=tbcs_client.JUnitUploader:main'],
+        'pytest11': ['tbcs=tbcs_client.PytestPlugin']
+    },
 
     description="Basic api client for automated testing with TestBench CS",
     license="PSF",
@@ -1,12 +1,34 @@
 import requests
 import json
 import os
+import threading
 import time
+import warnings
 
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from tbcs_client.APIError import APIError
+from tbcs_client.Authenticator import Authenticator
+from tbcs_client.CircuitBreaker import CircuitBreaker
+from tbcs_client.DefectRegistry import DefectRegistry
+from tbcs_client.Execution import Execution
 from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.KeepAliveHTTPAdapter import KeepAliveHTTPAdapter
+from tbcs_client.RateLimiter import RateLimiter
+from tbcs_client.RequestAttempts import RequestAttempts
+from tbcs_client.RequestBuilder import Request, RequestBuilder
+from tbcs_client.ResultJournal import JournalEntry, ResultJournal
+from tbcs_client.RetryPolicy import RetryPolicy
+from tbcs_client.SessionTokenStore import SessionTokenStore
+from tbcs_client.TestCase import TestCase
+from tbcs_client.TestCaseCache import TestCaseCache
+from tbcs_client.TestCaseIndex import TestCaseIndex
+from tbcs_client.TestStep import TestStep
+from tbcs_client.TimingEvent import RequestEvent, WaitEvent
+from tbcs_client.ValidatorCache import ValidatorCache
+from tbcs_client.WaitPolicy import WaitPolicy, ExponentialBackoffWaitPolicy
+from tbcs_client.WaitStatistics import WaitStatistics
 
 """ Class for connecting to a TestBench CS REST-API
 
@@ -14,11 +36,54 @@ The APIConnector class wraps a set of API-calls against the TestBench CS REST-AP
 create test cases within TestBench CS, start test executions and report test results. This class expects
 the path to a JSON-configuration file for initialization (structure is shown in 'empty.tbcs.config.json'
 in the root of the GitLab-Repository). If no path is given it defaults to a file with name 'tbcs.config.json'
-that must be placed inside your project root.
+that must be placed inside your project root. The 'server_address' is contacted via HTTPS unless it explicitly
+starts with 'http://'.
 
 When provided with valid configuration, you can simply call any of this classes get-, create- and
 report-functions from any instance of this class. Redundant steps such as authenticating with the API
-are handled internally.
+are handled internally; 'log_in' only logs in if there is no session yet. Instead of a path, the already loaded
+configuration can be passed as dict.
+
+An instance of this class can be shared between threads. Re-authentication after an expired session is done by
+a single thread while all others wait for it. The size of the HTTP connection pool can be set with
+'pool_connections' and 'pool_maxsize' and should be at least the number of threads using the connector; pooled
+connections are kept alive between requests. To share one session between processes, pass a SessionTokenStore
+as 'token_store'. Connectors for several products can share their HTTP connections and login by passing the same
+'session' and 'authenticator', which is what ConnectorPool does.
+
+Transient failures such as 429, 502 and 503 responses are retried as configured by the 'retry_policy' (see
+RetryPolicy.py); an expired session is renewed once per call. To stay below the rate limit of the server, pass a
+RateLimiter, to stop sending requests to an unavailable server for a while, pass a CircuitBreaker. Requests are
+built by a RequestBuilder and these decisions are made by RequestAttempts, both shared with the AsyncAPIConnector.
+
+Identical GET requests issued by several threads at the same time are sent only once and all callers receive the
+same response, unless 'coalesce_requests' is disabled. Passing a ValidatorCache makes repeated GETs conditional,
+so that unchanged documents are not downloaded again while polling.
+
+Callbacks registered with 'add_hook' receive a RequestEvent for every call against the REST-API and a WaitEvent
+for every persistence check (see TimingEvent.py), e.g. a LatencyAggregator reporting percentiles per endpoint.
+
+After each write the connector reads the written data back until it is persisted. How often this is checked and
+when to give up is decided by the 'wait_policy' (see WaitPolicy.py), the time spent waiting is recorded in the
+connector's 'wait_statistics'.
+
+Passing a TestCaseCache enables caching of test cases read by this connector, including an index from external
+ID to test case ID. Repeated lookups are then answered without network calls, writes of this connector keep the
+cache up to date.
+
+To resolve many test cases, call 'prefetch_test_cases' once. It reads the whole test case catalogue of the
+configured product page by page and fills the connector's 'test_case_index', against which external IDs and names
+are resolved afterwards. The index can be saved to disk and loaded by following runs.
+
+Passing a ResultJournal records step results, defects and defect assignments on disk before they are sent, so
+that calls lost to an unavailable server or a crashed process can be uploaded later with 'replay_journal'. To
+reuse existing defects instead of creating one defect per failing test, pass a DefectRegistry.
+
+To report results of automated tests, 'get_or_create_test_step' returns the test case of an external ID and the
+first step of its Test block, creating whichever is missing.
+
+Test cases and executions are returned as dicts as sent by the REST-API. The '_model_' variants of the get-functions
+return them as TestCase and Execution instances instead, which parse lazily and need much less memory.
 """
 
 
@@ -43,31 +108,114 @@ class APIConnector:
     TEST_STEP_STATUS_PASSED: str = 'Passed'
     TEST_STEP_STATUS_FAILED: str = 'Failed'
 
+    ENDPOINT_PARAMETER_NAMES: Dict[str, str] = {
+        'tenants': 'tenantId',
+        'products': 'productId',
+        'testCases': 'testCaseId',
+        'testSteps': 'testStepId',
+        'executions': 'executionId',
+        'defects': 'defectId'
+    }
+
     __base_url: str
-    __headers: dict == {}
-    __tenant_name: str
-    __tenant_id: int = -1
-    __username: str
-    __password: str
-    __user_id: int = -1
     __product_id: str
     __session: requests.sessions
-    __persist_timeout: int = 30
+    __authenticator: Authenticator
+    __request_builder: RequestBuilder
+    __retry_policy: RetryPolicy
+    __rate_limiter: Optional[RateLimiter]
+    __circuit_breaker: Optional[CircuitBreaker]
+    __hooks: List[Callable[[Union[RequestEvent, WaitEvent]], None]]
+    __wait_policy: WaitPolicy
+    __wait_statistics: WaitStatistics
+    __test_case_cache: Optional[TestCaseCache]
+    __test_case_index: TestCaseIndex
+    __journal: Optional[ResultJournal]
+    __defect_registry: Optional[DefectRegistry]
+    __validator_cache: Optional[ValidatorCache]
+    __coalesce_requests: bool
+    __in_flight: Dict[str, Future]
+    __in_flight_lock: threading.Lock
+
+    def __init__(
+            self,
+            config_path: Union[str, dict] = '../tbcs.config.json',
+            wait_policy: Optional[WaitPolicy] = None,
+            test_case_cache: Optional[TestCaseCache] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            token_store: Optional[SessionTokenStore] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            journal: Optional[ResultJournal] = None,
+            defect_registry: Optional[DefectRegistry] = None,
+            session: Optional[requests.Session] = None,
+            authenticator: Optional[Authenticator] = None,
+            validator_cache: Optional[ValidatorCache] = None,
+            coalesce_requests: bool = True
+    ):
+        self.__wait_policy = wait_policy if wait_policy is not None else ExponentialBackoffWaitPolicy()
+        self.__wait_statistics = WaitStatistics()
+        self.__test_case_cache = test_case_cache
+        self.__test_case_index = TestCaseIndex()
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.__rate_limiter = rate_limiter
+        self.__circuit_breaker = circuit_breaker
+        self.__journal = journal
+        self.__defect_registry = defect_registry
+        self.__validator_cache = validator_cache
+        self.__coalesce_requests = coalesce_requests
+        self.__in_flight = {}
+        self.__in_flight_lock = threading.Lock()
+        self.__hooks = []
+        config_data: dict = config_path if isinstance(config_path, dict) else APIConnector.load_config(config_path)
+        self.__base_url = APIConnector.get_base_url(config_data['server_address'])
+        self.__product_id = config_data['product_id']
+        self.__session = session if session is not None else APIConnector.create_session(config_data, pool_connections, pool_maxsize)
+        self.__authenticator = authenticator if authenticator is not None else Authenticator(
+            self.__base_url,
+            config_data['tenant_name'],
+            config_data['tenant_user'],
+            config_data['password'],
+            self.__session,
+            token_store
+        )
+        self.__request_builder = RequestBuilder(self.__authenticator, self.__product_id)
 
-    def __init__(self, config_path: str = '../tbcs.config.json'):
-        with open(config_path) as config_file:
-            config_data: dict = json.load(config_file)
-            self.__base_url = f'https://{config_data["server_address"]}'
-            self.__tenant_name = config_data['tenant_name']
-            self.__product_id = config_data['product_id']
-            self.__username = config_data['tenant_user']
-            self.__password = config_data['password']
-            if not config_data['use_system_proxy']:
-                os.environ['no_proxy'] = '*'
-                os.environ['NO_PROXY'] = '*'
-
-            self.__session = requests.Session()
-            self.__session.verify = config_data['truststore_path'] if not os.name == 'nt' else True
+    @property
+    def wait_policy(self) -> WaitPolicy:
+        return self.__wait_policy
+
+    @wait_policy.setter
+    def wait_policy(self, wait_policy: WaitPolicy) -> None:
+        self.__wait_policy = wait_policy
+
+    @property
+    def wait_statistics(self) -> WaitStatistics:
+        return self.__wait_statistics
+
+    @property
+    def test_case_cache(self) -> Optional[TestCaseCache]:
+        return self.__test_case_cache
+
+    @property
+    def validator_cache(self) -> Optional[ValidatorCache]:
+        return self.__validator_cache
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self.__circuit_breaker
+
+    @property
+    def test_case_index(self) -> TestCaseIndex:
+        return self.__test_case_index
+
+    def add_hook(self, hook: Callable[[Union[RequestEvent, WaitEvent]], None]) -> None:
+        self.__hooks = self.__hooks + [hook]
+
+    def remove_hook(self, hook: Callable[[Union[RequestEvent, WaitEvent]], None]) -> None:
+        self.__hooks = [registered_hook for registered_hook in self.__hooks if registered_hook is not hook]
 
     def create_test_case(
             self,
@@ -77,43 +225,23 @@ class APIConnector:
             external_id: str,
     ) -> str:
         response_create: requests.Response = self.__send_request(
-            http_method=self.__session.post,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases',
-            expected_status_code=201,
-            data=json.dumps({'name': test_case_name, 'testCaseType': test_case_type})
+            self.__request_builder.create_test_case(test_case_name, test_case_type)
         )
 
         test_case_id: str = str(json.loads(response_create.text)['testCaseId'])
 
-        test_case_data: dict = {
-            'name': test_case_name,
-            'description': {'text': test_case_description},
-            'responsibles': [self.__user_id],
-            'customFields': [],
-            'isAutomated': True,
-            'toBeReviewed': False,
-            'externalId': {'value': external_id}
-        }
-
         self.__send_request(
-            http_method=self.__session.patch,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases/{test_case_id}',
-            expected_status_code=200,
-            data=json.dumps(test_case_data)
+            self.__request_builder.automate_test_case(test_case_id, test_case_name, test_case_description, external_id)
         )
 
-        for counter in range(self.__persist_timeout):
-            try:
-                written_data: dict = self.get_test_case_by_id(test_case_id)
-                if written_data['automation']['externalId'] == external_id:
-                    break
-                elif counter == self.__persist_timeout:
-                    raise APIError('Persistence of test case data not achieved before timeout.')
-                time.sleep(1)
-            except APIError as error:
-                if counter == self.__persist_timeout:
-                    raise error
-                time.sleep(1)
+        self.__wait_for_persistence(
+            'create_test_case',
+            lambda: self.__request_test_case(test_case_id)['automation']['externalId'] == external_id,
+            'Persistence of test case data not achieved before timeout.'
+        )
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put_test_case_id(external_id, test_case_id)
+        self.__test_case_index.add(test_case_id, test_case_name, external_id)
 
         return test_case_id
 
@@ -127,12 +255,29 @@ class APIConnector:
                 'text': new_description
             }
         }
-        self.__send_request(
-            http_method=self.__session.patch,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases/{test_case_id}',
-            expected_status_code=200,
-            data=json.dumps(test_case_data)
-        )
+        self.__send_request(self.__request_builder.update_test_case(test_case_id, test_case_data))
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.patch(test_case_id, {'description': new_description})
+
+    def update_test_case(
+            self,
+            test_case_id: str,
+            new_name: Optional[str] = None,
+            new_description: Optional[str] = None
+    ) -> None:
+        test_case_data: dict = {}
+        if new_name is not None:
+            test_case_data['name'] = new_name
+        if new_description is not None:
+            test_case_data['description'] = {'text': new_description}
+        if len(test_case_data) == 0:
+            return
+
+        self.__send_request(self.__request_builder.update_test_case(test_case_id, test_case_data))
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.patch(test_case_id, dict(test_case_data, description=new_description) if new_description is not None else test_case_data)
+        if new_name is not None:
+            self.__test_case_index.add(test_case_id, new_name)
 
     def add_test_step(
             self,
@@ -141,37 +286,19 @@ class APIConnector:
             previous_test_step_id: str = '-1',
             test_block_name: str = TEST_BLOCK_TEST_NAME
     ) -> str:
-        test_step_data: dict = {
-            'testStepBlock': test_block_name,
-            'description': new_test_step
-        }
-        if not previous_test_step_id == '-1':
-            test_step_data['position'] = {
-                'relation': 'After',
-                'testStepId': previous_test_step_id
-            }
-
+        block_index: int = APIConnector.get_test_block_index_by_name(test_block_name)
         response_create: requests.Response = self.__send_request(
-            http_method=self.__session.post,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases/{test_case_id}/testSteps',
-            expected_status_code=201,
-            data=json.dumps(test_step_data)
+            self.__request_builder.add_test_step(test_case_id, new_test_step, test_block_name, previous_test_step_id)
         )
 
         new_test_step_id: str = str(json.loads(response_create.text)['testStepId'])
 
-        for counter in range(self.__persist_timeout):
-            written_data: dict = self.get_test_case_by_id(test_case_id)
-            write_completed: bool = False
-            for test_step in written_data['testSequence']['testStepBlocks'][APIConnector.get_test_block_index_by_name(test_block_name)]['steps']:
-                if str(test_step['id']) == new_test_step_id:
-                    write_completed = True
-                    break
-            if write_completed:
-                break
-            elif counter == self.__persist_timeout:
-                raise APIError('Persistence of test step not achieved before timeout.')
-            time.sleep(1)
+        self.__invalidate_test_case(test_case_id)
+        self.__wait_for_persistence(
+            'add_test_step',
+            lambda: new_test_step_id in self.__get_test_step_ids(test_case_id, block_index),
+            'Persistence of test step not achieved before timeout.'
+        )
 
         return new_test_step_id
 
@@ -181,91 +308,268 @@ class APIConnector:
             test_step_id: str,
             test_block_name: str = TEST_BLOCK_TEST_NAME,
     ) -> None:
-        self.__send_request(
-            http_method=self.__session.delete,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases/{test_case_id}/testSteps/{test_step_id}',
-            expected_status_code=200
+        block_index: int = APIConnector.get_test_block_index_by_name(test_block_name)
+        self.__send_request(self.__request_builder.remove_test_step(test_case_id, test_step_id))
+
+        self.__invalidate_test_case(test_case_id)
+        self.__wait_for_persistence(
+            'remove_test_step',
+            lambda: test_step_id not in self.__get_test_step_ids(test_case_id, block_index),
+            'Persistence of test step not achieved before timeout.'
         )
 
-        for counter in range(self.__persist_timeout):
-            written_data: dict = self.get_test_case_by_id(test_case_id)
-            write_completed: bool = True
-            for test_step in written_data['testSequence']['testStepBlocks'][APIConnector.get_test_block_index_by_name(test_block_name)]['steps']:
-                if str(test_step['id']) == test_step_id:
-                    write_completed = False
-                    break
-            if write_completed:
-                break
-            elif counter == self.__persist_timeout:
-                raise APIError('Persistence of test step not achieved before timeout.')
-            time.sleep(1)
+    def add_test_steps(
+            self,
+            test_case_id: str,
+            new_test_steps: List[str],
+            test_block_name: str = TEST_BLOCK_TEST_NAME,
+            previous_test_step_id: str = '-1'
+    ) -> List[str]:
+        APIConnector.get_test_block_index_by_name(test_block_name)
+        new_test_step_ids: List[str] = []
+        for new_test_step in new_test_steps:
+            response_create: requests.Response = self.__send_request(
+                self.__request_builder.add_test_step(test_case_id, new_test_step, test_block_name, previous_test_step_id)
+            )
+            previous_test_step_id = str(json.loads(response_create.text)['testStepId'])
+            new_test_step_ids.append(previous_test_step_id)
+
+        self.__invalidate_test_case(test_case_id)
+        self.__wait_for_persistence(
+            'add_test_steps',
+            lambda: self.__get_all_test_step_ids(test_case_id).issuperset(new_test_step_ids),
+            'Persistence of test steps not achieved before timeout.'
+        )
+
+        return new_test_step_ids
+
+    def remove_test_steps(
+            self,
+            test_case_id: str,
+            test_step_ids: List[str],
+            max_workers: int = 8
+    ) -> None:
+        def remove(test_step_id: str) -> None:
+            self.__send_request(self.__request_builder.remove_test_step(test_case_id, test_step_id))
+
+        if len(test_step_ids) > 0:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(test_step_ids)), thread_name_prefix='tbcs-steps') as executor:
+                list(executor.map(remove, test_step_ids))
+
+        self.__invalidate_test_case(test_case_id)
+        self.__wait_for_persistence(
+            'remove_test_steps',
+            lambda: self.__get_all_test_step_ids(test_case_id).isdisjoint(test_step_ids),
+            'Persistence of test steps not achieved before timeout.'
+        )
 
     def get_test_case_by_external_id(
             self,
             external_id: str
     ) -> dict:
-        search_filter: str = f'fieldValue=externalId:equals:{external_id}'
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.get,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases?{search_filter}',
-            expected_status_code=200
-        )
+        return self.__get_test_case_by_external_id(external_id, self.get_test_case_by_id)
 
-        tests: List[dict] = json.loads(response.text)
+    def get_test_case_model_by_external_id(
+            self,
+            external_id: str
+    ) -> TestCase:
+        return self.__get_test_case_by_external_id(external_id, self.get_test_case_model_by_id)
 
-        if len(tests) == 0:
-            raise ItemNotFoundError(f'No test case found with external ID: {external_id}')
+    def get_test_case_by_name(
+            self,
+            name: str
+    ) -> dict:
+        test_case_id: Optional[str] = self.__test_case_index.get_test_case_id_by_name(name)
+
+        if test_case_id is None:
+            raise ItemNotFoundError(f'No test case found with name: {name}')
 
-        return self.get_test_case_by_id(str(tests[0]["id"]))
+        return self.get_test_case_by_id(test_case_id)
+
+    def prefetch_test_cases(
+            self,
+            page_size: int = 500
+    ) -> Iterator[dict]:
+        started: float = time.time()
+        listed_test_case_ids: Set[str] = set()
+        offset: int = 0
+        while True:
+            response: requests.Response = self.__send_request(self.__request_builder.get_test_cases(offset, page_size))
+            page: List[dict] = json.loads(response.text)
+            new_test_cases: List[dict] = [test_case for test_case in page if str(test_case['id']) not in listed_test_case_ids]
+
+            for test_case in new_test_cases:
+                test_case_id: str = str(test_case['id'])
+                listed_test_case_ids.add(test_case_id)
+                self.__test_case_index.add(
+                    test_case_id,
+                    test_case.get('name'),
+                    test_case.get('externalId', test_case.get('automation', {}).get('externalId'))
+                )
+                yield test_case
+
+            if len(page) < page_size or len(new_test_cases) == 0:
+                break
+            offset += len(page)
+
+        self.__test_case_index.timestamp = started
+
+    def save_test_case_index(
+            self,
+            snapshot_path: str
+    ) -> None:
+        self.__test_case_index.save(snapshot_path, self.__base_url, self.__product_id)
+
+    def load_test_case_index(
+            self,
+            snapshot_path: str,
+            max_age: Optional[float] = None
+    ) -> bool:
+        return self.__test_case_index.load(snapshot_path, self.__base_url, self.__product_id, max_age)
 
     def get_test_case_by_id(
             self,
             test_case_id: str
     ) -> dict:
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.get,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/specifications/testCases/{test_case_id}',
-            expected_status_code=200
-        )
+        if self.__test_case_cache is not None:
+            test_case: Optional[dict] = self.__test_case_cache.get(test_case_id)
+            if test_case is not None:
+                return test_case
 
-        return json.loads(response.text)
+        return self.__request_test_case(test_case_id)
+
+    def get_test_case_model_by_id(
+            self,
+            test_case_id: str
+    ) -> TestCase:
+        if self.__test_case_cache is not None:
+            document: Optional[str] = self.__test_case_cache.get_document(test_case_id)
+            if document is not None:
+                return TestCase(document)
+
+        return TestCase(self.__request_test_case_document(test_case_id))
+
+    def get_or_create_test_step(
+            self,
+            external_id: str,
+            test_case_name: str,
+            test_case_description: str = ''
+    ) -> Tuple[str, str, bool]:
+        try:
+            test_case: Optional[TestCase] = self.get_test_case_model_by_external_id(external_id)
+        except ItemNotFoundError:
+            test_case = None
+
+        if test_case is None:
+            test_case_id: str = self.create_test_case(
+                test_case_name,
+                test_case_description,
+                APIConnector.TEST_CASE_TYPE_STRUCTURED,
+                external_id
+            )
+            return test_case_id, self.add_test_step(test_case_id, test_case_name), True
+
+        if APIConnector.TEST_BLOCK_TEST_NAME not in test_case.block_names:
+            raise APIError(f'Test case {test_case.id} with external ID {external_id} has no {APIConnector.TEST_BLOCK_TEST_NAME} block.')
+        test_steps: Tuple[TestStep, ...] = test_case.get_test_steps(APIConnector.TEST_BLOCK_TEST_NAME)
+        if len(test_steps) > 0:
+            return test_case.id, test_steps[0].id, False
+        return test_case.id, self.add_test_step(test_case.id, test_case_name), False
 
     def start_execution(
             self,
             test_case_id: str
     ) -> str:
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.post,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/executions/testCases/{test_case_id}',
-            expected_status_code=201
-        )
+        response: requests.Response = self.__send_request(self.__request_builder.start_execution(test_case_id))
 
         execution_id: str = str(json.loads(response.text)['executionId'])
 
-        for counter in range(self.__persist_timeout):
-            try:
-                self.get_execution_by_id(test_case_id, execution_id)
-                break
-            except APIError:
-                if counter == self.__persist_timeout:
-                    raise APIError('Persistence of execution not achieved before timeout.')
-                time.sleep(1)
+        self.__wait_for_persistence(
+            'start_execution',
+            lambda: self.get_execution_by_id(test_case_id, execution_id) is not None,
+            'Persistence of execution not achieved before timeout.'
+        )
 
         return execution_id
 
+    def start_executions(
+            self,
+            test_case_ids: List[str],
+            max_workers: int = 8
+    ) -> List[str]:
+        def start(test_case_id: str) -> str:
+            response: requests.Response = self.__send_request(self.__request_builder.start_execution(test_case_id))
+            return str(json.loads(response.text)['executionId'])
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tbcs-executions') as executor:
+            execution_ids: List[str] = list(executor.map(start, test_case_ids))
+            unverified: Dict[str, str] = dict(zip(execution_ids, test_case_ids))
+
+            def is_persisted() -> bool:
+                verified: List[bool] = list(executor.map(
+                    lambda execution_id: self.__is_execution_persisted(unverified[execution_id], execution_id),
+                    list(unverified)
+                ))
+                for execution_id, execution_verified in zip(list(unverified), verified):
+                    if execution_verified:
+                        del unverified[execution_id]
+                return len(unverified) == 0
+
+            self.__wait_for_persistence(
+                'start_executions',
+                is_persisted,
+                'Persistence of executions not achieved before timeout.'
+            )
+
+        return execution_ids
+
+    def report_execution(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            step_results: Dict[str, str],
+            max_workers: int = 8
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tbcs-results') as executor:
+            list(executor.map(
+                lambda step_result: self.report_step_result(test_case_id, execution_id, step_result[0], step_result[1]),
+                step_results.items()
+            ))
+
+        if self.__journal is not None and self.__journal.deferred:
+            return
+
+        def is_persisted() -> bool:
+            execution: Execution = self.get_execution_model_by_id(test_case_id, execution_id)
+            return all(
+                execution.get_step_result(test_step_id).result == result
+                for test_step_id, result in step_results.items()
+            )
+
+        self.__wait_for_persistence(
+            'report_execution',
+            is_persisted,
+            'Persistence of step results not achieved before timeout.'
+        )
+
     def get_execution_by_id(
             self,
             test_case_id: str,
             execution_id: str
     ) -> dict:
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.get,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/executions/testCases/{test_case_id}/executions/{execution_id}',
-            expected_status_code=200
-        )
+        response: requests.Response = self.__send_request(self.__request_builder.get_execution(test_case_id, execution_id))
 
         return json.loads(response.text)
 
+    def get_execution_model_by_id(
+            self,
+            test_case_id: str,
+            execution_id: str
+    ) -> Execution:
+        response: requests.Response = self.__send_request(self.__request_builder.get_execution(test_case_id, execution_id))
+
+        return Execution(response.text)
+
     def report_step_result(
             self,
             test_case_id: str,
@@ -273,31 +577,38 @@ class APIConnector:
             test_step_id: str,
             result: str
     ) -> None:
-        self.__send_request(
-            http_method=self.__session.put,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/executions/testCases/{test_case_id}/executions/{execution_id}/testSteps/{test_step_id}/result',
-            expected_status_code=200,
-            data=f'"{result}"'
-        )
+        self.__write_journaled('report_step_result', [test_case_id, execution_id, test_step_id, result])
 
     def create_defect(
             self,
             name: str,
             message: str
     ) -> str:
-        defect_data: dict = {
-            "name": f'{name}',
-            "description": f'{message}'
-        }
-
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.post,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/defects',
-            expected_status_code=201,
-            data=json.dumps(defect_data)
+        if self.__defect_registry is None:
+            return self.__write_journaled('create_defect', [name, message])
+
+        return self.__defect_registry.get_defect_id(
+            name,
+            message,
+            self.get_defects,
+            lambda: self.__write_journaled('create_defect', [name, message])
         )
 
-        return str(json.loads(response.text)['defectId'])
+    def get_defects(
+            self,
+            page_size: int = 500
+    ) -> List[dict]:
+        defects: List[dict] = []
+        listed_defect_ids: Set[str] = set()
+        while True:
+            response: requests.Response = self.__send_request(self.__request_builder.get_defects(len(defects), page_size))
+            page: List[dict] = json.loads(response.text)
+            new_defects: List[dict] = [defect for defect in page if str(defect['id']) not in listed_defect_ids]
+            listed_defect_ids.update(str(defect['id']) for defect in new_defects)
+            defects += new_defects
+
+            if len(page) < page_size or len(new_defects) == 0:
+                return defects
 
     def assign_defect(
             self,
@@ -306,64 +617,330 @@ class APIConnector:
             test_step_id: str,
             defect_id: str
     ) -> None:
-        self.__send_request(
-            http_method=self.__session.post,
-            endpoint=f'/api/tenants/{self.__tenant_id}/products/{self.__product_id}/executions/testCases/{test_case_id}/executions/{execution_id}/testSteps/{test_step_id}/defects',
-            expected_status_code=201,
-            data=f'"{defect_id}"'
-        )
+        self.__write_journaled('assign_defect', [test_case_id, execution_id, test_step_id, defect_id])
+
+    def replay_journal(
+            self,
+            max_workers: int = 8
+    ) -> Dict[str, int]:
+        if self.__journal is None:
+            raise APIError('No journal has been configured for this connector.')
+
+        entries: List[JournalEntry] = self.__journal.get_pending_entries()
+        lanes: Dict[str, List[JournalEntry]] = {}
+        for entry in entries:
+            if not entry.operation == 'create_defect':
+                lanes.setdefault(entry.arguments[1], []).append(entry)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tbcs-replay') as executor:
+            replayed: List[bool] = list(executor.map(
+                self.__replay_journal_entry,
+                [entry for entry in entries if entry.operation == 'create_defect']
+            ))
+            for lane_replayed in executor.map(lambda lane: [self.__replay_journal_entry(entry) for entry in lane], lanes.values()):
+                replayed += lane_replayed
+
+        self.__journal.flush()
+        return {
+            'replayed': replayed.count(True),
+            'failed': replayed.count(False),
+            'pending': len(self.__journal.get_pending_entries())
+        }
+
+    def __write_journaled(
+            self,
+            operation: str,
+            arguments: List[str]
+    ) -> Optional[str]:
+        if self.__journal is None:
+            return self.__send_journaled_call(operation, arguments)
+
+        sequence: int = self.__journal.append(operation, arguments)
+        if self.__journal.deferred:
+            return ResultJournal.get_reference(sequence) if operation == 'create_defect' else None
+
+        result: Optional[str] = self.__send_journaled_call(operation, arguments)
+        self.__journal.mark_done(sequence, result)
+        return result
+
+    def __replay_journal_entry(
+            self,
+            entry: JournalEntry
+    ) -> bool:
+        try:
+            self.__journal.mark_done(entry.sequence, self.__send_journaled_call(entry.operation, entry.arguments))
+            return True
+        except Exception as error:
+            warnings.warn(f'Replay of journal entry {entry.sequence} ({entry.operation}) failed: {error}')
+            return False
+
+    def __send_journaled_call(
+            self,
+            operation: str,
+            arguments: List[str]
+    ) -> Optional[str]:
+        if operation == 'assign_defect':
+            defect_id: Optional[str] = self.__journal.resolve_defect_id(arguments[3]) if self.__journal is not None else arguments[3]
+            if defect_id is None:
+                raise APIError(f'Defect {arguments[3]} has not been created yet.')
+            arguments = arguments[:3] + [defect_id]
+
+        response: requests.Response = self.__send_request(self.__request_builder.journaled_call(operation, arguments))
+        return str(json.loads(response.text)['defectId']) if operation == 'create_defect' else None
+
+    def __request_test_case(
+            self,
+            test_case_id: str
+    ) -> dict:
+        return json.loads(self.__request_test_case_document(test_case_id))
+
+    def __request_test_case_document(
+            self,
+            test_case_id: str
+    ) -> str:
+        generation: Optional[int] = self.__test_case_cache.get_generation(test_case_id) if self.__test_case_cache is not None else None
+        response: requests.Response = self.__send_request(self.__request_builder.get_test_case(test_case_id))
+
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put(test_case_id, response.text, generation)
+
+        return response.text
+
+    def __get_test_case_by_external_id(
+            self,
+            external_id: str,
+            get_test_case_by_id: Callable[[str], Union[dict, TestCase]]
+    ) -> Union[dict, TestCase]:
+        known_test_case_id: Optional[str] = self.__get_known_test_case_id(external_id)
+        if known_test_case_id is not None:
+            try:
+                known_test_case: Union[dict, TestCase] = get_test_case_by_id(known_test_case_id)
+                if APIConnector.get_external_id(known_test_case) == external_id:
+                    return known_test_case
+            except APIError:
+                pass
+            self.__forget_test_case(known_test_case_id)
+            if self.__test_case_cache is not None:
+                self.__test_case_cache.invalidate_test_case_id(external_id)
+
+        response: requests.Response = self.__send_request(self.__request_builder.find_test_cases(external_id))
+
+        tests: List[dict] = json.loads(response.text)
+
+        if len(tests) == 0:
+            raise ItemNotFoundError(f'No test case found with external ID: {external_id}')
+
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put_test_case_id(external_id, str(tests[0]["id"]))
+
+        return get_test_case_by_id(str(tests[0]["id"]))
+
+    def __get_known_test_case_id(
+            self,
+            external_id: str
+    ) -> Optional[str]:
+        if self.__test_case_cache is not None:
+            cached_test_case_id: Optional[str] = self.__test_case_cache.get_test_case_id(external_id)
+            if cached_test_case_id is not None:
+                return cached_test_case_id
+        return self.__test_case_index.get_test_case_id_by_external_id(external_id)
+
+    def __forget_test_case(
+            self,
+            test_case_id: str
+    ) -> None:
+        self.__invalidate_test_case(test_case_id)
+        self.__test_case_index.remove(test_case_id)
+
+    def __invalidate_test_case(
+            self,
+            test_case_id: str
+    ) -> None:
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.invalidate(test_case_id)
+
+    def __get_test_step_ids(
+            self,
+            test_case_id: str,
+            block_index: int
+    ) -> List[str]:
+        written_data: dict = self.__request_test_case(test_case_id)
+        return [str(test_step['id']) for test_step in written_data['testSequence']['testStepBlocks'][block_index]['steps']]
+
+    def __get_all_test_step_ids(
+            self,
+            test_case_id: str
+    ) -> Set[str]:
+        written_data: dict = self.__request_test_case(test_case_id)
+        return {
+            str(test_step['id'])
+            for test_step_block in written_data['testSequence']['testStepBlocks']
+            for test_step in test_step_block['steps']
+        }
+
+    def __is_execution_persisted(
+            self,
+            test_case_id: str,
+            execution_id: str
+    ) -> bool:
+        try:
+            return self.get_execution_by_id(test_case_id, execution_id) is not None
+        except APIError:
+            return False
+
+    def __wait_for_persistence(
+            self,
+            operation: str,
+            is_persisted: Callable[[], bool],
+            timeout_message: str
+    ) -> None:
+        if not self.__wait_policy.verify:
+            return
+
+        start: float = time.monotonic()
+        checks: int = 0
+        sleep_time: float = 0.0
+        for delay in self.__wait_policy.delays():
+            time.sleep(delay)
+            sleep_time += delay
+            checks += 1
+            try:
+                if is_persisted():
+                    self.__record_wait(operation, time.monotonic() - start, checks, sleep_time, True)
+                    return
+            except APIError:
+                pass
+
+        self.__record_wait(operation, time.monotonic() - start, checks, sleep_time, False)
+        raise APIError(timeout_message)
+
+    def __record_wait(
+            self,
+            operation: str,
+            duration: float,
+            checks: int,
+            sleep_time: float,
+            persisted: bool
+    ) -> None:
+        self.__wait_statistics.record(operation, duration, checks, persisted)
+        self.__emit(WaitEvent(operation, duration, checks, sleep_time, persisted))
+
+    def __emit(self, event: Union[RequestEvent, WaitEvent]) -> None:
+        for hook in self.__hooks:
+            try:
+                hook(event)
+            except Exception as error:
+                warnings.warn(f'Instrumentation hook {hook!r} failed: {error!r}')
 
     def __send_request(
             self,
-            http_method: requests.api,
-            endpoint: str,
-            expected_status_code: int,
-            data: str = ''
+            request: Request
     ) -> requests.Response:
-        response: requests.Response = http_method(
-            url=f'{self.__base_url}{endpoint}',
-            data=data,
-            headers=self.__headers
-        )
-
-        if response.status_code == 401:
-            if endpoint == '/api/tenants/login/session':
-                raise Exception('Unable to authenticate', response)
-            else:
-                self.log_in()
-                return self.__send_request(http_method, endpoint, expected_status_code, data)
-        elif response.status_code == expected_status_code:
+        if not self.__coalesce_requests or not request.method == 'GET':
+            return self.__perform_request(request)
+
+        in_flight_request: Future = Future()
+        with self.__in_flight_lock:
+            in_flight: Optional[Future] = self.__in_flight.setdefault(request.endpoint, in_flight_request)
+        if in_flight is not in_flight_request:
+            return in_flight.result()
+
+        try:
+            response: requests.Response = self.__perform_request(request)
+            in_flight_request.set_result(response)
             return response
-        else:
-            raise APIError(f'{endpoint} failed with message {response.text}')
+        except BaseException as error:
+            in_flight_request.set_exception(error)
+            raise
+        finally:
+            with self.__in_flight_lock:
+                del self.__in_flight[request.endpoint]
+
+    def __perform_request(
+            self,
+            request: Request
+    ) -> requests.Response:
+        attempts: RequestAttempts = RequestAttempts(request, self.__retry_policy, self.__circuit_breaker)
+        try:
+            while True:
+                if self.__rate_limiter is not None:
+                    attempts.record_sleep(self.__rate_limiter.acquire())
+
+                login_generation, headers = self.__authenticator.get_headers()
+                validated_response: Optional[requests.Response] = None
+                if request.method == 'GET' and self.__validator_cache is not None:
+                    validated_response = self.__validator_cache.get(request.endpoint)
+                    if validated_response is not None:
+                        headers = dict(headers, **ValidatorCache.get_conditional_headers(validated_response))
+                attempts.before_send()
+                try:
+                    response: requests.Response = self.__session.request(
+                        request.method,
+                        f'{self.__base_url}{request.endpoint}',
+                        data=request.data,
+                        headers=headers
+                    )
+                except BaseException as error:
+                    error_delay: Optional[float] = attempts.on_error(error)
+                    if error_delay is None:
+                        raise
+                    time.sleep(error_delay)
+                    continue
+
+                action, delay = attempts.on_response(response, validated_response is not None)
+                if action == RequestAttempts.ACTION_DONE:
+                    if not response.status_code == request.expected_status_code:
+                        self.__validator_cache.record_revalidation(request.endpoint)
+                        return validated_response
+                    if request.method == 'GET' and self.__validator_cache is not None:
+                        self.__validator_cache.put(request.endpoint, response)
+                    return response
+                elif action == RequestAttempts.ACTION_REAUTHENTICATE:
+                    self.__authenticator.log_in(login_generation)
+                else:
+                    time.sleep(delay)
+        finally:
+            if len(self.__hooks) > 0:
+                self.__emit(attempts.get_event(APIConnector.get_endpoint_template(request.endpoint)))
 
     def log_in(self) -> None:
-        self.__headers: dict = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'Charset': 'UTF-8'
-        }
-        auth_data: dict = {
-            'force': True,
-            'tenantName': self.__tenant_name,
-            'login': self.__username,
-            'password': self.__password
-        }
-        response: requests.Response = self.__send_request(
-            http_method=self.__session.post,
-            endpoint='/api/tenants/login/session',
-            expected_status_code=201,
-            data=json.dumps(auth_data)
-        )
-        response_data: dict = json.loads(response.text)
-        self.__headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'Charset': 'UTF-8',
-            'Authorization': f'Bearer {response_data["sessionToken"]}'
-        }
-        self.__tenant_id = response_data['tenantId']
-        self.__user_id = response_data['userId']
+        self.__authenticator.log_in(0)
+
+    @staticmethod
+    def load_config(config_path: str) -> dict:
+        with open(config_path) as config_file:
+            return json.load(config_file)
+
+    @staticmethod
+    def get_base_url(server_address: str) -> str:
+        return server_address if server_address.startswith(('http://', 'https://')) else f'https://{server_address}'
+
+    @staticmethod
+    def create_session(config_data: dict, pool_connections: int = 10, pool_maxsize: int = 10) -> requests.Session:
+        if not config_data['use_system_proxy']:
+            os.environ['no_proxy'] = '*'
+            os.environ['NO_PROXY'] = '*'
+
+        session: requests.Session = requests.Session()
+        session.verify = config_data['truststore_path'] if not os.name == 'nt' else True
+        http_adapter: KeepAliveHTTPAdapter = KeepAliveHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('https://', http_adapter)
+        session.mount('http://', http_adapter)
+        return session
+
+    @staticmethod
+    def get_external_id(test_case: Union[dict, TestCase]) -> str:
+        if isinstance(test_case, TestCase):
+            return test_case.external_id
+        return (test_case.get('automation') or {}).get('externalId') or ''
+
+    @staticmethod
+    def get_endpoint_template(endpoint: str) -> str:
+        segments: List[str] = endpoint.split('?', 1)[0].split('/')
+        for index in range(1, len(segments)):
+            if segments[index].lstrip('-').isdigit():
+                segments[index] = f'{{{APIConnector.ENDPOINT_PARAMETER_NAMES.get(segments[index - 1], "id")}}}'
+        return '/'.join(segments)
 
     @staticmethod
     def get_test_block_index_by_name(name: str) -> int:
@@ -0,0 +1,623 @@
+import asyncio
+import functools
+import json
+import time
+import warnings
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import requests
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.APIError import APIError
+from tbcs_client.Authenticator import Authenticator
+from tbcs_client.CircuitBreaker import CircuitBreaker
+from tbcs_client.DefectRegistry import DefectRegistry
+from tbcs_client.Execution import Execution
+from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.RateLimiter import RateLimiter
+from tbcs_client.RequestAttempts import RequestAttempts
+from tbcs_client.RequestBuilder import Request, RequestBuilder
+from tbcs_client.ResultJournal import ResultJournal
+from tbcs_client.RetryPolicy import RetryPolicy
+from tbcs_client.SessionTokenStore import SessionTokenStore
+from tbcs_client.TestCaseCache import TestCaseCache
+from tbcs_client.TimingEvent import RequestEvent, WaitEvent
+from tbcs_client.WaitPolicy import WaitPolicy, ExponentialBackoffWaitPolicy
+from tbcs_client.WaitStatistics import WaitStatistics
+
+""" Class for connecting to a TestBench CS REST-API from asyncio code
+
+The AsyncAPIConnector class offers the same calls as the APIConnector class as coroutines, so that many requests
+against the TestBench CS REST-API can be in flight at the same time. It is initialized from the same
+JSON-configuration file or dict. The number of concurrently running requests is bounded by 'concurrency_limit', all
+requests share a single HTTP connection pool and a single login. Waiting for written data to be persisted follows
+the 'wait_policy' as for the APIConnector, but is done with non-blocking awaits, so a pending verification never
+holds up other calls.
+
+Requests are built by the same RequestBuilder and retried by the same RequestAttempts as those of the APIConnector,
+logins are done by an Authenticator, so retries, rate limiting, the circuit breaker, instrumentation hooks and a
+shared 'token_store', 'session' or 'authenticator' work as for the APIConnector. A TestCaseCache, ResultJournal and
+DefectRegistry can be passed as well; journals are replayed with APIConnector.replay_journal.
+
+Requests are executed on a thread pool owned by this class, call 'close' (or use the instance as an async context
+manager) once you are done with it.
+"""
+
+
+class AsyncAPIConnector:
+    __base_url: str
+    __session: requests.Session
+    __authenticator: Authenticator
+    __request_builder: RequestBuilder
+    __wait_policy: WaitPolicy
+    __wait_statistics: WaitStatistics
+    __retry_policy: RetryPolicy
+    __rate_limiter: Optional[RateLimiter]
+    __circuit_breaker: Optional[CircuitBreaker]
+    __test_case_cache: Optional[TestCaseCache]
+    __journal: Optional[ResultJournal]
+    __defect_registry: Optional[DefectRegistry]
+    __hooks: List[Callable[[Union[RequestEvent, WaitEvent]], None]]
+    __concurrency_limit: int
+    __executor: ThreadPoolExecutor
+    __semaphore: Optional[asyncio.Semaphore] = None
+
+    def __init__(
+            self,
+            config_path: Union[str, dict] = '../tbcs.config.json',
+            concurrency_limit: int = 32,
+            wait_policy: Optional[WaitPolicy] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            token_store: Optional[SessionTokenStore] = None,
+            session: Optional[requests.Session] = None,
+            authenticator: Optional[Authenticator] = None,
+            test_case_cache: Optional[TestCaseCache] = None,
+            journal: Optional[ResultJournal] = None,
+            defect_registry: Optional[DefectRegistry] = None
+    ):
+        self.__wait_policy = wait_policy if wait_policy is not None else ExponentialBackoffWaitPolicy()
+        self.__wait_statistics = WaitStatistics()
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.__rate_limiter = rate_limiter
+        self.__circuit_breaker = circuit_breaker
+        self.__test_case_cache = test_case_cache
+        self.__journal = journal
+        self.__defect_registry = defect_registry
+        self.__hooks = []
+        self.__concurrency_limit = concurrency_limit
+        config_data: dict = config_path if isinstance(config_path, dict) else APIConnector.load_config(config_path)
+        self.__base_url = APIConnector.get_base_url(config_data['server_address'])
+        self.__session = session if session is not None else APIConnector.create_session(config_data, pool_maxsize=concurrency_limit)
+        self.__authenticator = authenticator if authenticator is not None else Authenticator(
+            self.__base_url,
+            config_data['tenant_name'],
+            config_data['tenant_user'],
+            config_data['password'],
+            self.__session,
+            token_store
+        )
+        self.__request_builder = RequestBuilder(self.__authenticator, config_data['product_id'])
+        self.__executor = ThreadPoolExecutor(max_workers=concurrency_limit)
+
+    @property
+    def wait_policy(self) -> WaitPolicy:
+        return self.__wait_policy
+
+    @wait_policy.setter
+    def wait_policy(self, wait_policy: WaitPolicy) -> None:
+        self.__wait_policy = wait_policy
+
+    @property
+    def wait_statistics(self) -> WaitStatistics:
+        return self.__wait_statistics
+
+    @property
+    def test_case_cache(self) -> Optional[TestCaseCache]:
+        return self.__test_case_cache
+
+    def add_hook(self, hook: Callable[[Union[RequestEvent, WaitEvent]], None]) -> None:
+        self.__hooks = self.__hooks + [hook]
+
+    def remove_hook(self, hook: Callable[[Union[RequestEvent, WaitEvent]], None]) -> None:
+        self.__hooks = [registered_hook for registered_hook in self.__hooks if registered_hook is not hook]
+
+    async def __aenter__(self) -> 'AsyncAPIConnector':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.__close)
+
+    async def create_test_case(
+            self,
+            test_case_name: str,
+            test_case_description: str,
+            test_case_type: str,
+            external_id: str,
+    ) -> str:
+        response_create: requests.Response = await self.__send_request(
+            self.__request_builder.create_test_case(test_case_name, test_case_type)
+        )
+
+        test_case_id: str = str(json.loads(response_create.text)['testCaseId'])
+
+        await self.__send_request(
+            self.__request_builder.automate_test_case(test_case_id, test_case_name, test_case_description, external_id)
+        )
+
+        async def is_persisted() -> bool:
+            return json.loads(await self.__request_test_case_document(test_case_id))['automation']['externalId'] == external_id
+
+        await self.__wait_for_persistence(
+            'create_test_case',
+            is_persisted,
+            'Persistence of test case data not achieved before timeout.'
+        )
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put_test_case_id(external_id, test_case_id)
+
+        return test_case_id
+
+    async def update_test_case_description(
+            self,
+            test_case_id: str,
+            new_description: str
+    ) -> None:
+        test_case_data: dict = {
+            'description': {
+                'text': new_description
+            }
+        }
+        await self.__send_request(self.__request_builder.update_test_case(test_case_id, test_case_data))
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.patch(test_case_id, {'description': new_description})
+
+    async def add_test_step(
+            self,
+            test_case_id: str,
+            new_test_step: str,
+            previous_test_step_id: str = '-1',
+            test_block_name: str = APIConnector.TEST_BLOCK_TEST_NAME
+    ) -> str:
+        block_index: int = APIConnector.get_test_block_index_by_name(test_block_name)
+        response_create: requests.Response = await self.__send_request(
+            self.__request_builder.add_test_step(test_case_id, new_test_step, test_block_name, previous_test_step_id)
+        )
+
+        new_test_step_id: str = str(json.loads(response_create.text)['testStepId'])
+
+        self.__invalidate_test_case(test_case_id)
+
+        async def is_persisted() -> bool:
+            return new_test_step_id in await self.__get_test_step_ids(test_case_id, block_index)
+
+        await self.__wait_for_persistence(
+            'add_test_step',
+            is_persisted,
+            'Persistence of test step not achieved before timeout.'
+        )
+
+        return new_test_step_id
+
+    async def remove_test_step(
+            self,
+            test_case_id: str,
+            test_step_id: str,
+            test_block_name: str = APIConnector.TEST_BLOCK_TEST_NAME,
+    ) -> None:
+        block_index: int = APIConnector.get_test_block_index_by_name(test_block_name)
+        await self.__send_request(self.__request_builder.remove_test_step(test_case_id, test_step_id))
+
+        self.__invalidate_test_case(test_case_id)
+
+        async def is_persisted() -> bool:
+            return test_step_id not in await self.__get_test_step_ids(test_case_id, block_index)
+
+        await self.__wait_for_persistence(
+            'remove_test_step',
+            is_persisted,
+            'Persistence of test step not achieved before timeout.'
+        )
+
+    async def add_test_steps(
+            self,
+            test_case_id: str,
+            new_test_steps: List[str],
+            test_block_name: str = APIConnector.TEST_BLOCK_TEST_NAME,
+            previous_test_step_id: str = '-1'
+    ) -> List[str]:
+        APIConnector.get_test_block_index_by_name(test_block_name)
+        new_test_step_ids: List[str] = []
+        for new_test_step in new_test_steps:
+            response_create: requests.Response = await self.__send_request(
+                self.__request_builder.add_test_step(test_case_id, new_test_step, test_block_name, previous_test_step_id)
+            )
+            previous_test_step_id = str(json.loads(response_create.text)['testStepId'])
+            new_test_step_ids.append(previous_test_step_id)
+
+        self.__invalidate_test_case(test_case_id)
+
+        async def is_persisted() -> bool:
+            return (await self.__get_all_test_step_ids(test_case_id)).issuperset(new_test_step_ids)
+
+        await self.__wait_for_persistence(
+            'add_test_steps',
+            is_persisted,
+            'Persistence of test steps not achieved before timeout.'
+        )
+
+        return new_test_step_ids
+
+    async def remove_test_steps(
+            self,
+            test_case_id: str,
+            test_step_ids: List[str]
+    ) -> None:
+        await asyncio.gather(*[
+            self.__send_request(self.__request_builder.remove_test_step(test_case_id, test_step_id))
+            for test_step_id in test_step_ids
+        ])
+
+        self.__invalidate_test_case(test_case_id)
+
+        async def is_persisted() -> bool:
+            return (await self.__get_all_test_step_ids(test_case_id)).isdisjoint(test_step_ids)
+
+        await self.__wait_for_persistence(
+            'remove_test_steps',
+            is_persisted,
+            'Persistence of test steps not achieved before timeout.'
+        )
+
+    async def get_test_case_by_external_id(
+            self,
+            external_id: str
+    ) -> dict:
+        cached_test_case_id: Optional[str] = self.__test_case_cache.get_test_case_id(external_id) if self.__test_case_cache is not None else None
+        if cached_test_case_id is not None:
+            try:
+                cached_test_case: dict = await self.get_test_case_by_id(cached_test_case_id)
+                if APIConnector.get_external_id(cached_test_case) == external_id:
+                    return cached_test_case
+            except APIError:
+                pass
+            self.__invalidate_test_case(cached_test_case_id)
+            self.__test_case_cache.invalidate_test_case_id(external_id)
+
+        response: requests.Response = await self.__send_request(self.__request_builder.find_test_cases(external_id))
+
+        tests: List[dict] = json.loads(response.text)
+
+        if len(tests) == 0:
+            raise ItemNotFoundError(f'No test case found with external ID: {external_id}')
+
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put_test_case_id(external_id, str(tests[0]["id"]))
+
+        return await self.get_test_case_by_id(str(tests[0]["id"]))
+
+    async def get_test_case_by_id(
+            self,
+            test_case_id: str
+    ) -> dict:
+        if self.__test_case_cache is not None:
+            test_case: Optional[dict] = self.__test_case_cache.get(test_case_id)
+            if test_case is not None:
+                return test_case
+
+        return json.loads(await self.__request_test_case_document(test_case_id))
+
+    async def start_execution(
+            self,
+            test_case_id: str
+    ) -> str:
+        response: requests.Response = await self.__send_request(self.__request_builder.start_execution(test_case_id))
+
+        execution_id: str = str(json.loads(response.text)['executionId'])
+
+        async def is_persisted() -> bool:
+            return await self.get_execution_by_id(test_case_id, execution_id) is not None
+
+        await self.__wait_for_persistence(
+            'start_execution',
+            is_persisted,
+            'Persistence of execution not achieved before timeout.'
+        )
+
+        return execution_id
+
+    async def start_executions(
+            self,
+            test_case_ids: List[str]
+    ) -> List[str]:
+        async def start(test_case_id: str) -> str:
+            response: requests.Response = await self.__send_request(self.__request_builder.start_execution(test_case_id))
+            return str(json.loads(response.text)['executionId'])
+
+        execution_ids: List[str] = list(await asyncio.gather(*[start(test_case_id) for test_case_id in test_case_ids]))
+        unverified: Dict[str, str] = dict(zip(execution_ids, test_case_ids))
+
+        async def is_execution_persisted(execution_id: str) -> bool:
+            try:
+                return await self.get_execution_by_id(unverified[execution_id], execution_id) is not None
+            except APIError:
+                return False
+
+        async def is_persisted() -> bool:
+            pending: List[str] = list(unverified)
+            for execution_id, verified in zip(pending, await asyncio.gather(*[is_execution_persisted(execution_id) for execution_id in pending])):
+                if verified:
+                    del unverified[execution_id]
+            return len(unverified) == 0
+
+        await self.__wait_for_persistence(
+            'start_executions',
+            is_persisted,
+            'Persistence of executions not achieved before timeout.'
+        )
+
+        return execution_ids
+
+    async def report_execution(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            step_results: Dict[str, str]
+    ) -> None:
+        await asyncio.gather(*[
+            self.report_step_result(test_case_id, execution_id, test_step_id, result)
+            for test_step_id, result in step_results.items()
+        ])
+
+        if self.__journal is not None and self.__journal.deferred:
+            return
+
+        async def is_persisted() -> bool:
+            execution: Execution = Execution(await self.get_execution_by_id(test_case_id, execution_id))
+            return all(
+                execution.get_step_result(test_step_id).result == result
+                for test_step_id, result in step_results.items()
+            )
+
+        await self.__wait_for_persistence(
+            'report_execution',
+            is_persisted,
+            'Persistence of step results not achieved before timeout.'
+        )
+
+    async def get_execution_by_id(
+            self,
+            test_case_id: str,
+            execution_id: str
+    ) -> dict:
+        response: requests.Response = await self.__send_request(self.__request_builder.get_execution(test_case_id, execution_id))
+
+        return json.loads(response.text)
+
+    async def report_step_result(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            test_step_id: str,
+            result: str
+    ) -> None:
+        await self.__write_journaled('report_step_result', [test_case_id, execution_id, test_step_id, result])
+
+    async def create_defect(
+            self,
+            name: str,
+            message: str
+    ) -> str:
+        if self.__defect_registry is None:
+            return await self.__write_journaled('create_defect', [name, message])
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await self.__run(
+            self.__defect_registry.get_defect_id,
+            name,
+            message,
+            lambda: asyncio.run_coroutine_threadsafe(self.get_defects(), loop).result(),
+            lambda: asyncio.run_coroutine_threadsafe(self.__write_journaled('create_defect', [name, message]), loop).result()
+        )
+
+    async def get_defects(
+            self,
+            page_size: int = 500
+    ) -> List[dict]:
+        defects: List[dict] = []
+        listed_defect_ids: Set[str] = set()
+        while True:
+            response: requests.Response = await self.__send_request(self.__request_builder.get_defects(len(defects), page_size))
+            page: List[dict] = json.loads(response.text)
+            new_defects: List[dict] = [defect for defect in page if str(defect['id']) not in listed_defect_ids]
+            listed_defect_ids.update(str(defect['id']) for defect in new_defects)
+            defects += new_defects
+
+            if len(page) < page_size or len(new_defects) == 0:
+                return defects
+
+    async def assign_defect(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            test_step_id: str,
+            defect_id: str
+    ) -> None:
+        await self.__write_journaled('assign_defect', [test_case_id, execution_id, test_step_id, defect_id])
+
+    async def log_in(self) -> None:
+        await self.__run(self.__authenticator.log_in, 0)
+
+    def __close(self) -> None:
+        self.__executor.shutdown(wait=True)
+        self.__session.close()
+
+    async def __write_journaled(
+            self,
+            operation: str,
+            arguments: List[str]
+    ) -> Optional[str]:
+        if self.__journal is None:
+            return await self.__send_journaled_call(operation, arguments)
+
+        sequence: int = await self.__run(self.__journal.append, operation, arguments)
+        if self.__journal.deferred:
+            return ResultJournal.get_reference(sequence) if operation == 'create_defect' else None
+
+        result: Optional[str] = await self.__send_journaled_call(operation, arguments)
+        await self.__run(self.__journal.mark_done, sequence, result)
+        return result
+
+    async def __send_journaled_call(
+            self,
+            operation: str,
+            arguments: List[str]
+    ) -> Optional[str]:
+        if operation == 'assign_defect':
+            defect_id: Optional[str] = self.__journal.resolve_defect_id(arguments[3]) if self.__journal is not None else arguments[3]
+            if defect_id is None:
+                raise APIError(f'Defect {arguments[3]} has not been created yet.')
+            arguments = arguments[:3] + [defect_id]
+
+        response: requests.Response = await self.__send_request(self.__request_builder.journaled_call(operation, arguments))
+        return str(json.loads(response.text)['defectId']) if operation == 'create_defect' else None
+
+    async def __request_test_case_document(
+            self,
+            test_case_id: str
+    ) -> str:
+        generation: Optional[int] = self.__test_case_cache.get_generation(test_case_id) if self.__test_case_cache is not None else None
+        response: requests.Response = await self.__send_request(self.__request_builder.get_test_case(test_case_id))
+
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.put(test_case_id, response.text, generation)
+
+        return response.text
+
+    def __invalidate_test_case(
+            self,
+            test_case_id: str
+    ) -> None:
+        if self.__test_case_cache is not None:
+            self.__test_case_cache.invalidate(test_case_id)
+
+    async def __get_test_step_ids(
+            self,
+            test_case_id: str,
+            block_index: int
+    ) -> List[str]:
+        written_data: dict = json.loads(await self.__request_test_case_document(test_case_id))
+        return [str(test_step['id']) for test_step in written_data['testSequence']['testStepBlocks'][block_index]['steps']]
+
+    async def __get_all_test_step_ids(
+            self,
+            test_case_id: str
+    ) -> Set[str]:
+        written_data: dict = json.loads(await self.__request_test_case_document(test_case_id))
+        return {
+            str(test_step['id'])
+            for test_step_block in written_data['testSequence']['testStepBlocks']
+            for test_step in test_step_block['steps']
+        }
+
+    async def __wait_for_persistence(
+            self,
+            operation: str,
+            is_persisted: Callable[[], Awaitable[bool]],
+            timeout_message: str
+    ) -> None:
+        if not self.__wait_policy.verify:
+            return
+
+        start: float = time.monotonic()
+        checks: int = 0
+        sleep_time: float = 0.0
+        for delay in self.__wait_policy.delays():
+            await asyncio.sleep(delay)
+            sleep_time += delay
+            checks += 1
+            try:
+                if await is_persisted():
+                    self.__record_wait(operation, time.monotonic() - start, checks, sleep_time, True)
+                    return
+            except APIError:
+                pass
+
+        self.__record_wait(operation, time.monotonic() - start, checks, sleep_time, False)
+        raise APIError(timeout_message)
+
+    def __record_wait(
+            self,
+            operation: str,
+            duration: float,
+            checks: int,
+            sleep_time: float,
+            persisted: bool
+    ) -> None:
+        self.__wait_statistics.record(operation, duration, checks, persisted)
+        self.__emit(WaitEvent(operation, duration, checks, sleep_time, persisted))
+
+    def __emit(self, event: Union[RequestEvent, WaitEvent]) -> None:
+        for hook in self.__hooks:
+            try:
+                hook(event)
+            except Exception as error:
+                warnings.warn(f'Instrumentation hook {hook!r} failed: {error!r}')
+
+    async def __run(self, function: Callable[..., Any], *arguments: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *arguments))
+
+    async def __send_request(
+            self,
+            request: Request
+    ) -> requests.Response:
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__concurrency_limit)
+
+        attempts: RequestAttempts = RequestAttempts(request, self.__retry_policy, self.__circuit_breaker)
+        try:
+            while True:
+                if self.__rate_limiter is not None:
+                    rate_limit_delay: float = self.__rate_limiter.reserve()
+                    await asyncio.sleep(rate_limit_delay)
+                    attempts.record_sleep(rate_limit_delay)
+
+                attempts.before_send()
+                try:
+                    async with self.__semaphore:
+                        login_generation, response = await asyncio.get_running_loop().run_in_executor(
+                            self.__executor,
+                            functools.partial(self.__send, request)
+                        )
+                except BaseException as error:
+                    error_delay: Optional[float] = attempts.on_error(error)
+                    if error_delay is None:
+                        raise
+                    await asyncio.sleep(error_delay)
+                    continue
+
+                action, delay = attempts.on_response(response)
+                if action == RequestAttempts.ACTION_DONE:
+                    return response
+                elif action == RequestAttempts.ACTION_REAUTHENTICATE:
+                    await self.__run(self.__authenticator.log_in, login_generation)
+                else:
+                    await asyncio.sleep(delay)
+        finally:
+            if len(self.__hooks) > 0:
+                self.__emit(attempts.get_event(APIConnector.get_endpoint_template(request.endpoint)))
+
+    def __send(self, request: Request) -> Tuple[int, requests.Response]:
+        login_generation, headers = self.__authenticator.get_headers()
+        return login_generation, self.__session.request(
+            request.method,
+            f'{self.__base_url}{request.endpoint}',
+            data=request.data,
+            headers=headers
+        )
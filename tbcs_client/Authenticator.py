@@ -0,0 +1,134 @@
+import json
+import threading
+
+from typing import Optional, Tuple
+
+import requests
+
+from tbcs_client.APIError import APIError
+from tbcs_client.SessionTokenStore import SessionTokenStore
+
+""" Thread-safe session handling for the TestBench CS REST-API
+
+The Authenticator logs in to TestBench CS and holds the resulting session token together with the tenant and user
+ID. All of them are replaced at once under a lock, 'get_headers' always returns a consistent snapshot. Every login
+increases the generation of the session. Callers that received a 401 pass the generation they used to 'log_in',
+so that only the first of many concurrent callers logs in again while the others wait for it and then reuse the
+new session.
+
+If a SessionTokenStore is given, sessions are shared with other processes using the same store. A login first
+looks for a stored session that differs from the one that has just been rejected and only logs in if there is
+none. This decision is made while holding the store's lock for the account, so that only one process logs in.
+"""
+
+
+class Authenticator:
+    LOGIN_ENDPOINT: str = '/api/tenants/login/session'
+
+    __base_url: str
+    __tenant_name: str
+    __username: str
+    __password: str
+    __session: requests.Session
+    __token_store: Optional[SessionTokenStore]
+    __token_store_key: str
+    __lock: threading.Lock
+    __headers: dict
+    __tenant_id: int = -1
+    __user_id: int = -1
+    __generation: int = 0
+
+    def __init__(
+            self,
+            base_url: str,
+            tenant_name: str,
+            username: str,
+            password: str,
+            session: requests.Session,
+            token_store: Optional[SessionTokenStore] = None
+    ):
+        self.__base_url = base_url
+        self.__tenant_name = tenant_name
+        self.__username = username
+        self.__password = password
+        self.__session = session
+        self.__token_store = token_store
+        self.__token_store_key = SessionTokenStore.get_key(base_url, tenant_name, username)
+        self.__lock = threading.Lock()
+        self.__headers = Authenticator.get_base_headers()
+
+    @property
+    def tenant_id(self) -> int:
+        return self.__tenant_id
+
+    @property
+    def user_id(self) -> int:
+        return self.__user_id
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def get_headers(self) -> Tuple[int, dict]:
+        with self.__lock:
+            return self.__generation, self.__headers
+
+    def log_in(self, seen_generation: int = -1) -> None:
+        with self.__lock:
+            if not seen_generation == -1 and not seen_generation == self.__generation:
+                return
+
+            if self.__token_store is None:
+                self.__set_session(self.__request_session())
+                return
+
+            with self.__token_store.lock(self.__token_store_key):
+                stored_session: Optional[dict] = self.__token_store.load(self.__token_store_key)
+                if stored_session is not None and not self.__headers.get('Authorization') == f'Bearer {stored_session["sessionToken"]}':
+                    self.__set_session(stored_session)
+                    return
+
+                session_data: dict = self.__request_session()
+                self.__token_store.save(self.__token_store_key, session_data)
+                self.__set_session(session_data)
+
+    def __request_session(self) -> dict:
+        auth_data: dict = {
+            'force': True,
+            'tenantName': self.__tenant_name,
+            'login': self.__username,
+            'password': self.__password
+        }
+        response: requests.Response = self.__session.post(
+            url=f'{self.__base_url}{Authenticator.LOGIN_ENDPOINT}',
+            data=json.dumps(auth_data),
+            headers=Authenticator.get_base_headers()
+        )
+
+        if response.status_code == 401:
+            raise Exception('Unable to authenticate', response)
+        elif not response.status_code == 201:
+            raise APIError(f'{Authenticator.LOGIN_ENDPOINT} failed with message {response.text}')
+
+        response_data: dict = json.loads(response.text)
+        return {
+            'sessionToken': response_data['sessionToken'],
+            'tenantId': response_data['tenantId'],
+            'userId': response_data['userId']
+        }
+
+    def __set_session(self, session_data: dict) -> None:
+        headers: dict = Authenticator.get_base_headers()
+        headers['Authorization'] = f'Bearer {session_data["sessionToken"]}'
+        self.__headers = headers
+        self.__tenant_id = session_data['tenantId']
+        self.__user_id = session_data['userId']
+        self.__generation += 1
+
+    @staticmethod
+    def get_base_headers() -> dict:
+        return {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Charset': 'UTF-8'
+        }
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from tbcs_client.APIError import APIError
+
+""" Circuit breaker for requests against the TestBench CS REST-API
+
+After 'failure_threshold' consecutive failures (connection errors, 429 and 5xx responses) the CircuitBreaker
+opens and requests fail immediately with an APIError instead of adding load to a struggling server. After
+'reset_timeout' seconds a single trial request is let through; if it succeeds, the breaker closes again,
+otherwise it stays open for another 'reset_timeout' seconds. A trial request that raises any other exception
+counts as failed as well.
+"""
+
+
+class CircuitBreaker:
+    STATE_CLOSED: str = 'closed'
+    STATE_OPEN: str = 'open'
+    STATE_HALF_OPEN: str = 'half_open'
+
+    __failure_threshold: int
+    __reset_timeout: float
+    __state: str = STATE_CLOSED
+    __failures: int = 0
+    __opened: float = 0.0
+    __lock: threading.Lock
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self.__state
+
+    def before_request(self) -> None:
+        with self.__lock:
+            if self.__state == CircuitBreaker.STATE_CLOSED:
+                return
+            if self.__state == CircuitBreaker.STATE_OPEN and time.monotonic() - self.__opened >= self.__reset_timeout:
+                self.__state = CircuitBreaker.STATE_HALF_OPEN
+                return
+            raise APIError('Circuit breaker is open, requests to TestBench CS are suspended.')
+
+    def record_success(self) -> None:
+        with self.__lock:
+            self.__state = CircuitBreaker.STATE_CLOSED
+            self.__failures = 0
+
+    def record_failure(self) -> None:
+        with self.__lock:
+            self.__failures += 1
+            if self.__state == CircuitBreaker.STATE_HALF_OPEN or self.__failures >= self.__failure_threshold:
+                self.__state = CircuitBreaker.STATE_OPEN
+                self.__opened = time.monotonic()
+
+    @staticmethod
+    def is_failure(status_code: int) -> bool:
+        return status_code == 429 or status_code >= 500
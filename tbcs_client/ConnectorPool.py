@@ -0,0 +1,144 @@
+import threading
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import requests
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.APIError import APIError
+from tbcs_client.Authenticator import Authenticator
+from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.SessionTokenStore import SessionTokenStore
+
+""" Shared connections and logins for connectors of many products
+
+The ConnectorPool hands out one APIConnector per product. All connectors for the same server share one
+requests.Session and therefore one pool of keep-alive connections, and all connectors for the same tenant and user
+share one Authenticator and therefore one login. Adding a product with 'add_config', or 'add_product' for a
+further product of a tenant that is already known, costs neither new connections nor a login.
+
+Keyword arguments given to the pool (e.g. 'wait_policy' or 'retry_policy') are passed to every connector it
+creates. Objects passed this way are shared between the connectors; pass stateful ones such as a TestCaseCache
+only if that is intended. 'pool_maxsize' is the number of connections kept per server and should be at least
+the number of threads using the connectors of that server.
+"""
+
+
+class ConnectorPool:
+    __pool_connections: int
+    __pool_maxsize: int
+    __token_store: Optional[SessionTokenStore]
+    __connector_arguments: dict
+    __sessions: Dict[str, requests.Session]
+    __authenticators: Dict[Tuple[str, str, str], Tuple[dict, Authenticator]]
+    __connectors: Dict[Tuple[str, str, str], APIConnector]
+    __lock: threading.Lock
+
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 32,
+            token_store: Optional[SessionTokenStore] = None,
+            **connector_arguments
+    ):
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__token_store = token_store
+        self.__connector_arguments = connector_arguments
+        self.__sessions = {}
+        self.__authenticators = {}
+        self.__connectors = {}
+        self.__lock = threading.Lock()
+
+    def __enter__(self) -> 'ConnectorPool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.__connectors)
+
+    @property
+    def connectors(self) -> List[APIConnector]:
+        with self.__lock:
+            return list(self.__connectors.values())
+
+    def add_config(self, config_path: Union[str, dict]) -> APIConnector:
+        config_data: dict = config_path if isinstance(config_path, dict) else APIConnector.load_config(config_path)
+        base_url: str = APIConnector.get_base_url(config_data['server_address'])
+        connector_key: Tuple[str, str, str] = (base_url, config_data['tenant_name'], str(config_data['product_id']))
+        authenticator_key: Tuple[str, str, str] = (base_url, config_data['tenant_name'], config_data['tenant_user'])
+
+        with self.__lock:
+            connector: Optional[APIConnector] = self.__connectors.get(connector_key)
+            if connector is not None:
+                return connector
+
+            session: Optional[requests.Session] = self.__sessions.get(base_url)
+            if session is None:
+                session = APIConnector.create_session(config_data, self.__pool_connections, self.__pool_maxsize)
+                self.__sessions[base_url] = session
+
+            if authenticator_key not in self.__authenticators:
+                self.__authenticators[authenticator_key] = (config_data, Authenticator(
+                    base_url,
+                    config_data['tenant_name'],
+                    config_data['tenant_user'],
+                    config_data['password'],
+                    session,
+                    self.__token_store
+                ))
+
+            connector = APIConnector(
+                config_data,
+                session=session,
+                authenticator=self.__authenticators[authenticator_key][1],
+                **self.__connector_arguments
+            )
+            self.__connectors[connector_key] = connector
+            return connector
+
+    def add_product(self, product_id: Union[int, str], tenant_name: Optional[str] = None) -> APIConnector:
+        with self.__lock:
+            configs: List[dict] = [
+                config_data for config_data, _ in self.__authenticators.values()
+                if tenant_name is None or config_data['tenant_name'] == tenant_name
+            ]
+        if len(configs) == 0:
+            raise ItemNotFoundError(f'No configuration found for tenant: {tenant_name}')
+        if len(configs) > 1:
+            raise APIError('Several tenants are configured, pass the tenant name of the product.')
+
+        return self.add_config(dict(configs[0], product_id=product_id))
+
+    def get_connector(self, product_id: Union[int, str], tenant_name: Optional[str] = None) -> APIConnector:
+        with self.__lock:
+            connectors: List[APIConnector] = [
+                connector for (_, connector_tenant_name, connector_product_id), connector in self.__connectors.items()
+                if connector_product_id == str(product_id) and (tenant_name is None or connector_tenant_name == tenant_name)
+            ]
+        if len(connectors) == 0:
+            raise ItemNotFoundError(f'No connector found for product: {product_id}')
+        if len(connectors) > 1:
+            raise APIError(f'Product {product_id} is configured for several tenants, pass the tenant name.')
+        return connectors[0]
+
+    def log_in(self) -> None:
+        with self.__lock:
+            authenticators: List[Authenticator] = [authenticator for _, authenticator in self.__authenticators.values()]
+        for authenticator in authenticators:
+            authenticator.log_in(0)
+
+    def summary(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                'servers': len(self.__sessions),
+                'logins': len(self.__authenticators),
+                'products': len(self.__connectors)
+            }
+
+    def close(self) -> None:
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
@@ -0,0 +1,105 @@
+import hashlib
+import re
+import threading
+import time
+
+from typing import Callable, Dict, List, Optional
+
+""" Deduplication of defects created through the APIConnector
+
+With a DefectRegistry passed as 'defect_registry', APIConnector.create_defect returns the ID of an existing defect
+with the same fingerprint instead of creating a new one. The fingerprint is built from signatures of name and
+message, in which case and whitespace are ignored and numbers, hexadecimal values and UUIDs are replaced by
+placeholders, so that defects differing only in e.g. timestamps, ports or object addresses map to the same
+defect.
+
+The existing defects of the product are read once, when the registry is used for the first time, and again after
+'max_age' seconds if given. Defects created through the registry are added to it. If several threads ask for the
+same new defect at once, only one of them creates it while the others wait for its ID.
+"""
+
+
+class DefectRegistry:
+    __max_age: Optional[float]
+    __defect_ids: Dict[str, str]
+    __creating: Dict[str, threading.Event]
+    __loaded: Optional[float] = None
+    __lock: threading.Lock
+    __load_lock: threading.Lock
+    __reused: int = 0
+    __created: int = 0
+
+    def __init__(self, max_age: Optional[float] = None):
+        self.__max_age = max_age
+        self.__defect_ids = {}
+        self.__creating = {}
+        self.__lock = threading.Lock()
+        self.__load_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__defect_ids)
+
+    @staticmethod
+    def get_fingerprint(name: str, message: str) -> str:
+        return hashlib.sha256(f'{DefectRegistry.get_signature(name)}\n{DefectRegistry.get_signature(message)}'.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_signature(text: str) -> str:
+        signature: str = text.lower()
+        signature = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '<uuid>', signature)
+        signature = re.sub(r'0x[0-9a-f]+', '<hex>', signature)
+        signature = re.sub(r'\d+(\.\d+)?', '<number>', signature)
+        return ' '.join(signature.split())
+
+    def get_defect_id(
+            self,
+            name: str,
+            message: str,
+            load_defects: Callable[[], List[dict]],
+            create_defect: Callable[[], str]
+    ) -> str:
+        fingerprint: str = DefectRegistry.get_fingerprint(name, message)
+        self.__load(load_defects)
+        while True:
+            with self.__lock:
+                defect_id: Optional[str] = self.__defect_ids.get(fingerprint)
+                if defect_id is not None:
+                    self.__reused += 1
+                    return defect_id
+                creation: Optional[threading.Event] = self.__creating.get(fingerprint)
+                if creation is None:
+                    self.__creating[fingerprint] = threading.Event()
+                    break
+            creation.wait()
+
+        try:
+            defect_id = create_defect()
+            with self.__lock:
+                self.__defect_ids[fingerprint] = defect_id
+                self.__created += 1
+            return defect_id
+        finally:
+            with self.__lock:
+                self.__creating.pop(fingerprint).set()
+
+    def add(self, defect_id: str, name: str, message: str) -> None:
+        with self.__lock:
+            self.__defect_ids.setdefault(DefectRegistry.get_fingerprint(name, message), defect_id)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__defect_ids = {}
+            self.__loaded = None
+
+    def summary(self) -> Dict[str, int]:
+        with self.__lock:
+            return {'defects': len(self.__defect_ids), 'reused': self.__reused, 'created': self.__created}
+
+    def __load(self, load_defects: Callable[[], List[dict]]) -> None:
+        with self.__load_lock:
+            if self.__loaded is not None and (self.__max_age is None or time.monotonic() - self.__loaded < self.__max_age):
+                return
+            loaded: float = time.monotonic()
+            for defect in load_defects():
+                self.add(str(defect['id']), defect.get('name') or '', defect.get('description') or '')
+            self.__loaded = loaded
@@ -0,0 +1,75 @@
+import json
+import sys
+
+from typing import Dict, Optional, Tuple, Union
+
+from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.StepResult import StepResult
+
+""" Execution of a test case read from TestBench CS
+
+An Execution is created from the JSON document returned by the REST-API, either as text or as already parsed
+dict. Like TestCase it parses text on first access and then only keeps the execution's IDs and a StepResult per
+test step, which can be looked up by test step ID and by block name.
+"""
+
+
+class Execution:
+    __slots__ = ('__document', '__id', '__test_case_id', '__step_result_blocks', '__step_results')
+
+    def __init__(self, document: Union[str, bytes, dict]):
+        self.__document = document
+
+    @property
+    def id(self) -> str:
+        self.__parse()
+        return self.__id
+
+    @property
+    def test_case_id(self) -> Optional[str]:
+        self.__parse()
+        return self.__test_case_id
+
+    def get_step_results(self, block_name: Optional[str] = None) -> Tuple[StepResult, ...]:
+        self.__parse()
+        if block_name is None:
+            return tuple(step_result for step_results in self.__step_result_blocks.values() for step_result in step_results)
+        if block_name not in self.__step_result_blocks:
+            raise ItemNotFoundError(f'No test step block found with name: {block_name}')
+        return self.__step_result_blocks[block_name]
+
+    def get_step_result(self, test_step_id: str) -> StepResult:
+        self.__parse()
+        step_result: Optional[StepResult] = self.__step_results.get(str(test_step_id))
+        if step_result is None:
+            raise ItemNotFoundError(f'No test step found with ID: {test_step_id}')
+        return step_result
+
+    def __repr__(self) -> str:
+        return f'Execution(id={self.id!r}, test_case_id={self.test_case_id!r})'
+
+    def __parse(self) -> None:
+        if self.__document is None:
+            return
+
+        document: dict = json.loads(self.__document) if isinstance(self.__document, (str, bytes)) else self.__document
+        test_case_id: Optional[object] = (document.get('testCase') or {}).get('id')
+        self.__id = str(document['id'])
+        self.__test_case_id = str(test_case_id) if test_case_id is not None else None
+        self.__step_result_blocks: Dict[str, Tuple[StepResult, ...]] = {}
+        self.__step_results: Dict[str, StepResult] = {}
+        for test_step_block in (document.get('testSequence') or {}).get('testStepBlocks', []):
+            block_name: str = sys.intern(test_step_block['name'])
+            step_results: Tuple[StepResult, ...] = tuple(
+                StepResult(
+                    str(test_step['id']),
+                    test_step.get('description') or '',
+                    block_name,
+                    sys.intern(test_step.get('result') or 'Undefined'),
+                    tuple(str(defect_id) for defect_id in test_step.get('defectIds') or [])
+                )
+                for test_step in test_step_block.get('steps', [])
+            )
+            self.__step_result_blocks[block_name] = step_results
+            self.__step_results.update((step_result.test_step_id, step_result) for step_result in step_results)
+        self.__document = None
@@ -0,0 +1,222 @@
+import argparse
+import multiprocessing
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.DefectRegistry import DefectRegistry
+from tbcs_client.SessionTokenStore import SessionTokenStore
+
+""" Upload of JUnit/xUnit XML reports to TestBench CS
+
+The JUnitUploader reads JUnit XML reports incrementally, so that reports of any size can be uploaded with constant
+memory, and reports every contained test case to TestBench CS through an APIConnector with a pool of worker
+threads. Test cases are mapped by external ID, which is '<classname>.<name>' of the JUnit test case. Missing test
+cases are created with a single test step, an execution is started and the result is reported on the first step
+of the Test block. For failures and errors a defect named after the first line of the message is created (reused
+for identical messages, see DefectRegistry) and assigned. Skipped test cases are counted but not reported.
+
+The uploader is available as console command 'tbcs-upload':
+
+    tbcs-upload --config tbcs.config.json --workers 16 --processes 4 reports/*.xml
+
+With more than one process, the reports are distributed over the processes, which share one TestBench CS session
+through a SessionTokenStore. Progress and throughput are written to stderr. Reports uploaded concurrently should
+not contain the same test case for the first time, as it may then be created more than once.
+"""
+
+
+class JUnitTestCase(NamedTuple):
+    external_id: str
+    name: str
+    result: str
+    message: str = ''
+
+
+class JUnitUploader:
+    RESULT_SKIPPED: str = 'Skipped'
+
+    __connector: APIConnector
+    __max_workers: int
+    __progress_interval: float
+    __output: Optional[TextIO]
+    __lock: threading.Lock
+    __test_case_locks: Dict[str, threading.Lock]
+    __prefetched: bool = False
+
+    def __init__(
+            self,
+            connector: APIConnector,
+            max_workers: int = 8,
+            progress_interval: float = 1.0,
+            output: Optional[TextIO] = sys.stderr
+    ):
+        self.__connector = connector
+        self.__max_workers = max_workers
+        self.__progress_interval = progress_interval
+        self.__output = output
+        self.__lock = threading.Lock()
+        self.__test_case_locks = {}
+
+    @staticmethod
+    def parse(report_path: str) -> Iterator[JUnitTestCase]:
+        elements: List[ElementTree.Element] = []
+        for event, element in ElementTree.iterparse(report_path, events=('start', 'end')):
+            if event == 'start':
+                elements.append(element)
+                continue
+
+            elements.pop()
+            if not element.tag == 'testcase':
+                continue
+
+            class_name: str = element.get('classname') or ''
+            name: str = element.get('name') or ''
+            result: str = APIConnector.TEST_STEP_STATUS_PASSED
+            message: str = ''
+            for child in element:
+                if child.tag in ('failure', 'error'):
+                    result = APIConnector.TEST_STEP_STATUS_FAILED
+                    message = child.get('message') or (child.text or '').strip() or child.tag
+                    break
+                elif child.tag == 'skipped':
+                    result = JUnitUploader.RESULT_SKIPPED
+
+            if len(elements) > 0:
+                elements[-1].remove(element)
+            element.clear()
+            yield JUnitTestCase(f'{class_name}.{name}' if class_name else name, name, result, message)
+
+    def upload(self, report_path: str) -> Dict[str, int]:
+        if not self.__prefetched:
+            for _ in self.__connector.prefetch_test_cases():
+                pass
+            self.__prefetched = True
+
+        counts: Dict[str, int] = {'test_cases': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'errors': 0}
+        slots: threading.BoundedSemaphore = threading.BoundedSemaphore(self.__max_workers * 2)
+        started: float = time.monotonic()
+        last_progress: float = started
+
+        def count(future: Future) -> None:
+            with self.__lock:
+                counts['test_cases'] += 1
+                if future.exception() is not None:
+                    counts['errors'] += 1
+                    self.__print(f'{report_path}: {future.exception()}')
+                else:
+                    counts[{
+                        APIConnector.TEST_STEP_STATUS_PASSED: 'passed',
+                        APIConnector.TEST_STEP_STATUS_FAILED: 'failed'
+                    }.get(future.result(), 'skipped')] += 1
+            slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='tbcs-upload') as executor:
+            for test_case in JUnitUploader.parse(report_path):
+                slots.acquire()
+                executor.submit(self.__upload_test_case, test_case).add_done_callback(count)
+                if time.monotonic() - last_progress >= self.__progress_interval:
+                    last_progress = time.monotonic()
+                    self.__print_progress(report_path, counts, started)
+
+        self.__print_progress(report_path, counts, started)
+        return counts
+
+    def __upload_test_case(self, test_case: JUnitTestCase) -> str:
+        if test_case.result == JUnitUploader.RESULT_SKIPPED:
+            return test_case.result
+
+        test_case_id, test_step_id = self.__get_test_case(test_case)
+        execution_id: str = self.__connector.start_execution(test_case_id)
+        self.__connector.report_step_result(test_case_id, execution_id, test_step_id, test_case.result)
+        if test_case.result == APIConnector.TEST_STEP_STATUS_FAILED:
+            defect_id: str = self.__connector.create_defect(test_case.message.splitlines()[0][:200], test_case.message)
+            self.__connector.assign_defect(test_case_id, execution_id, test_step_id, defect_id)
+        return test_case.result
+
+    def __get_test_case(self, test_case: JUnitTestCase) -> Tuple[str, str]:
+        with self.__lock:
+            test_case_lock: threading.Lock = self.__test_case_locks.setdefault(test_case.external_id, threading.Lock())
+
+        with test_case_lock:
+            test_case_id, test_step_id, _ = self.__connector.get_or_create_test_step(
+                test_case.external_id,
+                test_case.name,
+                f'Imported from JUnit report ({test_case.external_id})'
+            )
+            return test_case_id, test_step_id
+
+    def __print_progress(self, report_path: str, counts: Dict[str, int], started: float) -> None:
+        with self.__lock:
+            uploaded: int = counts['test_cases']
+            failed: int = counts['errors']
+        duration: float = max(time.monotonic() - started, 1e-9)
+        self.__print(f'{report_path}: {uploaded} test cases uploaded ({failed} errors), {uploaded / duration:.1f}/s')
+
+    def __print(self, message: str) -> None:
+        if self.__output is not None:
+            print(message, file=self.__output, flush=True)
+
+
+def upload_reports(
+        config_path: str,
+        report_paths: List[str],
+        max_workers: int = 8,
+        token_store_directory: Optional[str] = None
+) -> Dict[str, int]:
+    connector: APIConnector = APIConnector(
+        config_path,
+        pool_maxsize=max_workers,
+        token_store=SessionTokenStore(token_store_directory) if token_store_directory is not None else None,
+        defect_registry=DefectRegistry()
+    )
+    connector.log_in()
+    uploader: JUnitUploader = JUnitUploader(connector, max_workers)
+    totals: Dict[str, int] = {}
+    for report_path in report_paths:
+        for key, value in uploader.upload(report_path).items():
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='tbcs-upload',
+        description='Upload JUnit/xUnit XML reports to TestBench CS.'
+    )
+    parser.add_argument('reports', nargs='+', help='JUnit XML report files')
+    parser.add_argument('--config', default='tbcs.config.json', help='path of the TestBench CS configuration file')
+    parser.add_argument('--workers', type=int, default=8, help='number of concurrent requests per process')
+    parser.add_argument('--processes', type=int, default=1, help='number of processes to distribute the reports over')
+    parser.add_argument('--session-dir', help='directory of the session store shared by the processes')
+    options: argparse.Namespace = parser.parse_args(arguments)
+
+    started: float = time.monotonic()
+    processes: int = max(min(options.processes, len(options.reports)), 1)
+    if processes == 1:
+        results: List[Dict[str, int]] = [upload_reports(options.config, options.reports, options.workers, options.session_dir)]
+    else:
+        session_directory: str = options.session_dir or SessionTokenStore.DEFAULT_DIRECTORY
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(upload_reports, [
+                (options.config, options.reports[index::processes], options.workers, session_directory)
+                for index in range(processes)
+            ])
+
+    totals: Dict[str, int] = {key: sum(result.get(key, 0) for result in results) for key in results[0]}
+    duration: float = time.monotonic() - started
+    print(
+        f'{totals["test_cases"]} test cases in {duration:.1f}s ({totals["test_cases"] / max(duration, 1e-9):.1f}/s): '
+        f'{totals["passed"]} passed, {totals["failed"]} failed, {totals["skipped"]} skipped, {totals["errors"]} errors',
+        file=sys.stderr
+    )
+    return 1 if totals['errors'] > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
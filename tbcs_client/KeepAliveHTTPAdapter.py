@@ -0,0 +1,17 @@
+import socket
+
+import requests.adapters
+
+from urllib3.connection import HTTPConnection
+
+""" HTTP adapter keeping pooled connections to TestBench CS alive
+
+Connections opened by this adapter have TCP keep-alive enabled, so that idle connections in the pool are not
+silently dropped by firewalls or load balancers between two bursts of requests and do not have to be re-opened.
+"""
+
+
+class KeepAliveHTTPAdapter(requests.adapters.HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
@@ -0,0 +1,101 @@
+import random
+import threading
+import time
+
+from typing import Dict, List, Union
+
+from tbcs_client.TimingEvent import RequestEvent, WaitEvent
+
+""" Aggregation of timing events per endpoint
+
+A LatencyAggregator can be registered as hook on a connector ('connector.add_hook(aggregator)'). It groups the
+received events by HTTP method and endpoint template (persistence checks by operation) and reports count,
+failures, throughput and the distribution of durations including p50/p95/p99. For every group at most
+'max_samples' durations are kept as a uniform random sample, so that memory stays bounded during long runs.
+"""
+
+
+class LatencyAggregator:
+    __max_samples: int
+    __groups: Dict[str, dict]
+    __lock: threading.Lock
+
+    def __init__(self, max_samples: int = 10000):
+        self.__max_samples = max_samples
+        self.__groups = {}
+        self.__lock = threading.Lock()
+
+    def __call__(self, event: Union[RequestEvent, WaitEvent]) -> None:
+        if isinstance(event, RequestEvent):
+            key: str = f'{event.method} {event.endpoint}'
+            failed: bool = event.status_code is None or event.status_code >= 400
+        else:
+            key = f'WAIT {event.operation}'
+            failed = not event.persisted
+
+        now: float = time.monotonic()
+        with self.__lock:
+            group: dict = self.__groups.setdefault(key, {
+                'count': 0,
+                'failed': 0,
+                'total_duration': 0.0,
+                'max_duration': 0.0,
+                'sleep_time': 0.0,
+                'retries': 0,
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'first': now - event.duration,
+                'last': now,
+                'samples': []
+            })
+            group['count'] += 1
+            group['failed'] += 1 if failed else 0
+            group['total_duration'] += event.duration
+            group['max_duration'] = max(group['max_duration'], event.duration)
+            group['sleep_time'] += event.sleep_time
+            group['last'] = now
+            if isinstance(event, RequestEvent):
+                group['retries'] += event.retries
+                group['bytes_sent'] += event.bytes_sent
+                group['bytes_received'] += event.bytes_received
+
+            samples: List[float] = group['samples']
+            if len(samples) < self.__max_samples:
+                samples.append(event.duration)
+            else:
+                index: int = random.randrange(group['count'])
+                if index < self.__max_samples:
+                    samples[index] = event.duration
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self.__lock:
+            groups: Dict[str, dict] = {key: dict(group, samples=sorted(group['samples'])) for key, group in self.__groups.items()}
+
+        return {
+            key: {
+                'count': group['count'],
+                'failed': group['failed'],
+                'mean': group['total_duration'] / group['count'],
+                'p50': LatencyAggregator.get_percentile(group['samples'], 50),
+                'p95': LatencyAggregator.get_percentile(group['samples'], 95),
+                'p99': LatencyAggregator.get_percentile(group['samples'], 99),
+                'max': group['max_duration'],
+                'sleep_time': group['sleep_time'],
+                'retries': group['retries'],
+                'bytes_sent': group['bytes_sent'],
+                'bytes_received': group['bytes_received'],
+                'throughput': group['count'] / max(group['last'] - group['first'], 1e-9)
+            }
+            for key, group in groups.items()
+        }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__groups = {}
+
+    @staticmethod
+    def get_percentile(sorted_samples: List[float], percentile: float) -> float:
+        if len(sorted_samples) == 0:
+            return 0.0
+        rank: int = max(int(-(-percentile * len(sorted_samples) // 100)), 1)
+        return sorted_samples[rank - 1]
@@ -0,0 +1,321 @@
+import json
+import os
+import queue
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+from _pytest.mark.structures import Mark
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.DefectRegistry import DefectRegistry
+from tbcs_client.ResultReporter import ResultReporter
+from tbcs_client.SessionTokenStore import SessionTokenStore
+
+""" pytest plugin reporting test results to TestBench CS
+
+The plugin is registered through the 'pytest11' entry point and stays inactive unless pytest is run with '--tbcs':
+
+    pytest --tbcs --tbcs-config tbcs.config.json
+
+Every collected test is mapped to the test case with its node ID as external ID, or the external ID given with
+'@pytest.mark.tbcs(external_id=...)'. All tests are resolved once after collection: the test case catalogue is
+listed in one pass (see APIConnector.prefetch_test_cases) and missing test cases are created with a single test
+step in parallel with '--tbcs-workers' threads. Results are handed to a background sender while the tests keep
+running; it starts executions in batches and reports step results and defects through a ResultReporter. Failing
+tests get a defect named after their error, reused for identical errors (see DefectRegistry). Skipped tests are
+not reported.
+
+With pytest-xdist, the controller logs in once and the workers share its session through a SessionTokenStore in
+'--tbcs-session-dir'. The first worker resolves the tests and stores the mapping there, the other workers read it
+instead of creating the same test cases again; every worker starts executions only for the tests it runs. The
+terminal summary shows the number of reported results and the time the test run spent on reporting.
+"""
+
+
+class PytestPlugin:
+    MARKER_NAME: str = 'tbcs'
+
+    __connector: APIConnector
+    __max_workers: int
+    __batch_size: int
+    __session_directory: Optional[str]
+    __run_id: Optional[str]
+    __reporter: ResultReporter
+    __queue: 'queue.Queue[Optional[Tuple[str, str, str, str]]]'
+    __sender: threading.Thread
+    __external_ids: Dict[str, str]
+    __test_cases: Dict[str, Tuple[str, str]]
+    __results: Dict[str, Tuple[str, str]]
+    __counts: Dict[str, int]
+    __overhead: Dict[str, float]
+    __messages: List[str]
+    __lock: threading.Lock
+
+    def __init__(
+            self,
+            connector: APIConnector,
+            max_workers: int = 8,
+            batch_size: int = 50,
+            session_directory: Optional[str] = None,
+            run_id: Optional[str] = None
+    ):
+        self.__connector = connector
+        self.__max_workers = max_workers
+        self.__batch_size = batch_size
+        self.__session_directory = session_directory
+        self.__run_id = run_id
+        self.__reporter = ResultReporter(connector, max_workers)
+        self.__queue = queue.Queue()
+        self.__sender = threading.Thread(target=self.__send, name='tbcs-sender', daemon=True)
+        self.__external_ids = {}
+        self.__test_cases = {}
+        self.__results = {}
+        self.__counts = {'created': 0, 'passed': 0, 'failed': 0, 'errors': 0}
+        self.__overhead = {'resolve': 0.0, 'report': 0.0, 'flush': 0.0}
+        self.__messages = []
+        self.__lock = threading.Lock()
+        self.__sender.start()
+
+    @staticmethod
+    def get_external_id(item: Item) -> str:
+        marker: Optional[Mark] = item.get_closest_marker(PytestPlugin.MARKER_NAME)
+        if marker is not None and marker.kwargs.get('external_id'):
+            return str(marker.kwargs['external_id'])
+        return item.nodeid
+
+    def summary(self) -> Dict[str, float]:
+        with self.__lock:
+            reporter_summary: Dict[str, int] = self.__reporter.summary()
+            return dict(
+                self.__counts,
+                errors=self.__counts['errors'] + reporter_summary['failed'],
+                **self.__overhead
+            )
+
+    def get_messages(self) -> List[str]:
+        with self.__lock:
+            return list(self.__messages) + [
+                f'{failure.operation} failed: {failure.message}' for failure in self.__reporter.get_failures()
+            ]
+
+    def pytest_collection_finish(self, session: Session) -> None:
+        started: float = time.monotonic()
+        self.__external_ids = {item.nodeid: PytestPlugin.get_external_id(item) for item in session.items}
+        names: Dict[str, str] = {self.__external_ids[item.nodeid]: item.name for item in session.items}
+        if self.__run_id is None:
+            self.__resolve(names)
+        else:
+            self.__resolve_shared(names)
+        self.__overhead['resolve'] += time.monotonic() - started
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        started: float = time.monotonic()
+        previous_result: Optional[Tuple[str, str]] = self.__results.get(report.nodeid)
+        if report.failed and (previous_result is None or previous_result[0] == APIConnector.TEST_STEP_STATUS_PASSED):
+            self.__results[report.nodeid] = (APIConnector.TEST_STEP_STATUS_FAILED, PytestPlugin.__get_message(report))
+        elif report.when == 'call' and report.passed:
+            self.__results.setdefault(report.nodeid, (APIConnector.TEST_STEP_STATUS_PASSED, ''))
+
+        if report.when == 'teardown':
+            result: Optional[Tuple[str, str]] = self.__results.pop(report.nodeid, None)
+            test_case: Optional[Tuple[str, str]] = self.__test_cases.get(self.__external_ids.get(report.nodeid, report.nodeid))
+            if result is not None and test_case is not None:
+                self.__queue.put((test_case[0], test_case[1], result[0], result[1]))
+        self.__overhead['report'] += time.monotonic() - started
+
+    def pytest_sessionfinish(self, session: Session) -> None:
+        started: float = time.monotonic()
+        self.close()
+        self.__overhead['flush'] += time.monotonic() - started
+        if hasattr(session.config, 'workeroutput'):
+            session.config.workeroutput['tbcs_summary'] = self.summary()
+            session.config.workeroutput['tbcs_messages'] = self.get_messages()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        print_summary(terminalreporter, self.summary(), self.get_messages())
+
+    def close(self) -> None:
+        if self.__sender.is_alive():
+            self.__queue.put(None)
+            self.__sender.join()
+        self.__reporter.close()
+
+    def __resolve_shared(self, names: Dict[str, str]) -> None:
+        directory: str = self.__session_directory or SessionTokenStore.DEFAULT_DIRECTORY
+        mapping_path: str = os.path.join(directory, f'run-{self.__run_id}.tests.json')
+        with SessionTokenStore(directory).lock(f'run-{self.__run_id}'):
+            try:
+                with open(mapping_path) as mapping_file:
+                    self.__test_cases = {external_id: tuple(ids) for external_id, ids in json.load(mapping_file).items()}
+            except (OSError, ValueError):
+                self.__test_cases = {}
+            if all(external_id in self.__test_cases for external_id in names):
+                return
+
+            self.__resolve(names)
+            with open(f'{mapping_path}.{os.getpid()}.tmp', 'w') as mapping_file:
+                json.dump(self.__test_cases, mapping_file)
+            os.replace(f'{mapping_path}.{os.getpid()}.tmp', mapping_path)
+
+    def __resolve(self, names: Dict[str, str]) -> None:
+        missing: List[str] = [external_id for external_id in names if external_id not in self.__test_cases]
+        if len(missing) == 0:
+            return
+
+        for _ in self.__connector.prefetch_test_cases():
+            pass
+
+        def resolve(external_id: str) -> Optional[Tuple[str, str]]:
+            try:
+                return self.__get_test_case(external_id, names[external_id])
+            except Exception as error:
+                self.__record_error(f'{external_id} could not be resolved: {getattr(error, "message", str(error))}')
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='tbcs-resolve') as executor:
+            for external_id, test_case in zip(missing, executor.map(resolve, missing)):
+                if test_case is not None:
+                    self.__test_cases[external_id] = test_case
+
+    def __get_test_case(self, external_id: str, name: str) -> Tuple[str, str]:
+        test_case_id, test_step_id, created = self.__connector.get_or_create_test_step(
+            external_id,
+            name,
+            f'Imported from pytest ({external_id})'
+        )
+        if created:
+            with self.__lock:
+                self.__counts['created'] += 1
+        return test_case_id, test_step_id
+
+    def __send(self) -> None:
+        while True:
+            batch: List[Tuple[str, str, str, str]] = []
+            closed: bool = False
+            test_result: Optional[Tuple[str, str, str, str]] = self.__queue.get()
+            while test_result is not None:
+                batch.append(test_result)
+                if len(batch) >= self.__batch_size:
+                    break
+                try:
+                    test_result = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+            if test_result is None:
+                closed = True
+
+            if len(batch) > 0:
+                self.__send_batch(batch)
+            if closed:
+                return
+
+    def __send_batch(self, batch: List[Tuple[str, str, str, str]]) -> None:
+        try:
+            execution_ids: List[str] = self.__connector.start_executions(
+                [test_case_id for test_case_id, _, _, _ in batch],
+                self.__max_workers
+            )
+        except Exception as error:
+            self.__record_error(f'executions could not be started: {getattr(error, "message", str(error))}', len(batch))
+            return
+
+        for (test_case_id, test_step_id, result, message), execution_id in zip(batch, execution_ids):
+            self.__reporter.report_step_result(test_case_id, execution_id, test_step_id, result)
+            with self.__lock:
+                self.__counts['passed' if result == APIConnector.TEST_STEP_STATUS_PASSED else 'failed'] += 1
+            if result == APIConnector.TEST_STEP_STATUS_FAILED:
+                try:
+                    defect_id: str = self.__connector.create_defect(message.splitlines()[0][:200], message)
+                    self.__reporter.assign_defect(test_case_id, execution_id, test_step_id, defect_id)
+                except Exception as error:
+                    self.__record_error(f'defect could not be created: {getattr(error, "message", str(error))}')
+
+    def __record_error(self, message: str, count: int = 1) -> None:
+        with self.__lock:
+            self.__counts['errors'] += count
+            self.__messages.append(message)
+
+    @staticmethod
+    def __get_message(report: TestReport) -> str:
+        message: Optional[str] = getattr(getattr(report.longrepr, 'reprcrash', None), 'message', None)
+        return (message or report.longreprtext or f'{report.when} failed').strip() or f'{report.when} failed'
+
+
+def print_summary(terminalreporter, summary: Dict[str, float], messages: List[str]) -> None:
+    terminalreporter.write_sep('-', 'TestBench CS')
+    terminalreporter.write_line(
+        f'{int(summary["passed"]) + int(summary["failed"])} results reported '
+        f'({int(summary["passed"])} passed, {int(summary["failed"])} failed), '
+        f'{int(summary["created"])} test cases created, {int(summary["errors"])} errors'
+    )
+    terminalreporter.write_line(
+        f'reporting overhead {summary["resolve"] + summary["report"] + summary["flush"]:.2f}s: '
+        f'{summary["resolve"]:.2f}s resolving tests, {summary["report"]:.2f}s handing over results, '
+        f'{summary["flush"]:.2f}s waiting for the sender at session end'
+    )
+    for message in messages:
+        terminalreporter.write_line(message)
+
+
+class ControllerSummary:
+    __summary: Dict[str, float]
+    __messages: List[str]
+
+    def __init__(self):
+        self.__summary = {}
+        self.__messages = []
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error) -> None:
+        for key, value in getattr(node, 'workeroutput', {}).get('tbcs_summary', {}).items():
+            self.__summary[key] = self.__summary.get(key, 0) + value
+        self.__messages += getattr(node, 'workeroutput', {}).get('tbcs_messages', [])
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if len(self.__summary) > 0:
+            print_summary(terminalreporter, self.__summary, self.__messages)
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup('tbcs', 'TestBench CS reporting')
+    group.addoption('--tbcs', action='store_true', default=False, help='report test results to TestBench CS')
+    group.addoption('--tbcs-config', default='tbcs.config.json', help='path of the TestBench CS configuration file')
+    group.addoption('--tbcs-workers', type=int, default=8, help='number of concurrent requests to TestBench CS')
+    group.addoption('--tbcs-session-dir', default=None, help='directory of the session store shared by xdist workers')
+
+
+def pytest_configure(config: Config) -> None:
+    config.addinivalue_line('markers', f'{PytestPlugin.MARKER_NAME}(external_id): external ID of the TestBench CS test case')
+    if not config.getoption('tbcs'):
+        return
+
+    workerinput: Optional[dict] = getattr(config, 'workerinput', None)
+    distributed: bool = workerinput is not None or bool(config.getoption('numprocesses', None))
+    session_directory: str = config.getoption('tbcs_session_dir') or SessionTokenStore.DEFAULT_DIRECTORY
+    connector: APIConnector = APIConnector(
+        config.getoption('tbcs_config'),
+        pool_maxsize=config.getoption('tbcs_workers'),
+        token_store=SessionTokenStore(session_directory) if distributed else None,
+        defect_registry=DefectRegistry()
+    )
+    connector.log_in()
+    if distributed and workerinput is None:
+        config.pluginmanager.register(ControllerSummary(), 'tbcs-controller')
+        return
+
+    config.pluginmanager.register(PytestPlugin(
+        connector,
+        config.getoption('tbcs_workers'),
+        session_directory=session_directory,
+        run_id=workerinput['testrunuid'] if workerinput is not None else None
+    ), 'tbcs')
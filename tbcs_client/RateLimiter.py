@@ -0,0 +1,45 @@
+import threading
+import time
+
+""" Client-side rate limiting for requests against the TestBench CS REST-API
+
+The RateLimiter is a token bucket allowing 'rate' requests per second on average and bursts of up to 'burst'
+requests. 'reserve' takes a token and returns how many seconds the caller has to wait before sending its request,
+so that it can be used from threads ('acquire') as well as from coroutines. Callers are served in the order in
+which they reserved their tokens.
+"""
+
+
+class RateLimiter:
+    __rate: float
+    __burst: float
+    __tokens: float
+    __updated: float
+    __lock: threading.Lock
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.__rate = rate
+        self.__burst = float(burst)
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    def reserve(self) -> float:
+        with self.__lock:
+            now: float = time.monotonic()
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.__rate
+
+    def acquire(self) -> float:
+        delay: float = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,104 @@
+import time
+
+from typing import Optional, Tuple
+
+import requests
+
+from tbcs_client.APIError import APIError
+from tbcs_client.CircuitBreaker import CircuitBreaker
+from tbcs_client.RequestBuilder import Request
+from tbcs_client.RetryPolicy import RetryPolicy
+from tbcs_client.TimingEvent import RequestEvent
+
+""" Decisions of a single call against the TestBench CS REST-API
+
+RequestAttempts holds the state of one call that may be sent several times and decides what happens after each
+attempt, so that APIConnector and AsyncAPIConnector only differ in how they send requests and wait. Before every
+attempt the connector calls 'before_send', which consults the CircuitBreaker. The outcome of the attempt is passed
+to 'on_error' or 'on_response'; both record it with the CircuitBreaker. 'on_error' returns the delay before the
+next attempt, or None if the exception has to be raised. 'on_response' returns what to do next: ACTION_DONE if
+the response is the expected one, ACTION_REAUTHENTICATE once per call after a 401 and ACTION_RETRY together with
+the delay if the RetryPolicy allows another attempt. Any other response raises an APIError.
+
+All delays, including those recorded with 'record_sleep', are summed up for the RequestEvent of the call.
+"""
+
+
+class RequestAttempts:
+    ACTION_DONE: str = 'done'
+    ACTION_REAUTHENTICATE: str = 'reauthenticate'
+    ACTION_RETRY: str = 'retry'
+
+    __request: Request
+    __retry_policy: RetryPolicy
+    __circuit_breaker: Optional[CircuitBreaker]
+    __start: float
+    __attempt: int = 0
+    __requests_sent: int = 0
+    __sleep_time: float = 0.0
+    __reauthenticated: bool = False
+    __response: Optional[requests.Response] = None
+
+    def __init__(
+            self,
+            request: Request,
+            retry_policy: RetryPolicy,
+            circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self.__request = request
+        self.__retry_policy = retry_policy
+        self.__circuit_breaker = circuit_breaker
+        self.__start = time.monotonic()
+
+    def record_sleep(self, delay: float) -> None:
+        self.__sleep_time += delay
+
+    def before_send(self) -> None:
+        self.__attempt += 1
+        if self.__circuit_breaker is not None:
+            self.__circuit_breaker.before_request()
+        self.__requests_sent += 1
+
+    def on_error(self, error: BaseException) -> Optional[float]:
+        if self.__circuit_breaker is not None:
+            self.__circuit_breaker.record_failure()
+        if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return None
+        if not self.__retry_policy.should_retry_error(self.__request.method, self.__attempt):
+            return None
+
+        delay: float = self.__retry_policy.get_delay(self.__attempt)
+        self.__sleep_time += delay
+        return delay
+
+    def on_response(self, response: requests.Response, revalidating: bool = False) -> Tuple[str, float]:
+        self.__response = response
+        if self.__circuit_breaker is not None:
+            if CircuitBreaker.is_failure(response.status_code):
+                self.__circuit_breaker.record_failure()
+            else:
+                self.__circuit_breaker.record_success()
+
+        if response.status_code == self.__request.expected_status_code or (response.status_code == 304 and revalidating):
+            return RequestAttempts.ACTION_DONE, 0.0
+        elif response.status_code == 401 and not self.__reauthenticated:
+            self.__reauthenticated = True
+            self.__attempt -= 1
+            return RequestAttempts.ACTION_REAUTHENTICATE, 0.0
+        elif self.__retry_policy.should_retry_status(self.__request.method, response.status_code, self.__attempt):
+            delay: float = self.__retry_policy.get_delay(self.__attempt, response.headers.get('Retry-After'))
+            self.__sleep_time += delay
+            return RequestAttempts.ACTION_RETRY, delay
+        raise APIError(f'{self.__request.endpoint} failed with message {response.text}')
+
+    def get_event(self, endpoint_template: str) -> RequestEvent:
+        return RequestEvent(
+            self.__request.method,
+            endpoint_template,
+            self.__response.status_code if self.__response is not None else None,
+            len(self.__request.data.encode('utf-8')),
+            len(self.__response.content) if self.__response is not None else 0,
+            time.monotonic() - self.__start,
+            self.__requests_sent - 1,
+            self.__sleep_time
+        )
@@ -0,0 +1,142 @@
+import json
+
+from typing import List, NamedTuple
+
+from tbcs_client.Authenticator import Authenticator
+
+""" Requests against the TestBench CS REST-API
+
+The RequestBuilder creates the requests sent by APIConnector and AsyncAPIConnector, so that both connectors agree
+on endpoints, payloads and expected status codes. A Request holds the HTTP method, the endpoint relative to the
+server address, the status code of a successful response and the request body. Tenant and user ID are taken from
+the Authenticator whenever a request is built, so requests built after a new login use the new session's IDs.
+"""
+
+
+class Request(NamedTuple):
+    method: str
+    endpoint: str
+    expected_status_code: int
+    data: str = ''
+
+
+class RequestBuilder:
+    __authenticator: Authenticator
+    __product_id: str
+
+    def __init__(self, authenticator: Authenticator, product_id: str):
+        self.__authenticator = authenticator
+        self.__product_id = product_id
+
+    @property
+    def __product_endpoint(self) -> str:
+        return f'/api/tenants/{self.__authenticator.tenant_id}/products/{self.__product_id}'
+
+    def create_test_case(self, test_case_name: str, test_case_type: str) -> Request:
+        return Request(
+            'POST',
+            f'{self.__product_endpoint}/specifications/testCases',
+            201,
+            json.dumps({'name': test_case_name, 'testCaseType': test_case_type})
+        )
+
+    def automate_test_case(
+            self,
+            test_case_id: str,
+            test_case_name: str,
+            test_case_description: str,
+            external_id: str
+    ) -> Request:
+        return self.update_test_case(test_case_id, {
+            'name': test_case_name,
+            'description': {'text': test_case_description},
+            'responsibles': [self.__authenticator.user_id],
+            'customFields': [],
+            'isAutomated': True,
+            'toBeReviewed': False,
+            'externalId': {'value': external_id}
+        })
+
+    def update_test_case(self, test_case_id: str, test_case_data: dict) -> Request:
+        return Request(
+            'PATCH',
+            f'{self.__product_endpoint}/specifications/testCases/{test_case_id}',
+            200,
+            json.dumps(test_case_data)
+        )
+
+    def add_test_step(
+            self,
+            test_case_id: str,
+            new_test_step: str,
+            test_block_name: str,
+            previous_test_step_id: str = '-1'
+    ) -> Request:
+        test_step_data: dict = {
+            'testStepBlock': test_block_name,
+            'description': new_test_step
+        }
+        if not previous_test_step_id == '-1':
+            test_step_data['position'] = {
+                'relation': 'After',
+                'testStepId': previous_test_step_id
+            }
+
+        return Request(
+            'POST',
+            f'{self.__product_endpoint}/specifications/testCases/{test_case_id}/testSteps',
+            201,
+            json.dumps(test_step_data)
+        )
+
+    def remove_test_step(self, test_case_id: str, test_step_id: str) -> Request:
+        return Request('DELETE', f'{self.__product_endpoint}/specifications/testCases/{test_case_id}/testSteps/{test_step_id}', 200)
+
+    def get_test_case(self, test_case_id: str) -> Request:
+        return Request('GET', f'{self.__product_endpoint}/specifications/testCases/{test_case_id}', 200)
+
+    def get_test_cases(self, offset: int, limit: int) -> Request:
+        return Request('GET', f'{self.__product_endpoint}/specifications/testCases?offset={offset}&limit={limit}', 200)
+
+    def find_test_cases(self, external_id: str) -> Request:
+        return Request('GET', f'{self.__product_endpoint}/specifications/testCases?fieldValue=externalId:equals:{external_id}', 200)
+
+    def start_execution(self, test_case_id: str) -> Request:
+        return Request('POST', f'{self.__product_endpoint}/executions/testCases/{test_case_id}', 201)
+
+    def get_execution(self, test_case_id: str, execution_id: str) -> Request:
+        return Request('GET', f'{self.__product_endpoint}/executions/testCases/{test_case_id}/executions/{execution_id}', 200)
+
+    def report_step_result(self, test_case_id: str, execution_id: str, test_step_id: str, result: str) -> Request:
+        return Request(
+            'PUT',
+            f'{self.__product_endpoint}/executions/testCases/{test_case_id}/executions/{execution_id}/testSteps/{test_step_id}/result',
+            200,
+            f'"{result}"'
+        )
+
+    def create_defect(self, name: str, message: str) -> Request:
+        return Request(
+            'POST',
+            f'{self.__product_endpoint}/defects',
+            201,
+            json.dumps({'name': f'{name}', 'description': f'{message}'})
+        )
+
+    def get_defects(self, offset: int, limit: int) -> Request:
+        return Request('GET', f'{self.__product_endpoint}/defects?offset={offset}&limit={limit}', 200)
+
+    def assign_defect(self, test_case_id: str, execution_id: str, test_step_id: str, defect_id: str) -> Request:
+        return Request(
+            'POST',
+            f'{self.__product_endpoint}/executions/testCases/{test_case_id}/executions/{execution_id}/testSteps/{test_step_id}/defects',
+            201,
+            f'"{defect_id}"'
+        )
+
+    def journaled_call(self, operation: str, arguments: List[str]) -> Request:
+        if operation == 'create_defect':
+            return self.create_defect(*arguments)
+        elif operation == 'report_step_result':
+            return self.report_step_result(*arguments)
+        return self.assign_defect(*arguments)
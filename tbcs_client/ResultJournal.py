@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+
+from typing import Dict, List, NamedTuple, Optional
+
+""" Append-only on-disk journal of result reporting
+
+A ResultJournal passed to the APIConnector as 'journal' records every call of 'report_step_result',
+'create_defect' and 'assign_defect' before it is sent and marks it as done once TestBench CS accepted it. Calls
+that failed or were never sent because the process died stay pending and can be uploaded later with
+APIConnector.replay_journal, which skips everything that is already done.
+
+With 'deferred' set, the connector only records the calls and returns immediately, so that tests do not wait for
+the server; the results are uploaded by a later 'replay_journal'. As the ID of a deferred defect is not known yet,
+'create_defect' then returns a reference to the journal entry ('journal:<sequence>'), which can be passed to
+'assign_defect' like a defect ID.
+
+The journal is a file of JSON lines that is only ever appended to. Every line is handed to the operating system
+right away, so a crashed process loses nothing; 'fsync_interval' controls how often, in seconds, the file is
+additionally flushed to disk, to protect against a crash of the machine. An incomplete last line, as left by a
+crash during a write, is ignored when the journal is opened again. A journal file must only be used by one
+process at a time.
+"""
+
+
+class JournalEntry(NamedTuple):
+    sequence: int
+    operation: str
+    arguments: List[str]
+
+
+class ResultJournal:
+    REFERENCE_PREFIX: str = 'journal:'
+
+    __path: str
+    __deferred: bool
+    __fsync_interval: float
+    __file: Optional[object] = None
+    __lock: threading.Lock
+    __next_sequence: int = 1
+    __pending: Dict[int, JournalEntry]
+    __results: Dict[int, str]
+    __last_fsync: float
+
+    def __init__(self, path: str, deferred: bool = False, fsync_interval: float = 1.0):
+        self.__path = path
+        self.__deferred = deferred
+        self.__fsync_interval = fsync_interval
+        self.__lock = threading.Lock()
+        self.__pending = {}
+        self.__results = {}
+        self.__load()
+        self.__file = open(path, 'ab')
+        self.__last_fsync = time.monotonic()
+
+    def __enter__(self) -> 'ResultJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def deferred(self) -> bool:
+        return self.__deferred
+
+    def append(self, operation: str, arguments: List[str]) -> int:
+        with self.__lock:
+            sequence: int = self.__next_sequence
+            self.__next_sequence += 1
+            self.__pending[sequence] = JournalEntry(sequence, operation, list(arguments))
+            self.__write({'sequence': sequence, 'operation': operation, 'arguments': list(arguments)})
+            return sequence
+
+    def mark_done(self, sequence: int, result: Optional[str] = None) -> None:
+        with self.__lock:
+            self.__pending.pop(sequence, None)
+            if result is not None:
+                self.__results[sequence] = result
+            self.__write({'done': sequence, 'result': result})
+
+    def get_pending_entries(self) -> List[JournalEntry]:
+        with self.__lock:
+            return sorted(self.__pending.values())
+
+    def get_result(self, sequence: int) -> Optional[str]:
+        with self.__lock:
+            return self.__results.get(sequence)
+
+    def resolve_defect_id(self, defect_id: str) -> Optional[str]:
+        if not defect_id.startswith(ResultJournal.REFERENCE_PREFIX):
+            return defect_id
+        return self.get_result(int(defect_id[len(ResultJournal.REFERENCE_PREFIX):]))
+
+    @staticmethod
+    def get_reference(sequence: int) -> str:
+        return f'{ResultJournal.REFERENCE_PREFIX}{sequence}'
+
+    def flush(self) -> None:
+        with self.__lock:
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is None:
+                return
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__file.close()
+            self.__file = None
+
+    def __write(self, record: dict) -> None:
+        self.__file.write(json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n')
+        self.__file.flush()
+        if time.monotonic() - self.__last_fsync >= self.__fsync_interval:
+            os.fsync(self.__file.fileno())
+            self.__last_fsync = time.monotonic()
+
+    def __load(self) -> None:
+        try:
+            journal_file = open(self.__path, 'rb')
+        except FileNotFoundError:
+            return
+
+        with journal_file:
+            valid_length: int = 0
+            for line in journal_file:
+                try:
+                    record: dict = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                valid_length += len(line)
+                if 'done' in record:
+                    self.__pending.pop(record['done'], None)
+                    if record.get('result') is not None:
+                        self.__results[record['done']] = record['result']
+                else:
+                    self.__pending[record['sequence']] = JournalEntry(record['sequence'], record['operation'], record['arguments'])
+                    self.__next_sequence = max(self.__next_sequence, record['sequence'] + 1)
+
+        if valid_length < os.path.getsize(self.__path):
+            os.truncate(self.__path, valid_length)
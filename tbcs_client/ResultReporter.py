@@ -0,0 +1,144 @@
+import collections
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.APIError import APIError
+
+""" Background reporting of test results to TestBench CS
+
+The ResultReporter queues step results and defect assignments and sends them with a pool of worker threads
+through the given APIConnector, so that calling code does not have to wait for the TestBench CS REST-API.
+Calls for the same execution are sent one after another in the order they have been queued, calls for different
+executions are sent concurrently. If 'max_queue_size' calls are pending, queueing blocks until one of them is done.
+
+Failed calls do not interrupt reporting, they are collected and can be inspected through 'get_failures' and
+'summary'. Call 'flush' to wait for all queued calls and 'close' (or leave the with-block) once you are done.
+"""
+
+
+class ReportFailure(NamedTuple):
+    operation: str
+    arguments: Tuple[str, ...]
+    message: str
+
+
+class ResultReporter:
+    __connector: APIConnector
+    __executor: ThreadPoolExecutor
+    __lanes: Dict[str, Deque[Tuple[str, Callable[..., None], Tuple[str, ...]]]]
+    __condition: threading.Condition
+    __max_queue_size: int
+    __pending: int = 0
+    __submitted: int = 0
+    __failures: List[ReportFailure]
+    __closed: bool = False
+
+    def __init__(self, connector: APIConnector, max_workers: int = 8, max_queue_size: int = 10000):
+        self.__connector = connector
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tbcs-reporter')
+        self.__lanes = {}
+        self.__condition = threading.Condition()
+        self.__max_queue_size = max_queue_size
+        self.__failures = []
+
+    def __enter__(self) -> 'ResultReporter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def report_step_result(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            test_step_id: str,
+            result: str
+    ) -> None:
+        self.__submit(
+            execution_id,
+            'report_step_result',
+            self.__connector.report_step_result,
+            (test_case_id, execution_id, test_step_id, result)
+        )
+
+    def assign_defect(
+            self,
+            test_case_id: str,
+            execution_id: str,
+            test_step_id: str,
+            defect_id: str
+    ) -> None:
+        self.__submit(
+            execution_id,
+            'assign_defect',
+            self.__connector.assign_defect,
+            (test_case_id, execution_id, test_step_id, defect_id)
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__pending == 0, timeout)
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__closed = True
+        self.flush()
+        self.__executor.shutdown(wait=True)
+
+    def get_failures(self) -> List[ReportFailure]:
+        with self.__condition:
+            return list(self.__failures)
+
+    def summary(self) -> Dict[str, int]:
+        with self.__condition:
+            return {
+                'submitted': self.__submitted,
+                'pending': self.__pending,
+                'completed': self.__submitted - self.__pending - len(self.__failures),
+                'failed': len(self.__failures)
+            }
+
+    def __submit(
+            self,
+            execution_id: str,
+            operation: str,
+            call: Callable[..., None],
+            arguments: Tuple[str, ...]
+    ) -> None:
+        with self.__condition:
+            if self.__closed:
+                raise APIError('ResultReporter has already been closed.')
+            self.__condition.wait_for(lambda: self.__pending < self.__max_queue_size)
+            self.__pending += 1
+            self.__submitted += 1
+            lane: Optional[Deque[Tuple[str, Callable[..., None], Tuple[str, ...]]]] = self.__lanes.get(execution_id)
+            if lane is not None:
+                lane.append((operation, call, arguments))
+                return
+            self.__lanes[execution_id] = collections.deque([(operation, call, arguments)])
+        self.__executor.submit(self.__drain, execution_id)
+
+    def __drain(self, execution_id: str) -> None:
+        while True:
+            with self.__condition:
+                lane: Deque[Tuple[str, Callable[..., None], Tuple[str, ...]]] = self.__lanes[execution_id]
+                operation, call, arguments = lane[0]
+
+            failure: Optional[ReportFailure] = None
+            try:
+                call(*arguments)
+            except Exception as error:
+                failure = ReportFailure(operation, arguments, getattr(error, 'message', str(error)))
+
+            with self.__condition:
+                lane.popleft()
+                if failure is not None:
+                    self.__failures.append(failure)
+                self.__pending -= 1
+                self.__condition.notify_all()
+                if len(lane) == 0:
+                    del self.__lanes[execution_id]
+                    return
@@ -0,0 +1,78 @@
+import email.utils
+import random
+import time
+
+from typing import Optional, Tuple
+
+""" Policy for retrying requests against the TestBench CS REST-API
+
+A RetryPolicy decides whether a failed request is sent again and how long to wait before doing so. Requests that
+the server rejected without processing them ('unprocessed_status_codes', e.g. 429 Too Many Requests) are retried
+for all HTTP methods. Other transient failures ('status_codes' and connection errors) are only retried for
+idempotent methods, as a non-idempotent request may already have been processed.
+
+Delays grow exponentially from 'backoff_base' up to 'backoff_max' with random jitter. A 'Retry-After' header sent
+by the server takes precedence, but is capped at 'max_retry_after' seconds. At most 'max_attempts' requests are
+sent per call.
+"""
+
+
+class RetryPolicy:
+    max_attempts: int
+    backoff_base: float
+    backoff_max: float
+    jitter: float
+    max_retry_after: float
+    status_codes: Tuple[int, ...]
+    unprocessed_status_codes: Tuple[int, ...]
+    idempotent_methods: Tuple[str, ...]
+
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            backoff_base: float = 0.2,
+            backoff_max: float = 10.0,
+            jitter: float = 0.5,
+            max_retry_after: float = 60.0,
+            status_codes: Tuple[int, ...] = (429, 502, 503, 504),
+            unprocessed_status_codes: Tuple[int, ...] = (429, 503),
+            idempotent_methods: Tuple[str, ...] = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'PATCH')
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.status_codes = status_codes
+        self.unprocessed_status_codes = unprocessed_status_codes
+        self.idempotent_methods = idempotent_methods
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        if status_code in self.unprocessed_status_codes:
+            return True
+        return status_code in self.status_codes and method.upper() in self.idempotent_methods
+
+    def should_retry_error(self, method: str, attempt: int) -> bool:
+        return attempt < self.max_attempts and method.upper() in self.idempotent_methods
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after is not None:
+            retry_after_delay: Optional[float] = RetryPolicy.parse_retry_after(retry_after)
+            if retry_after_delay is not None:
+                return min(retry_after_delay, self.max_retry_after)
+
+        delay: float = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
+
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> Optional[float]:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,83 @@
+import contextlib
+import hashlib
+import json
+import os
+import time
+
+from typing import Iterator, Optional
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+""" On-disk store for TestBench CS sessions shared between processes
+
+The SessionTokenStore keeps the session token, tenant ID and user ID of a login in a file per server, tenant and
+user, so that several processes using the same account (e.g. pytest-xdist workers) can share one session instead
+of logging in one after another and invalidating each other's sessions. Access to an entry is serialized by an
+exclusive lock on a separate lock file, which the Authenticator holds while it decides whether to reuse the
+stored session or to log in again.
+
+Session files are only readable by the current user, as they grant access to TestBench CS.
+"""
+
+
+class SessionTokenStore:
+    DEFAULT_DIRECTORY: str = os.path.join(os.path.expanduser('~'), '.tbcs_client', 'sessions')
+
+    __directory: str
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY):
+        self.__directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def get_key(base_url: str, tenant_name: str, username: str) -> str:
+        return hashlib.sha256(f'{base_url}|{tenant_name}|{username}'.encode('utf-8')).hexdigest()
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.__get_path(key)) as session_file:
+                session_data: dict = json.load(session_file)
+        except (OSError, ValueError):
+            return None
+
+        if not {'sessionToken', 'tenantId', 'userId'}.issubset(session_data):
+            return None
+        return session_data
+
+    def save(self, key: str, session_data: dict) -> None:
+        temporary_path: str = f'{self.__get_path(key)}.{os.getpid()}.tmp'
+        file_descriptor: int = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, 'w') as session_file:
+            json.dump(dict(session_data, stored=time.time()), session_file)
+        os.replace(temporary_path, self.__get_path(key))
+
+    def remove(self, key: str) -> None:
+        try:
+            os.remove(self.__get_path(key))
+        except FileNotFoundError:
+            pass
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        file_descriptor: int = os.open(f'{self.__get_path(key)}.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.name == 'nt':
+                msvcrt.locking(file_descriptor, msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    os.lseek(file_descriptor, 0, os.SEEK_SET)
+                    msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+        finally:
+            os.close(file_descriptor)
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.__directory, f'{key}.json')
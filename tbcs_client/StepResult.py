@@ -0,0 +1,41 @@
+from typing import Tuple
+
+""" Result of a test step within an execution read from TestBench CS
+
+StepResults are created by Execution when its test step blocks are parsed. Like the other models they use
+'__slots__' to keep the memory footprint of large numbers of instances small.
+"""
+
+
+class StepResult:
+    __slots__ = ('__test_step_id', '__description', '__block_name', '__result', '__defect_ids')
+
+    def __init__(self, test_step_id: str, description: str, block_name: str, result: str, defect_ids: Tuple[str, ...] = ()):
+        self.__test_step_id = test_step_id
+        self.__description = description
+        self.__block_name = block_name
+        self.__result = result
+        self.__defect_ids = defect_ids
+
+    @property
+    def test_step_id(self) -> str:
+        return self.__test_step_id
+
+    @property
+    def description(self) -> str:
+        return self.__description
+
+    @property
+    def block_name(self) -> str:
+        return self.__block_name
+
+    @property
+    def result(self) -> str:
+        return self.__result
+
+    @property
+    def defect_ids(self) -> Tuple[str, ...]:
+        return self.__defect_ids
+
+    def __repr__(self) -> str:
+        return f'StepResult(test_step_id={self.__test_step_id!r}, result={self.__result!r}, defect_ids={self.__defect_ids!r})'
@@ -0,0 +1,164 @@
+import difflib
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from tbcs_client.APIConnector import APIConnector
+from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.TestCase import TestCase
+
+""" Declarative synchronisation of test cases to TestBench CS
+
+The SyncEngine takes the desired state of a suite of test cases as TestCaseSpecs, compares every spec with the
+test case of the same external ID on the server and sends only the changes needed to reach the desired state:
+missing test cases are created, changed names and descriptions are patched in one request, and the test steps of
+every block are aligned with as few deletions and insertions as possible. Steps that are kept in place are not
+touched; a step whose description changed is replaced, as test steps cannot be edited. Blocks that do not
+appear in a spec's 'test_steps' are expected to be empty.
+
+Before comparing, 'sync' lists the test case catalogue of the product once (see APIConnector.prefetch_test_cases),
+so that an unchanged test case costs a single read. Test cases are synchronised in parallel with 'max_workers'
+threads. A failure of one test case does not stop the others, it is reported in the SyncResult of that test case.
+"""
+
+
+class TestCaseSpec(NamedTuple):
+    external_id: str
+    name: str
+    description: str = ''
+    test_steps: Dict[str, List[str]] = {}
+    test_case_type: str = APIConnector.TEST_CASE_TYPE_STRUCTURED
+
+
+class SyncResult(NamedTuple):
+    external_id: str
+    test_case_id: Optional[str]
+    action: str
+    changed_fields: List[str]
+    added_test_steps: int
+    removed_test_steps: int
+    message: Optional[str] = None
+
+
+class SyncEngine:
+    ACTION_CREATED: str = 'created'
+    ACTION_UPDATED: str = 'updated'
+    ACTION_UNCHANGED: str = 'unchanged'
+    ACTION_FAILED: str = 'failed'
+
+    __connector: APIConnector
+    __max_workers: int
+
+    def __init__(self, connector: APIConnector, max_workers: int = 8):
+        self.__connector = connector
+        self.__max_workers = max_workers
+
+    def sync(self, specs: List[TestCaseSpec], prefetch: bool = True) -> List[SyncResult]:
+        if prefetch:
+            for _ in self.__connector.prefetch_test_cases():
+                pass
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='tbcs-sync') as executor:
+            return list(executor.map(self.__sync_test_case, specs))
+
+    @staticmethod
+    def summary(results: List[SyncResult]) -> Dict[str, int]:
+        counts: Dict[str, int] = {
+            action: 0 for action in
+            [SyncEngine.ACTION_CREATED, SyncEngine.ACTION_UPDATED, SyncEngine.ACTION_UNCHANGED, SyncEngine.ACTION_FAILED]
+        }
+        for result in results:
+            counts[result.action] += 1
+        counts['added_test_steps'] = sum(result.added_test_steps for result in results)
+        counts['removed_test_steps'] = sum(result.removed_test_steps for result in results)
+        return counts
+
+    @staticmethod
+    def plan_test_steps(
+            existing_test_steps: List[Tuple[str, str]],
+            new_test_steps: List[str]
+    ) -> Tuple[List[str], List[Tuple[str, List[str]]]]:
+        matcher: difflib.SequenceMatcher = difflib.SequenceMatcher(
+            a=[description for _, description in existing_test_steps],
+            b=new_test_steps,
+            autojunk=False
+        )
+        kept_indices: Dict[int, int] = {
+            new_index + offset: existing_index + offset
+            for existing_index, new_index, size in matcher.get_matching_blocks()
+            for offset in range(size)
+        }
+        if len(kept_indices) > 0 and 0 not in kept_indices:
+            return [test_step_id for test_step_id, _ in existing_test_steps], [('-1', new_test_steps)] if len(new_test_steps) > 0 else []
+
+        kept_test_step_ids: Set[str] = {existing_test_steps[existing_index][0] for existing_index in kept_indices.values()}
+        removed_test_step_ids: List[str] = [
+            test_step_id for test_step_id, _ in existing_test_steps if test_step_id not in kept_test_step_ids
+        ]
+        insertions: List[Tuple[str, List[str]]] = []
+        previous_test_step_id: str = '-1'
+        for new_index, description in enumerate(new_test_steps):
+            if new_index in kept_indices:
+                previous_test_step_id = existing_test_steps[kept_indices[new_index]][0]
+            elif len(insertions) > 0 and insertions[-1][0] == previous_test_step_id:
+                insertions[-1][1].append(description)
+            else:
+                insertions.append((previous_test_step_id, [description]))
+        return removed_test_step_ids, insertions
+
+    def __sync_test_case(self, spec: TestCaseSpec) -> SyncResult:
+        test_case_id: Optional[str] = None
+        try:
+            for test_block_name in spec.test_steps:
+                APIConnector.get_test_block_index_by_name(test_block_name)
+            try:
+                test_case: TestCase = self.__connector.get_test_case_model_by_external_id(spec.external_id)
+            except ItemNotFoundError:
+                test_case_id = self.__connector.create_test_case(spec.name, spec.description, spec.test_case_type, spec.external_id)
+                added_test_steps: int = 0
+                for test_block_name, test_steps in spec.test_steps.items():
+                    if len(test_steps) > 0:
+                        self.__connector.add_test_steps(test_case_id, test_steps, test_block_name)
+                        added_test_steps += len(test_steps)
+                return SyncResult(spec.external_id, test_case_id, SyncEngine.ACTION_CREATED, [], added_test_steps, 0)
+
+            test_case_id = test_case.id
+            changed_fields: List[str] = []
+            if not test_case.name == spec.name:
+                changed_fields.append('name')
+            if not test_case.description == spec.description:
+                changed_fields.append('description')
+            if len(changed_fields) > 0:
+                self.__connector.update_test_case(
+                    test_case_id,
+                    spec.name if 'name' in changed_fields else None,
+                    spec.description if 'description' in changed_fields else None
+                )
+
+            removed_test_step_ids: List[str] = []
+            insertions: List[Tuple[str, str, List[str]]] = []
+            for test_block_name in test_case.block_names:
+                block_removals, block_insertions = SyncEngine.plan_test_steps(
+                    [(test_step.id, test_step.description) for test_step in test_case.get_test_steps(test_block_name)],
+                    spec.test_steps.get(test_block_name, [])
+                )
+                removed_test_step_ids += block_removals
+                insertions += [(test_block_name, previous_test_step_id, test_steps) for previous_test_step_id, test_steps in block_insertions]
+
+            if len(removed_test_step_ids) > 0:
+                self.__connector.remove_test_steps(test_case_id, removed_test_step_ids)
+            for test_block_name, previous_test_step_id, test_steps in insertions:
+                self.__connector.add_test_steps(test_case_id, test_steps, test_block_name, previous_test_step_id)
+
+            added_test_steps = sum(len(test_steps) for _, _, test_steps in insertions)
+            changed: bool = len(changed_fields) > 0 or len(removed_test_step_ids) > 0 or added_test_steps > 0
+            return SyncResult(
+                spec.external_id,
+                test_case_id,
+                SyncEngine.ACTION_UPDATED if changed else SyncEngine.ACTION_UNCHANGED,
+                changed_fields,
+                added_test_steps,
+                len(removed_test_step_ids)
+            )
+        except Exception as error:
+            return SyncResult(spec.external_id, test_case_id, SyncEngine.ACTION_FAILED, [], 0, 0, getattr(error, 'message', str(error)))
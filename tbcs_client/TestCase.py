@@ -0,0 +1,110 @@
+import json
+import sys
+
+from typing import Dict, Optional, Tuple, Union
+
+from tbcs_client.ItemNotFoundError import ItemNotFoundError
+from tbcs_client.TestStep import TestStep
+
+""" Test case read from TestBench CS
+
+A TestCase is created from the JSON document returned by the REST-API, either as text or as already parsed dict.
+Text is only parsed when an attribute is accessed for the first time; the parsed document is then reduced to
+the fields below and dropped, so that holding many test cases in memory costs far less than holding their
+documents. Test steps are kept as TestSteps per block and can be looked up by ID and by block name.
+"""
+
+
+class TestCase:
+    __test__: bool = False
+    __slots__ = (
+        '__document',
+        '__id',
+        '__name',
+        '__description',
+        '__external_id',
+        '__test_case_type',
+        '__is_automated',
+        '__test_step_blocks',
+        '__test_steps'
+    )
+
+    def __init__(self, document: Union[str, bytes, dict]):
+        self.__document = document
+
+    @property
+    def id(self) -> str:
+        self.__parse()
+        return self.__id
+
+    @property
+    def name(self) -> str:
+        self.__parse()
+        return self.__name
+
+    @property
+    def description(self) -> str:
+        self.__parse()
+        return self.__description
+
+    @property
+    def external_id(self) -> str:
+        self.__parse()
+        return self.__external_id
+
+    @property
+    def test_case_type(self) -> Optional[str]:
+        self.__parse()
+        return self.__test_case_type
+
+    @property
+    def is_automated(self) -> bool:
+        self.__parse()
+        return self.__is_automated
+
+    @property
+    def block_names(self) -> Tuple[str, ...]:
+        self.__parse()
+        return tuple(self.__test_step_blocks)
+
+    def get_test_steps(self, block_name: Optional[str] = None) -> Tuple[TestStep, ...]:
+        self.__parse()
+        if block_name is None:
+            return tuple(test_step for test_steps in self.__test_step_blocks.values() for test_step in test_steps)
+        if block_name not in self.__test_step_blocks:
+            raise ItemNotFoundError(f'No test step block found with name: {block_name}')
+        return self.__test_step_blocks[block_name]
+
+    def get_test_step(self, test_step_id: str) -> TestStep:
+        self.__parse()
+        test_step: Optional[TestStep] = self.__test_steps.get(str(test_step_id))
+        if test_step is None:
+            raise ItemNotFoundError(f'No test step found with ID: {test_step_id}')
+        return test_step
+
+    def __repr__(self) -> str:
+        return f'TestCase(id={self.id!r}, name={self.name!r}, external_id={self.external_id!r})'
+
+    def __parse(self) -> None:
+        if self.__document is None:
+            return
+
+        document: dict = json.loads(self.__document) if isinstance(self.__document, (str, bytes)) else self.__document
+        description: Union[str, dict, None] = document.get('description')
+        self.__id = str(document['id'])
+        self.__name = document.get('name') or ''
+        self.__description = (description.get('text') if isinstance(description, dict) else description) or ''
+        self.__external_id = (document.get('automation') or {}).get('externalId') or ''
+        self.__test_case_type = document.get('testCaseType')
+        self.__is_automated = bool(document.get('isAutomated'))
+        self.__test_step_blocks: Dict[str, Tuple[TestStep, ...]] = {}
+        self.__test_steps: Dict[str, TestStep] = {}
+        for test_step_block in (document.get('testSequence') or {}).get('testStepBlocks', []):
+            block_name: str = sys.intern(test_step_block['name'])
+            test_steps: Tuple[TestStep, ...] = tuple(
+                TestStep(str(test_step['id']), test_step.get('description') or '', block_name)
+                for test_step in test_step_block.get('steps', [])
+            )
+            self.__test_step_blocks[block_name] = test_steps
+            self.__test_steps.update((test_step.id, test_step) for test_step in test_steps)
+        self.__document = None
@@ -0,0 +1,122 @@
+import collections
+import json
+import threading
+import time
+
+from typing import Dict, Optional, OrderedDict, Tuple
+
+""" In-process cache for test cases read from the TestBench CS REST-API
+
+The TestCaseCache holds up to 'max_size' test case documents keyed by their ID. Entries are evicted in least
+recently used order and expire 'ttl' seconds after they have been stored. Documents are kept in their serialized
+form, so every lookup hands out a fresh copy that callers may modify freely. Additionally an index from external
+ID to test case ID is kept, so that resolving a test case by its external ID does not need a search request.
+
+Pass an instance to the APIConnector to enable caching. The connector updates the cache on every read and
+invalidates or patches entries on its own writes; changes made by other clients become visible after 'ttl'.
+Reads pass the 'generation' of the test case taken before their request to 'put', so that a document read before
+a concurrent invalidation or patch is not stored over it.
+"""
+
+
+class TestCaseCache:
+    __test__: bool = False
+
+    __max_size: int
+    __ttl: float
+    __documents: OrderedDict[str, Tuple[float, str]]
+    __external_ids: Dict[str, Tuple[float, str]]
+    __generations: Dict[str, int]
+    __lock: threading.Lock
+    __hits: int = 0
+    __misses: int = 0
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0):
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__documents = collections.OrderedDict()
+        self.__external_ids = {}
+        self.__generations = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__documents)
+
+    def get(self, test_case_id: str) -> Optional[dict]:
+        document: Optional[str] = self.get_document(test_case_id)
+        return json.loads(document) if document is not None else None
+
+    def get_document(self, test_case_id: str) -> Optional[str]:
+        with self.__lock:
+            entry: Optional[Tuple[float, str]] = self.__documents.get(test_case_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.__documents[test_case_id]
+                self.__misses += 1
+                return None
+            self.__documents.move_to_end(test_case_id)
+            self.__hits += 1
+            return entry[1]
+
+    def get_generation(self, test_case_id: str) -> int:
+        with self.__lock:
+            return self.__generations.get(test_case_id, 0)
+
+    def put(self, test_case_id: str, document: str, generation: Optional[int] = None) -> None:
+        expires: float = time.monotonic() + self.__ttl
+        external_id: Optional[str] = json.loads(document).get('automation', {}).get('externalId')
+        with self.__lock:
+            if generation is not None and not generation == self.__generations.get(test_case_id, 0):
+                return
+            self.__documents[test_case_id] = (expires, document)
+            self.__documents.move_to_end(test_case_id)
+            while len(self.__documents) > self.__max_size:
+                self.__documents.popitem(last=False)
+            if external_id:
+                self.__external_ids[external_id] = (expires, test_case_id)
+
+    def patch(self, test_case_id: str, changes: dict) -> None:
+        with self.__lock:
+            self.__generations[test_case_id] = self.__generations.get(test_case_id, 0) + 1
+            entry: Optional[Tuple[float, str]] = self.__documents.get(test_case_id)
+            if entry is None:
+                return
+            document: dict = json.loads(entry[1])
+            document.update(changes)
+            self.__documents[test_case_id] = (entry[0], json.dumps(document))
+
+    def invalidate(self, test_case_id: str) -> None:
+        with self.__lock:
+            self.__generations[test_case_id] = self.__generations.get(test_case_id, 0) + 1
+            self.__documents.pop(test_case_id, None)
+
+    def get_test_case_id(self, external_id: str) -> Optional[str]:
+        with self.__lock:
+            entry: Optional[Tuple[float, str]] = self.__external_ids.get(external_id)
+            if entry is None or entry[0] < time.monotonic():
+                self.__external_ids.pop(external_id, None)
+                return None
+            return entry[1]
+
+    def put_test_case_id(self, external_id: str, test_case_id: str) -> None:
+        with self.__lock:
+            self.__external_ids[external_id] = (time.monotonic() + self.__ttl, test_case_id)
+
+    def invalidate_test_case_id(self, external_id: str) -> None:
+        with self.__lock:
+            self.__external_ids.pop(external_id, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__documents.clear()
+            self.__external_ids.clear()
+            self.__hits = 0
+            self.__misses = 0
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+import time
+
+from typing import Dict, Optional
+
+""" Local index of the test cases of a product
+
+The TestCaseIndex maps external IDs and names of test cases to their IDs. It is filled by
+APIConnector.prefetch_test_cases, which walks the whole test case catalogue of a product, and is used to resolve
+test cases without a search request. Entries never expire; the connector removes entries that turn out to point
+to test cases that no longer exist.
+
+An index can be saved to and loaded from a JSON snapshot, which records when the catalogue was read and for which
+server and product, so that following processes can start with a warm index.
+"""
+
+
+class TestCaseIndex:
+    __test__: bool = False
+
+    __external_ids: Dict[str, str]
+    __names: Dict[str, str]
+    __timestamp: Optional[float] = None
+    __lock: threading.Lock
+
+    def __init__(self):
+        self.__external_ids = {}
+        self.__names = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        return self.__timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp: Optional[float]) -> None:
+        self.__timestamp = timestamp
+
+    def __len__(self) -> int:
+        return len(self.__external_ids)
+
+    def add(self, test_case_id: str, name: Optional[str] = None, external_id: Optional[str] = None) -> None:
+        with self.__lock:
+            if external_id:
+                self.__external_ids[external_id] = test_case_id
+            if name:
+                self.__names[name] = test_case_id
+
+    def remove(self, test_case_id: str) -> None:
+        with self.__lock:
+            self.__external_ids = {key: value for key, value in self.__external_ids.items() if not value == test_case_id}
+            self.__names = {key: value for key, value in self.__names.items() if not value == test_case_id}
+
+    def get_test_case_id_by_external_id(self, external_id: str) -> Optional[str]:
+        return self.__external_ids.get(external_id)
+
+    def get_test_case_id_by_name(self, name: str) -> Optional[str]:
+        return self.__names.get(name)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__external_ids = {}
+            self.__names = {}
+            self.__timestamp = None
+
+    def save(self, snapshot_path: str, server_address: str, product_id: str) -> None:
+        with self.__lock:
+            snapshot: dict = {
+                'server_address': server_address,
+                'product_id': str(product_id),
+                'timestamp': self.__timestamp,
+                'external_ids': dict(self.__external_ids),
+                'names': dict(self.__names)
+            }
+        temporary_path: str = f'{snapshot_path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as snapshot_file:
+            json.dump(snapshot, snapshot_file)
+        os.replace(temporary_path, snapshot_path)
+
+    def load(self, snapshot_path: str, server_address: str, product_id: str, max_age: Optional[float] = None) -> bool:
+        try:
+            with open(snapshot_path) as snapshot_file:
+                snapshot: dict = json.load(snapshot_file)
+        except (OSError, ValueError):
+            return False
+
+        if not (snapshot.get('server_address') == server_address and snapshot.get('product_id') == str(product_id)):
+            return False
+        if snapshot.get('timestamp') is None:
+            return False
+        if max_age is not None and time.time() - snapshot['timestamp'] > max_age:
+            return False
+
+        with self.__lock:
+            self.__external_ids = snapshot['external_ids']
+            self.__names = snapshot['names']
+            self.__timestamp = snapshot['timestamp']
+        return True
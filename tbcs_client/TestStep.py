@@ -0,0 +1,30 @@
+""" Test step of a test case read from TestBench CS
+
+TestSteps are created by TestCase when its test step blocks are parsed. Like the other models they use
+'__slots__' to keep the memory footprint of large numbers of instances small.
+"""
+
+
+class TestStep:
+    __test__: bool = False
+    __slots__ = ('__id', '__description', '__block_name')
+
+    def __init__(self, test_step_id: str, description: str, block_name: str):
+        self.__id = test_step_id
+        self.__description = description
+        self.__block_name = block_name
+
+    @property
+    def id(self) -> str:
+        return self.__id
+
+    @property
+    def description(self) -> str:
+        return self.__description
+
+    @property
+    def block_name(self) -> str:
+        return self.__block_name
+
+    def __repr__(self) -> str:
+        return f'TestStep(id={self.__id!r}, description={self.__description!r}, block_name={self.__block_name!r})'
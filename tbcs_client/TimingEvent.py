@@ -0,0 +1,31 @@
+from typing import NamedTuple, Optional
+
+""" Timing events emitted by the connectors
+
+A RequestEvent is emitted once per call against the TestBench CS REST-API. 'endpoint' is the endpoint template
+(e.g. '/api/tenants/{tenantId}/products/{productId}/defects') rather than the expanded URL, so that events can be
+grouped per endpoint. 'duration' covers the whole call including retries, 'sleep_time' is the part of it spent
+waiting for backoff delays and the rate limiter. 'status_code' is None if no response has been received.
+
+A WaitEvent is emitted once per persistence check of a write operation; 'sleep_time' is the part of its
+'duration' spent sleeping between two checks.
+"""
+
+
+class RequestEvent(NamedTuple):
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    bytes_sent: int
+    bytes_received: int
+    duration: float
+    retries: int
+    sleep_time: float
+
+
+class WaitEvent(NamedTuple):
+    operation: str
+    duration: float
+    checks: int
+    sleep_time: float
+    persisted: bool
@@ -0,0 +1,90 @@
+import collections
+import email.utils
+import threading
+import time
+
+from typing import Optional, OrderedDict, Tuple
+
+import requests
+
+""" Short-lived cache of validators for conditional GET requests
+
+The ValidatorCache keeps the last response of up to 'max_size' GET endpoints whose response carried an 'ETag' or
+'Last-Modified' header, for 'ttl' seconds after it has been downloaded. Passed to the APIConnector as
+'validator_cache', further GETs of these endpoints are sent with 'If-None-Match'/'If-Modified-Since', and if the
+server answers 304 Not Modified the kept response is returned instead of downloading the unchanged document again.
+Endpoints without validators are not cached, so the cache never answers a request on its own.
+
+As HTTP dates have a resolution of one second, 'If-Modified-Since' is only sent for responses whose 'Date' is at
+least one second after their 'Last-Modified'; otherwise a write within the same second would go unnoticed.
+"""
+
+
+class ValidatorCache:
+    __max_size: int
+    __ttl: float
+    __responses: OrderedDict[str, Tuple[float, requests.Response]]
+    __lock: threading.Lock
+    __revalidated: int = 0
+
+    def __init__(self, max_size: int = 1000, ttl: float = 60.0):
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__responses = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def revalidated(self) -> int:
+        return self.__revalidated
+
+    def __len__(self) -> int:
+        return len(self.__responses)
+
+    def get(self, endpoint: str) -> Optional[requests.Response]:
+        with self.__lock:
+            entry: Optional[Tuple[float, requests.Response]] = self.__responses.get(endpoint)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.__responses[endpoint]
+                return None
+            self.__responses.move_to_end(endpoint)
+            return entry[1]
+
+    def put(self, endpoint: str, response: requests.Response) -> None:
+        if len(ValidatorCache.get_conditional_headers(response)) == 0:
+            with self.__lock:
+                self.__responses.pop(endpoint, None)
+            return
+
+        with self.__lock:
+            self.__responses[endpoint] = (time.monotonic() + self.__ttl, response)
+            self.__responses.move_to_end(endpoint)
+            while len(self.__responses) > self.__max_size:
+                self.__responses.popitem(last=False)
+
+    def record_revalidation(self, endpoint: str) -> None:
+        with self.__lock:
+            self.__revalidated += 1
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__responses.clear()
+
+    @staticmethod
+    def get_conditional_headers(response: requests.Response) -> dict:
+        headers: dict = {}
+        if 'ETag' in response.headers:
+            headers['If-None-Match'] = response.headers['ETag']
+        elif 'Last-Modified' in response.headers and ValidatorCache.is_strong_date(response):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+
+    @staticmethod
+    def is_strong_date(response: requests.Response) -> bool:
+        try:
+            last_modified: float = email.utils.parsedate_to_datetime(response.headers['Last-Modified']).timestamp()
+            date: float = email.utils.parsedate_to_datetime(response.headers['Date']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return False
+        return date - last_modified >= 1.0
@@ -0,0 +1,82 @@
+import abc
+import random
+import time
+
+from typing import Iterator
+
+""" Policies for waiting on data written to the TestBench CS REST-API to be persisted
+
+Write calls of the APIConnector read the written item back until the server reports it as persisted. A wait
+policy decides how long to sleep before each of these checks and when to give up. 'delays' yields the number of
+seconds to sleep before the next check and stops once the deadline of the policy is reached. Policies with
+'verify' set to False make the connector skip the read back completely.
+"""
+
+
+class WaitPolicy(abc.ABC):
+    verify: bool = True
+    timeout: float = 30.0
+
+    @abc.abstractmethod
+    def delays(self) -> Iterator[float]:
+        pass
+
+
+class FixedIntervalWaitPolicy(WaitPolicy):
+    """ Checks immediately and then once per 'interval' seconds until 'timeout' seconds have passed. """
+
+    def __init__(self, interval: float = 1.0, timeout: float = 30.0):
+        self.interval = interval
+        self.timeout = timeout
+
+    def delays(self) -> Iterator[float]:
+        deadline: float = time.monotonic() + self.timeout
+        yield 0.0
+        while True:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(self.interval, remaining)
+
+
+class ExponentialBackoffWaitPolicy(WaitPolicy):
+    """ Checks immediately, then backs off exponentially starting at 'first_delay' seconds.
+
+    Each delay is multiplied by 'multiplier', capped at 'max_delay' and reduced by a random share of up to
+    'jitter' of its length, so that many waiting callers do not poll the server in lock step.
+    """
+
+    def __init__(
+            self,
+            first_delay: float = 0.05,
+            multiplier: float = 2.0,
+            max_delay: float = 2.0,
+            jitter: float = 0.5,
+            timeout: float = 30.0
+    ):
+        self.first_delay = first_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.timeout = timeout
+
+    def delays(self) -> Iterator[float]:
+        deadline: float = time.monotonic() + self.timeout
+        yield 0.0
+        delay: float = self.first_delay
+        while True:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(delay * (1 - self.jitter * random.random()), remaining)
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+class NoVerificationWaitPolicy(WaitPolicy):
+    """ Trusts the status code of the write request and never reads written data back. """
+
+    verify: bool = False
+    timeout: float = 0.0
+
+    def delays(self) -> Iterator[float]:
+        return iter(())
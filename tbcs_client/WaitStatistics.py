@@ -0,0 +1,58 @@
+import collections
+import threading
+
+from typing import Deque, Dict, List, NamedTuple
+
+""" Statistics on the time spent waiting for written data to be persisted
+
+Every persistence check of a connector is recorded as a WaitRecord holding the name of the operation, the time
+spent until the check succeeded or timed out, the number of reads sent and whether the data was persisted in time.
+The most recent records are kept for inspection, 'summary' aggregates all records per operation.
+"""
+
+
+class WaitRecord(NamedTuple):
+    operation: str
+    duration: float
+    checks: int
+    persisted: bool
+
+
+class WaitStatistics:
+    __records: Deque[WaitRecord]
+    __totals: Dict[str, Dict[str, float]]
+    __lock: threading.Lock
+
+    def __init__(self, max_records: int = 10000):
+        self.__records = collections.deque(maxlen=max_records)
+        self.__totals = {}
+        self.__lock = threading.Lock()
+
+    def record(self, operation: str, duration: float, checks: int, persisted: bool) -> None:
+        with self.__lock:
+            self.__records.append(WaitRecord(operation, duration, checks, persisted))
+            totals: Dict[str, float] = self.__totals.setdefault(
+                operation,
+                {'count': 0, 'total_duration': 0.0, 'max_duration': 0.0, 'checks': 0, 'timeouts': 0}
+            )
+            totals['count'] += 1
+            totals['total_duration'] += duration
+            totals['max_duration'] = max(totals['max_duration'], duration)
+            totals['checks'] += checks
+            totals['timeouts'] += 0 if persisted else 1
+
+    def get_records(self) -> List[WaitRecord]:
+        with self.__lock:
+            return list(self.__records)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self.__lock:
+            return {
+                operation: dict(totals, mean_duration=totals['total_duration'] / totals['count'])
+                for operation, totals in self.__totals.items()
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__records.clear()
+            self.__totals.clear()
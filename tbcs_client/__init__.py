@@ -1,3 +1,29 @@
 from .APIConnector import APIConnector
+from .AsyncAPIConnector import AsyncAPIConnector
 from .ItemNotFoundError import ItemNotFoundError
-from .APIError import APIError
\ No newline at end of file
+from .APIError import APIError
+from .WaitPolicy import WaitPolicy, FixedIntervalWaitPolicy, ExponentialBackoffWaitPolicy, NoVerificationWaitPolicy
+from .WaitStatistics import WaitStatistics, WaitRecord
+from .TestCaseCache import TestCaseCache
+from .TestCaseIndex import TestCaseIndex
+from .ResultReporter import ResultReporter, ReportFailure
+from .Authenticator import Authenticator
+from .KeepAliveHTTPAdapter import KeepAliveHTTPAdapter
+from .SessionTokenStore import SessionTokenStore
+from .RetryPolicy import RetryPolicy
+from .RateLimiter import RateLimiter
+from .CircuitBreaker import CircuitBreaker
+from .TimingEvent import RequestEvent, WaitEvent
+from .LatencyAggregator import LatencyAggregator
+from .SyncEngine import SyncEngine, TestCaseSpec, SyncResult
+from .ResultJournal import ResultJournal, JournalEntry
+from .DefectRegistry import DefectRegistry
+from .JUnitUploader import JUnitUploader, JUnitTestCase
+from .TestCase import TestCase
+from .TestStep import TestStep
+from .Execution import Execution
+from .StepResult import StepResult
+from .ConnectorPool import ConnectorPool
+from .ValidatorCache import ValidatorCache
+from .RequestBuilder import RequestBuilder, Request
+from .RequestAttempts import RequestAttempts
\ No newline at end of file
@@ -0,0 +1,424 @@
+import email.utils
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Match, Optional, Tuple
+
+""" In-process stand-in for the TestBench CS REST-API
+
+The FakeTBCSServer implements the endpoints used by the connectors of this package (login, test cases, test
+steps, executions, step results and defects) on top of in-memory data, so that the client can be tested and
+benchmarked without network access or a TestBench CS tenant.
+
+The server can be made to behave like a real one under load:
+- 'latency' adds a fixed delay in seconds to every request.
+- 'commit_lag' delays the visibility of every write for reads by the given number of seconds.
+- 'error_rate' lets the given share of requests (except logins) fail with one of 'error_status_codes';
+  'inject_errors' queues status codes that are returned for the next requests.
+- 'expire_sessions' invalidates all issued session tokens.
+
+Successful GET responses carry an 'ETag' and are answered with 304 Not Modified if it is sent as 'If-None-Match'.
+With 'validator' set to 'Last-Modified', they carry 'Last-Modified' (the second in which the document was first
+served in its current form) and 'Date' instead and are compared with 'If-Modified-Since', at one second resolution
+as HTTP dates are.
+
+Use it as context manager and create connectors from the configuration file written by 'write_config'. All
+received requests are recorded in 'request_log'. Further products given as 'product_ids' share the data of the
+first one.
+"""
+
+
+class FakeTBCSServer:
+    TENANT_ID: int = 1
+    USER_ID: int = 1
+    TEST_BLOCK_NAMES: List[str] = ['Preparation', 'Navigation', 'Test', 'ResultCheck', 'CleanUp']
+    TEST_CASE_TYPES: List[str] = ['SimpleTestCase', 'StructuredTestCase', 'CheckListTestCase']
+
+    latency: float
+    commit_lag: float
+    error_rate: float
+    error_status_codes: Tuple[int, ...]
+    validator: str
+    test_cases: Dict[int, dict]
+    executions: Dict[int, dict]
+    defects: Dict[int, dict]
+    request_log: List[Tuple[str, str]]
+
+    __product_id: int
+    __http_server: Optional[ThreadingHTTPServer] = None
+    __lock: threading.Lock
+    __ids: Iterator[int]
+    __session_tokens: set
+    __known_test_case_ids: set
+    __pending_writes: List[Tuple[float, Callable[[], None]]]
+    __injected_errors: List[int]
+    __random: random.Random
+    __first_served: Dict[str, float]
+    __routes: List[Tuple[str, re.Pattern, Callable[[Match, str, str], Tuple[int, object]]]]
+
+    def __init__(
+            self,
+            product_id: int = 1,
+            latency: float = 0.0,
+            commit_lag: float = 0.0,
+            error_rate: float = 0.0,
+            error_status_codes: Tuple[int, ...] = (503,),
+            seed: Optional[int] = None,
+            product_ids: Tuple[int, ...] = (),
+            validator: str = 'ETag'
+    ):
+        self.latency = latency
+        self.commit_lag = commit_lag
+        self.error_rate = error_rate
+        self.error_status_codes = error_status_codes
+        self.validator = validator
+        self.test_cases = {}
+        self.executions = {}
+        self.defects = {}
+        self.request_log = []
+        self.__product_id = product_id
+        self.__lock = threading.Lock()
+        self.__ids = itertools.count(1)
+        self.__session_tokens = set()
+        self.__known_test_case_ids = set()
+        self.__pending_writes = []
+        self.__injected_errors = []
+        self.__random = random.Random(seed)
+        self.__first_served = {}
+
+        product: str = f'/api/tenants/{FakeTBCSServer.TENANT_ID}/products/(?:{"|".join(str(product) for product in (product_id,) + product_ids)})'
+        self.__routes = [
+            ('GET', re.compile(f'{product}/specifications/testCases'), self.__list_test_cases),
+            ('POST', re.compile(f'{product}/specifications/testCases'), self.__create_test_case),
+            ('GET', re.compile(f'{product}/specifications/testCases/(\\d+)'), self.__get_test_case),
+            ('PATCH', re.compile(f'{product}/specifications/testCases/(\\d+)'), self.__update_test_case),
+            ('POST', re.compile(f'{product}/specifications/testCases/(\\d+)/testSteps'), self.__add_test_step),
+            ('DELETE', re.compile(f'{product}/specifications/testCases/(\\d+)/testSteps/(\\d+)'), self.__remove_test_step),
+            ('POST', re.compile(f'{product}/executions/testCases/(\\d+)'), self.__start_execution),
+            ('GET', re.compile(f'{product}/executions/testCases/(\\d+)/executions/(\\d+)'), self.__get_execution),
+            ('PUT', re.compile(f'{product}/executions/testCases/(\\d+)/executions/(\\d+)/testSteps/(\\d+)/result'), self.__report_step_result),
+            ('POST', re.compile(f'{product}/executions/testCases/(\\d+)/executions/(\\d+)/testSteps/(\\d+)/defects'), self.__assign_defect),
+            ('GET', re.compile(f'{product}/defects'), self.__list_defects),
+            ('POST', re.compile(f'{product}/defects'), self.__create_defect)
+        ]
+
+    def __enter__(self) -> 'FakeTBCSServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.__http_server.server_port}'
+
+    @property
+    def login_count(self) -> int:
+        return self.get_request_count('POST', '/api/tenants/login/session')
+
+    def start(self) -> None:
+        self.__http_server = ThreadingHTTPServer(('127.0.0.1', 0), FakeTBCSServer.__create_handler(self))
+        self.__http_server.daemon_threads = True
+        threading.Thread(target=self.__http_server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def stop(self) -> None:
+        self.__http_server.shutdown()
+        self.__http_server.server_close()
+
+    def write_config(self, config_path: str, product_id: Optional[int] = None) -> str:
+        with open(config_path, 'w') as config_file:
+            json.dump({
+                'server_address': self.base_url,
+                'tenant_name': 'faketenant',
+                'product_id': product_id if product_id is not None else self.__product_id,
+                'tenant_user': 'fakeuser',
+                'password': 'fakepassword',
+                'use_system_proxy': False,
+                'truststore_path': True
+            }, config_file)
+        return config_path
+
+    def inject_errors(self, *status_codes: int) -> None:
+        with self.__lock:
+            self.__injected_errors.extend(status_codes)
+
+    def expire_sessions(self) -> None:
+        with self.__lock:
+            self.__session_tokens.clear()
+
+    def get_request_count(self, method: Optional[str] = None, path_pattern: Optional[str] = None) -> int:
+        with self.__lock:
+            return len([
+                request for request in self.request_log
+                if (method is None or request[0] == method) and (path_pattern is None or re.fullmatch(path_pattern, request[1].split('?')[0]))
+            ])
+
+    def reset_request_log(self) -> None:
+        with self.__lock:
+            self.request_log = []
+
+    def handle(self, method: str, path: str, headers: dict, body: str) -> Tuple[int, bytes, dict]:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        with self.__lock:
+            self.request_log.append((method, path))
+            status_code, payload, response_headers = self.__route(method, path, headers, body)
+            content: bytes = json.dumps(payload).encode('utf-8')
+            if method == 'GET' and status_code == 200:
+                entity_tag: str = f'"{hashlib.sha1(content).hexdigest()}"'
+                first_served: float = self.__first_served.setdefault(f'{path} {entity_tag}', time.time())
+
+        if method == 'GET' and status_code == 200:
+            if self.validator == 'Last-Modified':
+                response_headers = dict(
+                    response_headers,
+                    Date=email.utils.formatdate(usegmt=True),
+                    **{'Last-Modified': email.utils.formatdate(first_served, usegmt=True)}
+                )
+                modified_since: Optional[str] = headers.get('If-Modified-Since')
+                if modified_since is not None and int(first_served) <= email.utils.parsedate_to_datetime(modified_since).timestamp():
+                    return 304, b'', response_headers
+            else:
+                response_headers = dict(response_headers, ETag=entity_tag)
+                if headers.get('If-None-Match') == entity_tag:
+                    return 304, b'', response_headers
+        return status_code, content, response_headers
+
+    def __route(self, method: str, path: str, headers: dict, body: str) -> Tuple[int, object, dict]:
+        if method == 'POST' and path == '/api/tenants/login/session':
+            session_token: str = f'token{next(self.__ids)}'
+            self.__session_tokens.add(session_token)
+            return 201, {'sessionToken': session_token, 'tenantId': FakeTBCSServer.TENANT_ID, 'userId': FakeTBCSServer.USER_ID}, {}
+
+        if len(self.__injected_errors) > 0:
+            return self.__error(self.__injected_errors.pop(0))
+        if self.error_rate > 0 and self.__random.random() < self.error_rate:
+            return self.__error(self.__random.choice(self.error_status_codes))
+
+        authorization: str = headers.get('Authorization', '')
+        if not authorization.startswith('Bearer ') or authorization[7:] not in self.__session_tokens:
+            return 401, {'message': 'Unauthorized'}, {}
+
+        self.__apply_pending_writes()
+        route_path, _, query = path.partition('?')
+        for route_method, route_pattern, route_handler in self.__routes:
+            if route_method == method:
+                match: Optional[Match] = route_pattern.fullmatch(route_path)
+                if match is not None:
+                    status_code, payload = route_handler(match, body, query)
+                    return status_code, payload, {}
+
+        return 404, {'message': f'No route for {method} {route_path}'}, {}
+
+    def __error(self, status_code: int) -> Tuple[int, object, dict]:
+        return status_code, {'message': 'Injected error'}, {'Retry-After': '0'} if status_code in (429, 503) else {}
+
+    def __commit(self, write: Callable[[], None]) -> None:
+        if self.commit_lag > 0:
+            self.__pending_writes.append((time.monotonic() + self.commit_lag, write))
+        else:
+            write()
+
+    def __apply_pending_writes(self) -> None:
+        now: float = time.monotonic()
+        while len(self.__pending_writes) > 0 and self.__pending_writes[0][0] <= now:
+            self.__pending_writes.pop(0)[1]()
+
+    def __list_test_cases(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_cases: List[dict] = [
+            {'id': test_case['id'], 'name': test_case['name'], 'externalId': test_case['automation']['externalId']}
+            for test_case in self.test_cases.values()
+        ]
+        external_id: Optional[Match] = re.search(r'fieldValue=externalId:equals:([^&]*)', query)
+        if external_id is not None:
+            test_cases = [test_case for test_case in test_cases if test_case['externalId'] == external_id.group(1)]
+        return 200, FakeTBCSServer.__get_page(test_cases, query)
+
+    def __create_test_case(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case_data: dict = json.loads(body)
+        if test_case_data['testCaseType'] not in FakeTBCSServer.TEST_CASE_TYPES:
+            return 400, {'message': 'Unknown test case type'}
+        test_case_id: int = next(self.__ids)
+        self.__known_test_case_ids.add(test_case_id)
+        self.__commit(lambda: self.test_cases.__setitem__(test_case_id, {
+            'id': test_case_id,
+            'name': test_case_data['name'],
+            'description': '',
+            'testCaseType': test_case_data['testCaseType'],
+            'responsibles': [],
+            'isAutomated': False,
+            'automation': {'externalId': ''},
+            'testSequence': {'testStepBlocks': [{'name': name, 'steps': []} for name in FakeTBCSServer.TEST_BLOCK_NAMES]}
+        }))
+        return 201, {'testCaseId': test_case_id}
+
+    def __get_test_case(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case: Optional[dict] = self.test_cases.get(int(match.group(1)))
+        if test_case is None:
+            return 404, {'message': 'Test case not found'}
+        return 200, test_case
+
+    def __update_test_case(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case_id: int = int(match.group(1))
+        if test_case_id not in self.__known_test_case_ids:
+            return 404, {'message': 'Test case not found'}
+        test_case_data: dict = json.loads(body)
+
+        def write() -> None:
+            test_case: dict = self.test_cases[test_case_id]
+            if 'name' in test_case_data:
+                test_case['name'] = test_case_data['name']
+            if 'description' in test_case_data:
+                test_case['description'] = test_case_data['description']['text']
+            if 'responsibles' in test_case_data:
+                test_case['responsibles'] = test_case_data['responsibles']
+            if 'isAutomated' in test_case_data:
+                test_case['isAutomated'] = test_case_data['isAutomated']
+            if 'externalId' in test_case_data:
+                test_case['automation']['externalId'] = test_case_data['externalId']['value']
+
+        self.__commit(write)
+        return 200, {}
+
+    def __add_test_step(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case_id: int = int(match.group(1))
+        test_step_data: dict = json.loads(body)
+        if test_case_id not in self.__known_test_case_ids:
+            return 404, {'message': 'Test case not found'}
+        if test_step_data['testStepBlock'] not in FakeTBCSServer.TEST_BLOCK_NAMES:
+            return 400, {'message': 'Unknown test step block'}
+        test_step_id: int = next(self.__ids)
+
+        def write() -> None:
+            steps: List[dict] = self.test_cases[test_case_id]['testSequence']['testStepBlocks'][
+                FakeTBCSServer.TEST_BLOCK_NAMES.index(test_step_data['testStepBlock'])
+            ]['steps']
+            test_step: dict = {'id': test_step_id, 'description': test_step_data['description']}
+            position: Optional[dict] = test_step_data.get('position')
+            previous_ids: List[int] = [step['id'] for step in steps]
+            if position is not None and int(position['testStepId']) in previous_ids:
+                steps.insert(previous_ids.index(int(position['testStepId'])) + 1, test_step)
+            else:
+                steps.append(test_step)
+
+        self.__commit(write)
+        return 201, {'testStepId': test_step_id}
+
+    def __remove_test_step(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case_id: int = int(match.group(1))
+        test_step_id: int = int(match.group(2))
+        if test_case_id not in self.__known_test_case_ids:
+            return 404, {'message': 'Test case not found'}
+
+        def write() -> None:
+            for test_step_block in self.test_cases[test_case_id]['testSequence']['testStepBlocks']:
+                test_step_block['steps'] = [step for step in test_step_block['steps'] if not step['id'] == test_step_id]
+
+        self.__commit(write)
+        return 200, {}
+
+    def __start_execution(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        test_case_id: int = int(match.group(1))
+        test_case: Optional[dict] = self.test_cases.get(test_case_id)
+        if test_case is None:
+            return 404, {'message': 'Test case not found'}
+        execution_id: int = next(self.__ids)
+        execution: dict = {
+            'id': execution_id,
+            'testCase': {'id': test_case_id},
+            'testSequence': {'testStepBlocks': [
+                {
+                    'name': test_step_block['name'],
+                    'steps': [
+                        {'id': step['id'], 'description': step['description'], 'result': 'Undefined', 'defectIds': []}
+                        for step in test_step_block['steps']
+                    ]
+                }
+                for test_step_block in test_case['testSequence']['testStepBlocks']
+            ]}
+        }
+        self.__commit(lambda: self.executions.__setitem__(execution_id, execution))
+        return 201, {'executionId': execution_id}
+
+    def __get_execution(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        execution: Optional[dict] = self.executions.get(int(match.group(2)))
+        if execution is None or not execution['testCase']['id'] == int(match.group(1)):
+            return 404, {'message': 'Execution not found'}
+        return 200, execution
+
+    def __get_execution_step(self, match: Match) -> Optional[dict]:
+        execution: Optional[dict] = self.executions.get(int(match.group(2)))
+        if execution is None:
+            return None
+        for test_step_block in execution['testSequence']['testStepBlocks']:
+            for step in test_step_block['steps']:
+                if step['id'] == int(match.group(3)):
+                    return step
+        return None
+
+    def __report_step_result(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        step: Optional[dict] = self.__get_execution_step(match)
+        if step is None:
+            return 404, {'message': 'Test step not found'}
+        result: str = json.loads(body)
+        self.__commit(lambda: step.__setitem__('result', result))
+        return 200, {}
+
+    def __assign_defect(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        step: Optional[dict] = self.__get_execution_step(match)
+        defect_id: int = int(json.loads(body))
+        if step is None or defect_id not in self.defects:
+            return 404, {'message': 'Test step or defect not found'}
+        self.__commit(lambda: step['defectIds'].append(defect_id))
+        return 201, {}
+
+    def __list_defects(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        return 200, FakeTBCSServer.__get_page(list(self.defects.values()), query)
+
+    def __create_defect(self, match: Match, body: str, query: str) -> Tuple[int, object]:
+        defect_data: dict = json.loads(body)
+        defect_id: int = next(self.__ids)
+        self.defects[defect_id] = {'id': defect_id, 'name': defect_data['name'], 'description': defect_data['description']}
+        return 201, {'defectId': defect_id}
+
+    @staticmethod
+    def __get_page(items: List[dict], query: str) -> List[dict]:
+        offset: Optional[Match] = re.search(r'(?:^|&)offset=(\d+)', query)
+        limit: Optional[Match] = re.search(r'(?:^|&)limit=(\d+)', query)
+        start: int = int(offset.group(1)) if offset is not None else 0
+        return items[start:start + int(limit.group(1))] if limit is not None else items[start:]
+
+    @staticmethod
+    def __create_handler(server: 'FakeTBCSServer') -> type:
+        class FakeTBCSRequestHandler(BaseHTTPRequestHandler):
+            protocol_version: str = 'HTTP/1.1'
+            disable_nagle_algorithm: bool = True
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def handle_request(self) -> None:
+                content_length: int = int(self.headers.get('Content-Length') or 0)
+                body: str = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else ''
+                status_code, content, headers = server.handle(self.command, self.path, dict(self.headers), body)
+                response: List[str] = [f'{self.protocol_version} {status_code} {self.responses.get(status_code, ("",))[0]}']
+                response += [f'{name}: {value}' for name, value in headers.items()]
+                if not status_code == 304:
+                    response += ['Content-Type: application/json', f'Content-Length: {len(content)}']
+                self.wfile.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1') + content)
+
+            do_GET = handle_request
+            do_POST = handle_request
+            do_PUT = handle_request
+            do_PATCH = handle_request
+            do_DELETE = handle_request
+
+        return FakeTBCSRequestHandler
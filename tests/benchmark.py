@@ -0,0 +1,239 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import tbcs_client
+
+from tests.FakeTBCSServer import FakeTBCSServer
+
+""" Benchmarks of end-to-end flows against the FakeTBCSServer
+
+Every benchmark starts its own FakeTBCSServer, prepares the data it needs and then measures one flow through the
+public API of the connectors: creating a test case with 50 test steps and reporting 10000 step results
+sequentially, through a ResultReporter and through an AsyncAPIConnector. For every flow the wall time, the
+throughput in operations per second, the number of HTTP requests sent to the server and the p50/p95/p99 latency
+of the most frequent endpoint are reported.
+
+Run it from the repository root, optionally writing the results to a file and comparing them to an earlier run:
+
+    python -m tests.benchmark --output current.json --baseline baseline.json --tolerance 0.2
+
+The script exits with status 1 if the throughput of a flow dropped by more than 'tolerance' or if a flow sent more
+requests than in the baseline. 'scale' shrinks or grows all flows, 'latency', 'commit_lag' and 'error_rate' are
+passed to the FakeTBCSServer.
+"""
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    operations: int
+    duration: float
+    throughput: float
+    requests: int
+    p50: float
+    p95: float
+    p99: float
+
+
+def create_connector(server: FakeTBCSServer, directory: str) -> tbcs_client.APIConnector:
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        server.write_config(os.path.join(directory, 'tbcs.config.json')),
+        wait_policy=tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=30),
+        pool_maxsize=32
+    )
+    connector.log_in()
+    return connector
+
+
+def prepare_executions(
+        connector: tbcs_client.APIConnector,
+        step_count: int,
+        execution_count: int
+) -> Tuple[str, List[str], List[str]]:
+    test_case_id: str = connector.create_test_case('benchmark', 'benchmark test case', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'benchmark')
+    test_step_ids: List[str] = connector.add_test_steps(test_case_id, [f'step {index}' for index in range(step_count)])
+    execution_ids: List[str] = [connector.start_execution(test_case_id) for _ in range(execution_count)]
+    return test_case_id, test_step_ids, execution_ids
+
+
+def get_results(
+        execution_ids: List[str],
+        test_step_ids: List[str],
+        result_count: int
+) -> List[Tuple[str, str, str]]:
+    statuses: List[str] = [tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED, tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED]
+    return [
+        (
+            execution_ids[index % len(execution_ids)],
+            test_step_ids[index // len(execution_ids) % len(test_step_ids)],
+            statuses[index % 7 == 0]
+        )
+        for index in range(result_count)
+    ]
+
+
+def measure(
+        name: str,
+        operations: int,
+        server: FakeTBCSServer,
+        aggregator: tbcs_client.LatencyAggregator,
+        flow: Callable[[], None]
+) -> BenchmarkResult:
+    server.reset_request_log()
+    aggregator.reset()
+    start: float = time.perf_counter()
+    flow()
+    duration: float = time.perf_counter() - start
+
+    endpoints: Dict[str, Dict[str, float]] = aggregator.summary()
+    latencies: Dict[str, float] = max(endpoints.values(), key=lambda endpoint: endpoint['count']) if len(endpoints) > 0 else {}
+    return BenchmarkResult(
+        name,
+        operations,
+        duration,
+        operations / duration,
+        len(server.request_log),
+        latencies.get('p50', 0.0),
+        latencies.get('p95', 0.0),
+        latencies.get('p99', 0.0)
+    )
+
+
+def benchmark_create_test_case_with_steps(server: FakeTBCSServer, directory: str, step_count: int = 50) -> BenchmarkResult:
+    connector: tbcs_client.APIConnector = create_connector(server, directory)
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    connector.add_hook(aggregator)
+
+    def flow() -> None:
+        test_case_id: str = connector.create_test_case('benchmark', 'benchmark test case', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'benchmark')
+        connector.add_test_steps(test_case_id, [f'step {index}' for index in range(step_count)])
+
+    return measure('create_test_case_with_steps', step_count, server, aggregator, flow)
+
+
+def benchmark_report_results_sequentially(server: FakeTBCSServer, directory: str, result_count: int = 10000) -> BenchmarkResult:
+    connector: tbcs_client.APIConnector = create_connector(server, directory)
+    test_case_id, test_step_ids, execution_ids = prepare_executions(connector, 50, 20)
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    connector.add_hook(aggregator)
+
+    def flow() -> None:
+        for execution_id, test_step_id, result in get_results(execution_ids, test_step_ids, result_count):
+            connector.report_step_result(test_case_id, execution_id, test_step_id, result)
+
+    return measure('report_results_sequentially', result_count, server, aggregator, flow)
+
+
+def benchmark_report_results_with_reporter(server: FakeTBCSServer, directory: str, result_count: int = 10000) -> BenchmarkResult:
+    connector: tbcs_client.APIConnector = create_connector(server, directory)
+    test_case_id, test_step_ids, execution_ids = prepare_executions(connector, 50, 20)
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    connector.add_hook(aggregator)
+
+    def flow() -> None:
+        with tbcs_client.ResultReporter(connector, max_workers=16) as reporter:
+            for execution_id, test_step_id, result in get_results(execution_ids, test_step_ids, result_count):
+                reporter.report_step_result(test_case_id, execution_id, test_step_id, result)
+
+    return measure('report_results_with_reporter', result_count, server, aggregator, flow)
+
+
+def benchmark_report_results_async(server: FakeTBCSServer, directory: str, result_count: int = 10000) -> BenchmarkResult:
+    test_case_id, test_step_ids, execution_ids = prepare_executions(create_connector(server, directory), 50, 20)
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+
+    async def report() -> None:
+        async with tbcs_client.AsyncAPIConnector(os.path.join(directory, 'tbcs.config.json'), concurrency_limit=16) as connector:
+            await connector.log_in()
+            connector.add_hook(aggregator)
+            await asyncio.gather(*[
+                connector.report_step_result(test_case_id, execution_id, test_step_id, result)
+                for execution_id, test_step_id, result in get_results(execution_ids, test_step_ids, result_count)
+            ])
+
+    result: BenchmarkResult = measure('report_results_async', result_count, server, aggregator, lambda: asyncio.run(report()))
+    return result._replace(requests=result.requests - server.login_count)
+
+
+BENCHMARKS: List[Callable[..., BenchmarkResult]] = [
+    benchmark_create_test_case_with_steps,
+    benchmark_report_results_sequentially,
+    benchmark_report_results_with_reporter,
+    benchmark_report_results_async
+]
+
+
+def run_benchmarks(
+        scale: float = 1.0,
+        latency: float = 0.0,
+        commit_lag: float = 0.0,
+        error_rate: float = 0.0
+) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    for benchmark in BENCHMARKS:
+        size: int = max(int((50 if benchmark is benchmark_create_test_case_with_steps else 10000) * scale), 1)
+        with tempfile.TemporaryDirectory() as directory:
+            with FakeTBCSServer(latency=latency, commit_lag=commit_lag, error_rate=error_rate, seed=0) as server:
+                results.append(benchmark(server, directory, size))
+    return results
+
+
+def compare(
+        results: List[BenchmarkResult],
+        baseline: Dict[str, dict],
+        tolerance: float = 0.2
+) -> List[str]:
+    regressions: List[str] = []
+    for result in results:
+        baseline_result: Optional[dict] = baseline.get(result.name)
+        if baseline_result is None or not baseline_result['operations'] == result.operations:
+            continue
+        if result.throughput < baseline_result['throughput'] * (1 - tolerance):
+            regressions.append(
+                f'{result.name}: throughput {result.throughput:.0f}/s below baseline {baseline_result["throughput"]:.0f}/s'
+            )
+        if result.requests > baseline_result['requests']:
+            regressions.append(f'{result.name}: {result.requests} requests instead of {baseline_result["requests"]}')
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmark the TestBench CS client against a fake server.')
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--commit-lag', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--output')
+    parser.add_argument('--baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    options: argparse.Namespace = parser.parse_args(arguments)
+
+    results: List[BenchmarkResult] = run_benchmarks(options.scale, options.latency, options.commit_lag, options.error_rate)
+    print(f'{"flow":<32}{"ops":>8}{"seconds":>10}{"ops/s":>10}{"requests":>10}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}')
+    for result in results:
+        print(
+            f'{result.name:<32}{result.operations:>8}{result.duration:>10.2f}{result.throughput:>10.0f}{result.requests:>10}'
+            f'{result.p50 * 1000:>9.2f}{result.p95 * 1000:>9.2f}{result.p99 * 1000:>9.2f}'
+        )
+
+    if options.output is not None:
+        with open(options.output, 'w') as output_file:
+            json.dump({result.name: result._asdict() for result in results}, output_file, indent=2)
+
+    if options.baseline is not None:
+        with open(options.baseline) as baseline_file:
+            regressions: List[str] = compare(results, json.load(baseline_file), options.tolerance)
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+        return 1 if len(regressions) > 0 else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import pytest
+
+import tbcs_client
+
+from tests.FakeTBCSServer import FakeTBCSServer
+
+pytest_plugins = ['pytester']
+
+
+@pytest.fixture
+def fake_server(request):
+    with FakeTBCSServer(**getattr(request, 'param', {})) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_connector(fake_server, tmp_path, request):
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+        wait_policy=tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=5),
+        **getattr(request, 'param', {})
+    )
+    connector.log_in()
+    return connector
@@ -24,6 +24,7 @@ new_defect_message: str = 'Message'
 new_test_case_id: str
 new_execution_id: str
 new_defect_id: str
+new_cleanup_test_step_ids: List[str]
 
 
 @pytest.mark.dependency()
@@ -108,3 +109,22 @@ def test_create_and_assign_defect():
 
     execution_steps: dict = connector.get_execution_by_id(new_test_case_id, new_execution_id)['testSequence']['testStepBlocks'][tbcs_client.APIConnector.get_test_block_index_by_name(tbcs_client.APIConnector.TEST_BLOCK_TEST_NAME)]['steps']
     assert (str(execution_steps[1]['defectIds'][0]) == new_defect_id)
+
+
+@pytest.mark.dependency(depends=["test_create_test_case_and_get_test_case_by_id"])
+def test_add_test_steps():
+    global new_cleanup_test_step_ids
+    new_cleanup_test_step_ids = connector.add_test_steps(new_test_case_id, ['first cleanup', 'second cleanup', 'third cleanup'], tbcs_client.APIConnector.TEST_BLOCK_CLEANUP_NAME)
+
+    test_steps: List = connector.get_test_case_by_id(new_test_case_id)['testSequence']['testStepBlocks'][tbcs_client.APIConnector.get_test_block_index_by_name(tbcs_client.APIConnector.TEST_BLOCK_CLEANUP_NAME)]['steps']
+
+    assert ([str(test_step['id']) for test_step in test_steps] == new_cleanup_test_step_ids)
+
+
+@pytest.mark.dependency(depends=["test_add_test_steps"])
+def test_remove_test_steps():
+    connector.remove_test_steps(new_test_case_id, new_cleanup_test_step_ids[:2])
+
+    test_steps: List = connector.get_test_case_by_id(new_test_case_id)['testSequence']['testStepBlocks'][tbcs_client.APIConnector.get_test_block_index_by_name(tbcs_client.APIConnector.TEST_BLOCK_CLEANUP_NAME)]['steps']
+
+    assert ([str(test_step['id']) for test_step in test_steps] == new_cleanup_test_step_ids[2:])
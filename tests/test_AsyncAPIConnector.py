@@ -0,0 +1,70 @@
+from typing import List
+import asyncio
+import random
+import string
+
+import pytest
+
+import tbcs_client
+
+new_test_case_name: str = 'Python AsyncAPIConnector Test'
+new_test_case_description: str = 'Description'
+new_test_case_step_count: int = 20
+new_test_case_external_id: str = ''.join(random.choices(string.ascii_letters + string.digits, k=24))
+
+new_test_case_id: str
+new_test_step_ids: List[str]
+new_execution_id: str
+
+
+async def create_test_case_with_steps() -> None:
+    global new_test_case_id, new_test_step_ids
+    async with tbcs_client.AsyncAPIConnector(concurrency_limit=8) as connector:
+        await connector.log_in()
+        new_test_case_id = await connector.create_test_case(
+            new_test_case_name,
+            new_test_case_description,
+            tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED,
+            new_test_case_external_id
+        )
+        new_test_step_ids = [
+            await connector.add_test_step(new_test_case_id, f'step {index}')
+            for index in range(new_test_case_step_count)
+        ]
+
+
+async def report_all_step_results() -> dict:
+    global new_execution_id
+    async with tbcs_client.AsyncAPIConnector(concurrency_limit=8) as connector:
+        await connector.log_in()
+        new_execution_id = await connector.start_execution(new_test_case_id)
+        await asyncio.gather(*[
+            connector.report_step_result(new_test_case_id, new_execution_id, test_step_id, tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED)
+            for test_step_id in new_test_step_ids
+        ])
+        return await connector.get_execution_by_id(new_test_case_id, new_execution_id)
+
+
+@pytest.mark.dependency()
+def test_create_test_case_with_steps():
+    asyncio.run(create_test_case_with_steps())
+
+    async def get_test_case() -> dict:
+        async with tbcs_client.AsyncAPIConnector() as connector:
+            await connector.log_in()
+            return await connector.get_test_case_by_external_id(new_test_case_external_id)
+
+    test_case: dict = asyncio.run(get_test_case())
+    test_steps: List = test_case['testSequence']['testStepBlocks'][tbcs_client.APIConnector.get_test_block_index_by_name(tbcs_client.APIConnector.TEST_BLOCK_TEST_NAME)]['steps']
+
+    assert (str(test_case['id']) == new_test_case_id)
+    assert ([str(test_step['id']) for test_step in test_steps] == new_test_step_ids)
+
+
+@pytest.mark.dependency(depends=["test_create_test_case_with_steps"])
+def test_report_step_results_concurrently():
+    execution: dict = asyncio.run(report_all_step_results())
+    execution_steps: List = execution['testSequence']['testStepBlocks'][tbcs_client.APIConnector.get_test_block_index_by_name(tbcs_client.APIConnector.TEST_BLOCK_TEST_NAME)]['steps']
+
+    assert (len(execution_steps) == new_test_case_step_count)
+    assert (all(step['result'] == tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED for step in execution_steps))
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+import tbcs_client
+
+
+class LoginSession:
+    def __init__(self, status_code: int = 201):
+        self.status_code: int = status_code
+        self.logins: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def post(self, url: str, data: str, headers: dict) -> requests.Response:
+        time.sleep(0.01)
+        with self.lock:
+            self.logins += 1
+            response: requests.Response = requests.Response()
+            response.status_code = self.status_code
+            response._content = json.dumps({'sessionToken': f'token{self.logins}', 'tenantId': 3, 'userId': 7}).encode()
+            return response
+
+
+def test_log_in_sets_session_state():
+    authenticator: tbcs_client.Authenticator = tbcs_client.Authenticator('https://server', 'tenant', 'user', 'password', LoginSession())
+    authenticator.log_in()
+
+    generation, headers = authenticator.get_headers()
+
+    assert (generation == 1)
+    assert (headers['Authorization'] == 'Bearer token1')
+    assert (authenticator.tenant_id == 3)
+    assert (authenticator.user_id == 7)
+
+
+def test_concurrent_re_authentication_logs_in_once():
+    session: LoginSession = LoginSession()
+    authenticator: tbcs_client.Authenticator = tbcs_client.Authenticator('https://server', 'tenant', 'user', 'password', session)
+    authenticator.log_in()
+    seen_generation: int = authenticator.get_headers()[0]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda _: authenticator.log_in(seen_generation), range(64)))
+
+    assert (session.logins == 2)
+    assert (authenticator.get_headers()[0] == 2)
+    assert (authenticator.get_headers()[1]['Authorization'] == 'Bearer token2')
+
+
+def test_rejected_login_raises():
+    authenticator: tbcs_client.Authenticator = tbcs_client.Authenticator('https://server', 'tenant', 'user', 'password', LoginSession(401))
+
+    with pytest.raises(Exception, match='Unable to authenticate'):
+        authenticator.log_in()
+
+
+def test_stored_session_is_shared(tmp_path):
+    session: LoginSession = LoginSession()
+    token_store: tbcs_client.SessionTokenStore = tbcs_client.SessionTokenStore(str(tmp_path))
+    first_authenticator: tbcs_client.Authenticator = tbcs_client.Authenticator('https://server', 'tenant', 'user', 'password', session, token_store)
+    second_authenticator: tbcs_client.Authenticator = tbcs_client.Authenticator('https://server', 'tenant', 'user', 'password', session, token_store)
+    first_authenticator.log_in()
+    second_authenticator.log_in()
+
+    assert (session.logins == 1)
+    assert (second_authenticator.get_headers()[1]['Authorization'] == 'Bearer token1')
+
+    second_authenticator.log_in(second_authenticator.get_headers()[0])
+    first_authenticator.log_in(first_authenticator.get_headers()[0])
+
+    assert (session.logins == 2)
+    assert (first_authenticator.get_headers()[1]['Authorization'] == 'Bearer token2')
+
+
+def test_async_connector_logs_in_once_per_session(fake_server, tmp_path):
+    async def run() -> List[dict]:
+        async with tbcs_client.AsyncAPIConnector(
+                fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+                wait_policy=tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=5)
+        ) as connector:
+            await connector.log_in()
+            await connector.log_in()
+            test_case_id: str = await connector.create_test_case('async login', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'async-login')
+            fake_server.expire_sessions()
+            return list(await asyncio.gather(*[connector.get_test_case_by_id(test_case_id) for _ in range(8)]))
+
+    test_cases: List[dict] = asyncio.run(run())
+
+    assert (fake_server.login_count == 2)
+    assert (all(test_case['automation']['externalId'] == 'async-login' for test_case in test_cases))
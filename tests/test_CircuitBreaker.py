@@ -0,0 +1,76 @@
+import time
+
+import pytest
+import requests
+
+import tbcs_client
+
+
+def test_opens_after_consecutive_failures():
+    circuit_breaker: tbcs_client.CircuitBreaker = tbcs_client.CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_CLOSED)
+
+    circuit_breaker.record_failure()
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_OPEN)
+    with pytest.raises(tbcs_client.APIError):
+        circuit_breaker.before_request()
+
+
+def test_half_open_trial_closes_or_reopens():
+    circuit_breaker: tbcs_client.CircuitBreaker = tbcs_client.CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    circuit_breaker.record_failure()
+    time.sleep(0.02)
+    circuit_breaker.before_request()
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_HALF_OPEN)
+    with pytest.raises(tbcs_client.APIError):
+        circuit_breaker.before_request()
+
+    circuit_breaker.record_failure()
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_OPEN)
+
+    time.sleep(0.02)
+    circuit_breaker.before_request()
+    circuit_breaker.record_success()
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_CLOSED)
+
+
+def test_failure_status_codes():
+    assert (tbcs_client.CircuitBreaker.is_failure(429))
+    assert (tbcs_client.CircuitBreaker.is_failure(503))
+    assert (not tbcs_client.CircuitBreaker.is_failure(404))
+
+
+@pytest.mark.parametrize(
+    'fake_connector',
+    [{'circuit_breaker': tbcs_client.CircuitBreaker(failure_threshold=1, reset_timeout=0.01)}],
+    indirect=True,
+    ids=['circuit_breaker']
+)
+def test_unexpected_errors_of_trial_request_reopen(fake_connector, monkeypatch):
+    test_case_id: str = fake_connector.create_test_case('trial', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'trial')
+    circuit_breaker: tbcs_client.CircuitBreaker = fake_connector.circuit_breaker
+    circuit_breaker.record_failure()
+    time.sleep(0.02)
+
+    def fail(*arguments, **keyword_arguments):
+        raise requests.exceptions.ChunkedEncodingError('connection broken')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(requests.Session, 'send', fail)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            fake_connector.get_test_case_by_id(test_case_id)
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_OPEN)
+
+    time.sleep(0.02)
+    fake_connector.get_test_case_by_id(test_case_id)
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_CLOSED)
@@ -0,0 +1,37 @@
+import pytest
+
+import tbcs_client
+
+from tests.FakeTBCSServer import FakeTBCSServer
+
+
+def test_products_share_connections_and_login(tmp_path):
+    with FakeTBCSServer(product_ids=(2, 3)) as server:
+        with tbcs_client.ConnectorPool() as pool:
+            first: tbcs_client.APIConnector = pool.add_config(server.write_config(str(tmp_path / 'first.json'), 1))
+            second: tbcs_client.APIConnector = pool.add_config(server.write_config(str(tmp_path / 'second.json'), 2))
+            third: tbcs_client.APIConnector = pool.add_product(3)
+            pool.log_in()
+            for connector in [first, second, third]:
+                connector.log_in()
+                connector.create_defect('pooled defect', 'created through a pool')
+
+            assert (pool.add_config(str(tmp_path / 'second.json')) is second)
+            assert (pool.get_connector(3) is third)
+            assert (pool.summary() == {'servers': 1, 'logins': 1, 'products': 3})
+            assert (server.login_count == 1)
+            assert (server.get_request_count('POST', r'/api/tenants/1/products/[123]/defects') == 3)
+            with pytest.raises(tbcs_client.ItemNotFoundError):
+                pool.get_connector(4)
+
+
+def test_expired_session_is_renewed_once_for_all_products(tmp_path):
+    with FakeTBCSServer(product_ids=(2,)) as server:
+        with tbcs_client.ConnectorPool() as pool:
+            connectors: list = [pool.add_config(server.write_config(str(tmp_path / f'{product}.json'), product)) for product in [1, 2]]
+            pool.log_in()
+            server.expire_sessions()
+            for connector in connectors:
+                connector.create_defect('defect', 'after expiry')
+
+            assert (server.login_count == 2)
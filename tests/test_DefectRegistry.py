@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+from typing import List
+
+import tbcs_client
+
+
+def test_fingerprint_ignores_volatile_parts():
+    fingerprint: str = tbcs_client.DefectRegistry.get_fingerprint('Login fails', 'Timeout after 30.5s at 0x7f3a on port 8080')
+
+    assert (tbcs_client.DefectRegistry.get_fingerprint(' login  FAILS', 'timeout after 12s at 0xbeef on port 443') == fingerprint)
+    assert (not tbcs_client.DefectRegistry.get_fingerprint('Login fails', 'Connection refused') == fingerprint)
+
+
+def test_fingerprint_ignores_numbers_in_name():
+    fingerprint: str = tbcs_client.DefectRegistry.get_fingerprint('Timeout after 0.2s', 'Timeout after 0.2s')
+
+    assert (tbcs_client.DefectRegistry.get_fingerprint('Timeout after 1.3s', 'Timeout after 1.3s') == fingerprint)
+    assert (not tbcs_client.DefectRegistry.get_fingerprint('Timeout after 1.3s', 'Connection refused') == fingerprint)
+
+
+def test_concurrent_callers_share_one_create():
+    registry: tbcs_client.DefectRegistry = tbcs_client.DefectRegistry()
+    created: List[str] = []
+    defect_ids: List[str] = []
+
+    def create_defect() -> str:
+        time.sleep(0.05)
+        created.append('1')
+        return '1'
+
+    def get_defect_id() -> None:
+        defect_ids.append(registry.get_defect_id('defect', 'message 1', lambda: [{'id': 7, 'name': 'old', 'description': 'old'}], create_defect))
+
+    threads: List[threading.Thread] = [threading.Thread(target=get_defect_id) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (created == ['1'])
+    assert (defect_ids == ['1'] * 10)
+    assert (registry.get_defect_id('old', 'old', lambda: [], create_defect) == '7')
+    assert (registry.summary() == {'defects': 2, 'reused': 10, 'created': 1})
+
+
+def test_connector_reuses_existing_defects(fake_server, tmp_path):
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+        defect_registry=tbcs_client.DefectRegistry()
+    )
+    connector.log_in()
+    existing_defect_id: str = connector.create_defect('existing', 'failed at 12:00')
+    fake_server.reset_request_log()
+    connector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+        defect_registry=tbcs_client.DefectRegistry()
+    )
+    connector.log_in()
+
+    assert ({connector.create_defect('existing', f'failed at 13:{minute:02}') for minute in range(20)} == {existing_defect_id})
+    assert (len({connector.create_defect('new', f'failed after {seconds}s') for seconds in range(20)}) == 1)
+    assert (fake_server.get_request_count('GET', r'.*/defects') == 1)
+    assert (len(fake_server.defects) == 2)
+
+
+def test_async_connector_shares_one_create(fake_server, tmp_path):
+    async def run() -> List[str]:
+        async with tbcs_client.AsyncAPIConnector(
+                fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+                defect_registry=tbcs_client.DefectRegistry()
+        ) as connector:
+            await connector.log_in()
+            return list(await asyncio.gather(*[connector.create_defect('async', f'failed at 13:{minute:02}') for minute in range(10)]))
+
+    defect_ids: List[str] = asyncio.run(run())
+
+    assert (len(set(defect_ids)) == 1)
+    assert (fake_server.get_request_count('GET', r'.*/defects') == 1)
+    assert (list(fake_server.defects) == [int(defect_ids[0])])
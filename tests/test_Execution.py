@@ -0,0 +1,59 @@
+import asyncio
+
+from typing import Dict, List
+
+import tbcs_client
+
+
+def prepare(connector: tbcs_client.APIConnector, count: int) -> List[str]:
+    test_case_ids: List[str] = []
+    for index in range(count):
+        test_case_id: str = connector.create_test_case(f'batch {index}', '', 'StructuredTestCase', f'batch{index}')
+        connector.add_test_steps(test_case_id, ['first', 'second', 'third'])
+        test_case_ids.append(test_case_id)
+    return test_case_ids
+
+
+def test_start_executions_and_report_execution(fake_server, fake_connector):
+    test_case_ids: List[str] = prepare(fake_connector, 5)
+    fake_server.commit_lag = 0.05
+    fake_server.reset_request_log()
+
+    execution_ids: List[str] = fake_connector.start_executions(test_case_ids)
+
+    assert (len(set(execution_ids)) == 5)
+    assert (fake_server.get_request_count('POST') == 5)
+
+    test_step_ids: List[str] = [step.id for step in fake_connector.get_test_case_model_by_id(test_case_ids[0]).get_test_steps('Test')]
+    step_results: Dict[str, str] = {
+        test_step_id: tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED for test_step_id in test_step_ids
+    }
+    step_results[test_step_ids[1]] = tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED
+    fake_server.reset_request_log()
+    fake_connector.report_execution(test_case_ids[0], execution_ids[0], step_results)
+    execution: tbcs_client.Execution = fake_connector.get_execution_model_by_id(test_case_ids[0], execution_ids[0])
+
+    assert ({step_result.test_step_id: step_result.result for step_result in execution.get_step_results()} == step_results)
+    assert (fake_server.get_request_count('PUT') == 3)
+    assert (fake_connector.wait_statistics.summary()['report_execution']['count'] == 1)
+
+
+def test_async_start_executions_and_report_execution(fake_server, fake_connector, tmp_path):
+    test_case_ids: List[str] = prepare(fake_connector, 3)
+    test_step_ids: List[str] = [step.id for step in fake_connector.get_test_case_model_by_id(test_case_ids[0]).get_test_steps('Test')]
+
+    async def run() -> tbcs_client.Execution:
+        async with tbcs_client.AsyncAPIConnector(
+                str(tmp_path / 'tbcs.config.json'),
+                wait_policy=tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=5)
+        ) as connector:
+            await connector.log_in()
+            execution_ids: List[str] = await connector.start_executions(test_case_ids)
+            await connector.report_execution(test_case_ids[0], execution_ids[0], {
+                test_step_id: tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED for test_step_id in test_step_ids
+            })
+            return tbcs_client.Execution(await connector.get_execution_by_id(test_case_ids[0], execution_ids[0]))
+
+    execution: tbcs_client.Execution = asyncio.run(run())
+
+    assert ([step_result.result for step_result in execution.get_step_results('Test')] == ['Passed'] * 3)
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+import tbcs_client
+
+from tests.FakeTBCSServer import FakeTBCSServer
+
+
+def test_create_test_case_with_steps_and_report_results(fake_server, fake_connector):
+    test_case_id: str = fake_connector.create_test_case('offline test', 'description', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'offline')
+    test_step_ids: list = fake_connector.add_test_steps(test_case_id, [f'step {index}' for index in range(5)])
+    execution_id: str = fake_connector.start_execution(test_case_id)
+    defect_id: str = fake_connector.create_defect('offline defect', 'failed offline')
+    fake_connector.report_step_result(test_case_id, execution_id, test_step_ids[0], tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+    fake_connector.assign_defect(test_case_id, execution_id, test_step_ids[0], defect_id)
+
+    steps: list = fake_connector.get_execution_by_id(test_case_id, execution_id)['testSequence']['testStepBlocks'][2]['steps']
+    assert ([str(step['id']) for step in steps] == test_step_ids)
+    assert (steps[0]['result'] == tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+    assert (steps[0]['defectIds'] == [int(defect_id)])
+    assert (fake_connector.get_test_case_by_external_id('offline')['id'] == int(test_case_id))
+    assert (fake_server.login_count == 1)
+
+
+def test_writes_become_visible_after_commit_lag(fake_server, fake_connector):
+    fake_server.commit_lag = 0.1
+    start: float = time.monotonic()
+    test_case_id: str = fake_connector.create_test_case('lagging test', 'description', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'lagging')
+
+    assert (time.monotonic() - start >= 0.1)
+    assert (fake_connector.get_test_case_by_id(test_case_id)['name'] == 'lagging test')
+    assert (fake_server.get_request_count('GET', r'.*/specifications/testCases/\d+') >= 2)
+
+
+def test_test_steps_are_removed_concurrently(fake_server, fake_connector):
+    test_case_id: str = fake_connector.create_test_case('removal', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'removal')
+    test_step_ids: list = fake_connector.add_test_steps(test_case_id, [f'step {index}' for index in range(8)])
+    fake_server.latency = 0.05
+    fake_server.reset_request_log()
+    start: float = time.monotonic()
+    fake_connector.remove_test_steps(test_case_id, test_step_ids[:6])
+
+    assert (time.monotonic() - start < 0.3)
+    assert (fake_server.get_request_count('DELETE') == 6)
+    assert ([str(step['id']) for step in fake_connector.get_test_case_by_id(test_case_id)['testSequence']['testStepBlocks'][2]['steps']] == test_step_ids[6:])
+
+
+def test_unknown_test_case_types_are_rejected(fake_server, fake_connector):
+    with pytest.raises(tbcs_client.APIError):
+        fake_connector.create_test_case('unknown type', '', 'StructuralTestCase', 'unknown')
+
+    assert (len(fake_server.test_cases) == 0)
+
+
+def test_injected_errors_and_expired_sessions_are_recovered(fake_server, fake_connector):
+    fake_connector.create_defect('first defect', 'before errors')
+    fake_server.inject_errors(503, 503)
+    fake_connector.create_defect('second defect', 'after errors')
+    fake_server.expire_sessions()
+    fake_connector.create_defect('third defect', 'after expired session')
+
+    assert (len(fake_server.defects) == 3)
+    assert (fake_server.login_count == 2)
+
+
+def test_error_rate_fails_requests_without_retries(tmp_path):
+    with FakeTBCSServer(error_rate=1.0, error_status_codes=(500,)) as server:
+        connector: tbcs_client.APIConnector = tbcs_client.APIConnector(server.write_config(str(tmp_path / 'tbcs.config.json')))
+        connector.log_in()
+        with pytest.raises(tbcs_client.APIError):
+            connector.create_defect('defect', 'always failing')
@@ -0,0 +1,87 @@
+import io
+
+from typing import Dict, List
+
+import tbcs_client
+
+from tbcs_client.JUnitUploader import main
+
+REPORT: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="suite" tests="4">
+    <testcase classname="tests.test_login" name="test_valid_user" time="0.1"/>
+    <testcase classname="tests.test_login" name="test_invalid_user" time="0.2">
+      <failure message="AssertionError: expected 401, got 500 after 0.2s">Traceback</failure>
+    </testcase>
+    <testcase classname="tests.test_login" name="test_locked_user" time="0.2">
+      <error message="AssertionError: expected 401, got 500 after 1.3s"/>
+    </testcase>
+    <testcase classname="tests.test_login" name="test_later" time="0.0">
+      <skipped/>
+    </testcase>
+  </testsuite>
+</testsuites>
+'''
+
+
+def write_report(tmp_path, name: str = 'report.xml') -> str:
+    report_path: str = str(tmp_path / name)
+    with open(report_path, 'w') as report_file:
+        report_file.write(REPORT)
+    return report_path
+
+
+def test_parse_report(tmp_path):
+    test_cases: List[tbcs_client.JUnitTestCase] = list(tbcs_client.JUnitUploader.parse(write_report(tmp_path)))
+
+    assert ([test_case.external_id for test_case in test_cases] == [
+        'tests.test_login.test_valid_user',
+        'tests.test_login.test_invalid_user',
+        'tests.test_login.test_locked_user',
+        'tests.test_login.test_later'
+    ])
+    assert ([test_case.result for test_case in test_cases] == ['Passed', 'Failed', 'Failed', 'Skipped'])
+    assert (test_cases[1].message == 'AssertionError: expected 401, got 500 after 0.2s')
+
+
+def test_upload_creates_test_cases_once_and_deduplicates_defects(fake_server, tmp_path):
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+        wait_policy=tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=5),
+        defect_registry=tbcs_client.DefectRegistry()
+    )
+    connector.log_in()
+    uploader: tbcs_client.JUnitUploader = tbcs_client.JUnitUploader(connector, max_workers=4, output=io.StringIO())
+
+    counts: Dict[str, int] = uploader.upload(write_report(tmp_path))
+    uploader.upload(write_report(tmp_path, 'rerun.xml'))
+
+    assert (counts == {'test_cases': 4, 'passed': 1, 'failed': 2, 'skipped': 1, 'errors': 0})
+    assert (len(fake_server.test_cases) == 3)
+    assert (len(fake_server.executions) == 6)
+    assert (len(fake_server.defects) == 1)
+
+
+def test_existing_test_case_without_test_block_is_not_duplicated(fake_server, fake_connector, tmp_path):
+    test_case_id: str = fake_connector.create_test_case('valid user', '', tbcs_client.APIConnector.TEST_CASE_TYPE_SIMPLE, 'tests.test_login.test_valid_user')
+    fake_server.test_cases[int(test_case_id)]['testSequence']['testStepBlocks'] = []
+    output: io.StringIO = io.StringIO()
+    uploader: tbcs_client.JUnitUploader = tbcs_client.JUnitUploader(fake_connector, max_workers=4, output=output)
+
+    counts: Dict[str, int] = uploader.upload(write_report(tmp_path))
+    uploader.upload(write_report(tmp_path, 'rerun.xml'))
+
+    assert (counts['errors'] == 1)
+    assert ('has no Test block' in output.getvalue())
+    assert (sorted(test_case['automation']['externalId'] for test_case in fake_server.test_cases.values()) == [
+        'tests.test_login.test_invalid_user',
+        'tests.test_login.test_locked_user',
+        'tests.test_login.test_valid_user'
+    ])
+
+
+def test_main_uploads_reports(fake_server, tmp_path):
+    config_path: str = fake_server.write_config(str(tmp_path / 'tbcs.config.json'))
+
+    assert (main(['--config', config_path, '--session-dir', str(tmp_path / 'sessions'), write_report(tmp_path)]) == 0)
+    assert (len(fake_server.executions) == 3)
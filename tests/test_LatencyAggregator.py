@@ -0,0 +1,49 @@
+import tbcs_client
+
+
+def new_request_event(duration: float, status_code: int = 200) -> tbcs_client.RequestEvent:
+    return tbcs_client.RequestEvent('GET', '/api/tenants/{tenantId}/products/{productId}/defects', status_code, 0, 100, duration, 0, 0.0)
+
+
+def test_percentiles_per_endpoint():
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    for duration in range(1, 101):
+        aggregator(new_request_event(duration / 1000))
+    aggregator(new_request_event(1.0, 404))
+
+    summary: dict = aggregator.summary()['GET /api/tenants/{tenantId}/products/{productId}/defects']
+
+    assert (summary['count'] == 101)
+    assert (summary['failed'] == 1)
+    assert (summary['p50'] == 0.051)
+    assert (summary['p95'] == 0.096)
+    assert (summary['p99'] == 0.1)
+    assert (summary['max'] == 1.0)
+    assert (summary['bytes_received'] == 10100)
+
+
+def test_wait_events_are_grouped_by_operation():
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    aggregator(tbcs_client.WaitEvent('add_test_step', 0.2, 2, 0.05, True))
+    aggregator(tbcs_client.WaitEvent('add_test_step', 1.0, 5, 0.9, False))
+
+    summary: dict = aggregator.summary()['WAIT add_test_step']
+
+    assert (summary['count'] == 2)
+    assert (summary['failed'] == 1)
+    assert (abs(summary['sleep_time'] - 0.95) < 1e-9)
+
+
+def test_samples_are_bounded():
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator(max_samples=10)
+    for _ in range(1000):
+        aggregator(new_request_event(0.01))
+
+    assert (aggregator.summary()['GET /api/tenants/{tenantId}/products/{productId}/defects']['p99'] == 0.01)
+
+
+def test_endpoint_template():
+    assert (tbcs_client.APIConnector.get_endpoint_template('/api/tenants/3/products/12/executions/testCases/5/executions/7/testSteps/99/result')
+            == '/api/tenants/{tenantId}/products/{productId}/executions/testCases/{testCaseId}/executions/{executionId}/testSteps/{testStepId}/result')
+    assert (tbcs_client.APIConnector.get_endpoint_template('/api/tenants/-1/products/12/specifications/testCases?fieldValue=externalId:equals:42')
+            == '/api/tenants/{tenantId}/products/{productId}/specifications/testCases')
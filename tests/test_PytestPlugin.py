@@ -0,0 +1,103 @@
+from typing import List
+
+import pytest
+
+from _pytest.pytester import Pytester, RunResult
+
+import tbcs_client
+
+TESTS: str = '''
+import pytest
+
+
+def test_passes():
+    assert True
+
+
+def test_fails():
+    assert 1 == 2
+
+
+@pytest.mark.tbcs(external_id='login.valid_user')
+def test_marked():
+    pass
+
+
+@pytest.mark.skip
+def test_skipped():
+    pass
+'''
+
+
+def run_tests(pytester: Pytester, config_path: str) -> RunResult:
+    pytester.makepyfile(test_reported=TESTS)
+    return pytester.runpytest_inprocess('-p', 'tbcs_client.PytestPlugin', '--tbcs', '--tbcs-config', config_path, '--tbcs-workers', '4')
+
+
+def test_results_are_reported(fake_server, tmp_path, pytester):
+    config_path: str = fake_server.write_config(str(tmp_path / 'tbcs.config.json'))
+
+    result: RunResult = run_tests(pytester, config_path)
+
+    result.assert_outcomes(passed=2, failed=1, skipped=1)
+    result.stdout.fnmatch_lines(['*3 results reported (2 passed, 1 failed), 4 test cases created, 0 errors*', '*reporting overhead*'])
+    external_ids: List[str] = sorted(test_case['automation']['externalId'].split('/')[-1] for test_case in fake_server.test_cases.values())
+    assert (external_ids == ['login.valid_user', 'test_reported.py::test_fails', 'test_reported.py::test_passes', 'test_reported.py::test_skipped'])
+    assert (len(fake_server.executions) == 3)
+    assert (len(fake_server.defects) == 1)
+
+
+def test_existing_test_cases_are_reused(fake_server, tmp_path, pytester):
+    config_path: str = fake_server.write_config(str(tmp_path / 'tbcs.config.json'))
+    run_tests(pytester, config_path)
+
+    result: RunResult = run_tests(pytester, config_path)
+
+    result.stdout.fnmatch_lines(['*3 results reported (2 passed, 1 failed), 0 test cases created, 0 errors*'])
+    assert (len(fake_server.test_cases) == 4)
+    assert (len(fake_server.executions) == 6)
+    assert (len(fake_server.defects) == 1)
+
+
+def test_plugin_is_inactive_without_option(pytester):
+    pytester.makepyfile(test_reported=TESTS)
+
+    result: RunResult = pytester.runpytest_inprocess('-p', 'tbcs_client.PytestPlugin')
+
+    result.assert_outcomes(passed=2, failed=1, skipped=1)
+    assert ('TestBench CS' not in result.stdout.str())
+
+
+def test_failing_teardown_overrides_passed_call(fake_server, tmp_path, pytester):
+    config_path: str = fake_server.write_config(str(tmp_path / 'tbcs.config.json'))
+    pytester.makepyfile(test_teardown='''
+import pytest
+
+
+@pytest.fixture
+def resource():
+    yield
+    raise RuntimeError('resource could not be released')
+
+
+def test_passes(resource):
+    pass
+''')
+
+    result: RunResult = pytester.runpytest_inprocess('-p', 'tbcs_client.PytestPlugin', '--tbcs', '--tbcs-config', config_path)
+
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(['*1 results reported (0 passed, 1 failed)*'])
+    assert ([defect['name'] for defect in fake_server.defects.values()] == ['RuntimeError: resource could not be released'])
+
+
+def test_existing_test_case_without_test_block_is_not_duplicated(fake_server, fake_connector, tmp_path, pytester):
+    test_case_id: str = fake_connector.create_test_case('valid user', '', tbcs_client.APIConnector.TEST_CASE_TYPE_SIMPLE, 'login.valid_user')
+    fake_server.test_cases[int(test_case_id)]['testSequence']['testStepBlocks'] = []
+    config_path: str = fake_server.write_config(str(tmp_path / 'tbcs.config.json'))
+    run_tests(pytester, config_path)
+
+    result: RunResult = run_tests(pytester, config_path)
+
+    result.stdout.fnmatch_lines(['*2 results reported (1 passed, 1 failed), 0 test cases created, 1 errors*', '*has no Test block*'])
+    assert (len(fake_server.test_cases) == 4)
@@ -0,0 +1,29 @@
+import time
+
+import tbcs_client
+
+
+def test_burst_is_served_immediately():
+    rate_limiter: tbcs_client.RateLimiter = tbcs_client.RateLimiter(rate=10, burst=5)
+
+    assert ([rate_limiter.reserve() for _ in range(5)] == [0.0] * 5)
+
+
+def test_callers_beyond_burst_are_spaced_by_rate():
+    rate_limiter: tbcs_client.RateLimiter = tbcs_client.RateLimiter(rate=10, burst=1)
+    rate_limiter.reserve()
+
+    delays = [rate_limiter.reserve() for _ in range(3)]
+
+    for delay, expected_delay in zip(delays, [0.1, 0.2, 0.3]):
+        assert (abs(delay - expected_delay) < 0.01)
+
+
+def test_acquire_waits_for_token():
+    rate_limiter: tbcs_client.RateLimiter = tbcs_client.RateLimiter(rate=50, burst=1)
+    start: float = time.monotonic()
+
+    for _ in range(6):
+        rate_limiter.acquire()
+
+    assert (time.monotonic() - start >= 0.09)
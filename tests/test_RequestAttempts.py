@@ -0,0 +1,63 @@
+from typing import Optional
+
+import pytest
+import requests
+
+import tbcs_client
+
+
+def create_response(status_code: int, retry_after: Optional[str] = None) -> requests.Response:
+    response: requests.Response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{}'
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_expected_response_is_done():
+    attempts: tbcs_client.RequestAttempts = tbcs_client.RequestAttempts(
+        tbcs_client.Request('POST', '/api/tenants/1/products/2/defects', 201, '{}'),
+        tbcs_client.RetryPolicy()
+    )
+    attempts.before_send()
+
+    assert (attempts.on_response(create_response(201)) == (tbcs_client.RequestAttempts.ACTION_DONE, 0.0))
+    assert (attempts.get_event('/defects')[:5] == ('POST', '/defects', 201, 2, 2))
+
+
+def test_unauthorized_response_reauthenticates_once():
+    attempts: tbcs_client.RequestAttempts = tbcs_client.RequestAttempts(
+        tbcs_client.Request('GET', '/api/tenants/1/products/2/defects', 200),
+        tbcs_client.RetryPolicy()
+    )
+    attempts.before_send()
+
+    assert (attempts.on_response(create_response(401))[0] == tbcs_client.RequestAttempts.ACTION_REAUTHENTICATE)
+    attempts.before_send()
+    with pytest.raises(tbcs_client.APIError):
+        attempts.on_response(create_response(401))
+
+
+def test_retries_follow_retry_policy_and_circuit_breaker():
+    circuit_breaker: tbcs_client.CircuitBreaker = tbcs_client.CircuitBreaker(failure_threshold=3)
+    attempts: tbcs_client.RequestAttempts = tbcs_client.RequestAttempts(
+        tbcs_client.Request('POST', '/api/tenants/1/products/2/defects', 201),
+        tbcs_client.RetryPolicy(max_attempts=3),
+        circuit_breaker
+    )
+    attempts.before_send()
+    assert (attempts.on_response(create_response(429, '0.25')) == (tbcs_client.RequestAttempts.ACTION_RETRY, 0.25))
+    attempts.before_send()
+    assert (attempts.on_error(requests.ConnectionError()) is None)
+    attempts.record_sleep(0.5)
+
+    event: tbcs_client.RequestEvent = attempts.get_event('/defects')
+
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_CLOSED)
+    assert ((event.retries, event.sleep_time) == (1, 0.75))
+
+    attempts.before_send()
+    with pytest.raises(tbcs_client.APIError):
+        attempts.on_response(create_response(503))
+    assert (circuit_breaker.state == tbcs_client.CircuitBreaker.STATE_OPEN)
@@ -0,0 +1,102 @@
+import asyncio
+
+from typing import Dict
+
+import pytest
+
+import tbcs_client
+
+
+def test_pending_entries_survive_reopening(tmp_path):
+    journal_path: str = str(tmp_path / 'journal.jsonl')
+    with tbcs_client.ResultJournal(journal_path) as journal:
+        first: int = journal.append('create_defect', ['defect', 'message'])
+        journal.append('report_step_result', ['1', '2', '3', 'Passed'])
+        journal.mark_done(first, '42')
+
+    with open(journal_path, 'a') as journal_file:
+        journal_file.write('{"sequence": 3, "operation": "repo')
+
+    with tbcs_client.ResultJournal(journal_path) as journal:
+        assert (journal.get_pending_entries() == [tbcs_client.JournalEntry(2, 'report_step_result', ['1', '2', '3', 'Passed'])])
+        assert (journal.resolve_defect_id(tbcs_client.ResultJournal.get_reference(first)) == '42')
+        assert (journal.resolve_defect_id('7') == '7')
+        assert (journal.append('assign_defect', ['1', '2', '3', '42']) == 3)
+
+    with tbcs_client.ResultJournal(journal_path) as journal:
+        assert ([entry.sequence for entry in journal.get_pending_entries()] == [2, 3])
+
+
+def test_deferred_calls_are_replayed_once(fake_server, fake_connector, tmp_path):
+    journal: tbcs_client.ResultJournal = tbcs_client.ResultJournal(str(tmp_path / 'journal.jsonl'), deferred=True)
+    test_case_id: str = fake_connector.create_test_case('journal test', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'journal')
+    test_step_id: str = fake_connector.add_test_step(test_case_id, 'step')
+    execution_id: str = fake_connector.start_execution(test_case_id)
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'journal.config.json')),
+        journal=journal
+    )
+    connector.log_in()
+    fake_server.reset_request_log()
+
+    defect_id: str = connector.create_defect('journal defect', 'deferred')
+    connector.report_step_result(test_case_id, execution_id, test_step_id, tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+    connector.assign_defect(test_case_id, execution_id, test_step_id, defect_id)
+
+    assert (defect_id == 'journal:1')
+    assert (len(fake_server.request_log) == 0)
+
+    summary: Dict[str, int] = connector.replay_journal()
+    step: dict = fake_server.executions[int(execution_id)]['testSequence']['testStepBlocks'][2]['steps'][0]
+
+    assert (summary == {'replayed': 3, 'failed': 0, 'pending': 0})
+    assert (step['result'] == tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+    assert (step['defectIds'] == list(fake_server.defects))
+    assert (connector.replay_journal() == {'replayed': 0, 'failed': 0, 'pending': 0})
+    journal.close()
+
+
+def test_failed_calls_stay_pending(fake_server, tmp_path):
+    journal: tbcs_client.ResultJournal = tbcs_client.ResultJournal(str(tmp_path / 'journal.jsonl'))
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(
+        fake_server.write_config(str(tmp_path / 'tbcs.config.json')),
+        journal=journal
+    )
+    connector.log_in()
+    fake_server.inject_errors(500)
+
+    with pytest.raises(tbcs_client.APIError):
+        connector.create_defect('lost defect', 'server error')
+    assert (len(journal.get_pending_entries()) == 1)
+    assert (connector.replay_journal() == {'replayed': 1, 'failed': 0, 'pending': 0})
+    assert (len(fake_server.defects) == 1)
+    journal.close()
+
+
+def test_async_deferred_calls_are_replayed(fake_server, fake_connector, tmp_path):
+    journal: tbcs_client.ResultJournal = tbcs_client.ResultJournal(str(tmp_path / 'journal.jsonl'), deferred=True)
+    test_case_id: str = fake_connector.create_test_case('async journal test', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'async-journal')
+    test_step_id: str = fake_connector.add_test_step(test_case_id, 'step')
+    execution_id: str = fake_connector.start_execution(test_case_id)
+    fake_server.reset_request_log()
+
+    async def run() -> None:
+        async with tbcs_client.AsyncAPIConnector(fake_server.write_config(str(tmp_path / 'journal.config.json')), journal=journal) as connector:
+            await connector.log_in()
+            defect_id: str = await connector.create_defect('async journal defect', 'deferred')
+            await connector.report_execution(test_case_id, execution_id, {test_step_id: tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED})
+            await connector.assign_defect(test_case_id, execution_id, test_step_id, defect_id)
+
+    asyncio.run(run())
+
+    assert (fake_server.get_request_count() == fake_server.login_count == 1)
+
+    connector: tbcs_client.APIConnector = tbcs_client.APIConnector(fake_server.write_config(str(tmp_path / 'journal.config.json')), journal=journal)
+    connector.log_in()
+    summary: Dict[str, int] = connector.replay_journal()
+    step: dict = fake_server.executions[int(execution_id)]['testSequence']['testStepBlocks'][2]['steps'][0]
+
+    assert (summary == {'replayed': 3, 'failed': 0, 'pending': 0})
+    assert (step['result'] == tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+    assert (step['defectIds'] == list(fake_server.defects))
+    journal.close()
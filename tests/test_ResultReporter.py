@@ -0,0 +1,52 @@
+from typing import Dict, List, Tuple
+import random
+import threading
+import time
+
+import tbcs_client
+
+
+class RecordingConnector:
+    def __init__(self):
+        self.calls: Dict[str, List[Tuple[str, str]]] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def report_step_result(self, test_case_id: str, execution_id: str, test_step_id: str, result: str) -> None:
+        time.sleep(random.random() / 1000)
+        if result == tbcs_client.APIConnector.TEST_STEP_STATUS_UNDEFINED:
+            raise tbcs_client.APIError(f'{test_step_id} failed')
+        with self.lock:
+            self.calls.setdefault(execution_id, []).append(('result', test_step_id))
+
+    def assign_defect(self, test_case_id: str, execution_id: str, test_step_id: str, defect_id: str) -> None:
+        with self.lock:
+            self.calls.setdefault(execution_id, []).append(('defect', test_step_id))
+
+
+def test_calls_per_execution_keep_their_order():
+    connector: RecordingConnector = RecordingConnector()
+    with tbcs_client.ResultReporter(connector, max_workers=4, max_queue_size=16) as reporter:
+        for test_step_id in range(50):
+            for execution_id in ['1', '2', '3']:
+                reporter.report_step_result('10', execution_id, str(test_step_id), tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED)
+                reporter.assign_defect('10', execution_id, str(test_step_id), '99')
+
+    for execution_id in ['1', '2', '3']:
+        assert (connector.calls[execution_id] == [
+            (kind, str(test_step_id)) for test_step_id in range(50) for kind in ['result', 'defect']
+        ])
+
+
+def test_failures_are_collected():
+    connector: RecordingConnector = RecordingConnector()
+    reporter: tbcs_client.ResultReporter = tbcs_client.ResultReporter(connector, max_workers=2)
+    reporter.report_step_result('10', '1', '1', tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED)
+    reporter.report_step_result('10', '1', '2', tbcs_client.APIConnector.TEST_STEP_STATUS_UNDEFINED)
+    reporter.report_step_result('10', '1', '3', tbcs_client.APIConnector.TEST_STEP_STATUS_FAILED)
+
+    assert (reporter.flush(timeout=5))
+    assert (reporter.summary() == {'submitted': 3, 'pending': 0, 'completed': 2, 'failed': 1})
+    assert (reporter.get_failures()[0].operation == 'report_step_result')
+    assert (reporter.get_failures()[0].message == '2 failed')
+
+    reporter.close()
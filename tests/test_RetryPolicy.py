@@ -0,0 +1,40 @@
+import email.utils
+import time
+
+import tbcs_client
+
+
+def test_unprocessed_requests_are_retried_for_all_methods():
+    retry_policy: tbcs_client.RetryPolicy = tbcs_client.RetryPolicy(max_attempts=3)
+
+    assert (retry_policy.should_retry_status('POST', 429, 1))
+    assert (retry_policy.should_retry_status('POST', 503, 2))
+    assert (not retry_policy.should_retry_status('POST', 503, 3))
+
+
+def test_other_failures_are_retried_for_idempotent_methods_only():
+    retry_policy: tbcs_client.RetryPolicy = tbcs_client.RetryPolicy()
+
+    assert (retry_policy.should_retry_status('GET', 502, 1))
+    assert (retry_policy.should_retry_status('PUT', 504, 1))
+    assert (not retry_policy.should_retry_status('POST', 502, 1))
+    assert (not retry_policy.should_retry_status('GET', 500, 1))
+    assert (not retry_policy.should_retry_status('GET', 404, 1))
+    assert (retry_policy.should_retry_error('DELETE', 1))
+    assert (not retry_policy.should_retry_error('POST', 1))
+
+
+def test_backoff_grows_exponentially_up_to_maximum():
+    retry_policy: tbcs_client.RetryPolicy = tbcs_client.RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=0.0)
+
+    assert ([retry_policy.get_delay(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0])
+
+
+def test_retry_after_takes_precedence():
+    retry_policy: tbcs_client.RetryPolicy = tbcs_client.RetryPolicy(max_retry_after=10.0)
+    retry_date: str = email.utils.formatdate(time.time() + 5, usegmt=True)
+
+    assert (retry_policy.get_delay(1, '2') == 2.0)
+    assert (retry_policy.get_delay(1, '120') == 10.0)
+    assert (3.0 < retry_policy.get_delay(1, retry_date) <= 5.0)
+    assert (retry_policy.get_delay(1, 'soon') <= retry_policy.backoff_base)
@@ -0,0 +1,49 @@
+import os
+import stat
+
+import tbcs_client
+
+
+def test_save_and_load(tmp_path):
+    token_store: tbcs_client.SessionTokenStore = tbcs_client.SessionTokenStore(str(tmp_path))
+    key: str = tbcs_client.SessionTokenStore.get_key('https://server', 'tenant', 'user')
+    token_store.save(key, {'sessionToken': 'token', 'tenantId': 3, 'userId': 7})
+
+    session_data: dict = token_store.load(key)
+
+    assert (session_data['sessionToken'] == 'token')
+    assert (session_data['tenantId'] == 3)
+    assert (session_data['userId'] == 7)
+    if not os.name == 'nt':
+        assert (stat.S_IMODE(os.stat(tmp_path / f'{key}.json').st_mode) == 0o600)
+
+
+def test_keys_differ_per_account(tmp_path):
+    token_store: tbcs_client.SessionTokenStore = tbcs_client.SessionTokenStore(str(tmp_path))
+    token_store.save(tbcs_client.SessionTokenStore.get_key('https://server', 'tenant', 'user'), {'sessionToken': 'token', 'tenantId': 3, 'userId': 7})
+
+    assert (token_store.load(tbcs_client.SessionTokenStore.get_key('https://server', 'tenant', 'other')) is None)
+
+
+def test_remove_and_invalid_entries(tmp_path):
+    token_store: tbcs_client.SessionTokenStore = tbcs_client.SessionTokenStore(str(tmp_path))
+    key: str = tbcs_client.SessionTokenStore.get_key('https://server', 'tenant', 'user')
+    (tmp_path / f'{key}.json').write_text('{"sessionToken": "token"}')
+
+    assert (token_store.load(key) is None)
+
+    token_store.save(key, {'sessionToken': 'token', 'tenantId': 3, 'userId': 7})
+    token_store.remove(key)
+
+    assert (token_store.load(key) is None)
+
+
+def test_lock_can_be_taken_repeatedly(tmp_path):
+    token_store: tbcs_client.SessionTokenStore = tbcs_client.SessionTokenStore(str(tmp_path))
+    key: str = tbcs_client.SessionTokenStore.get_key('https://server', 'tenant', 'user')
+
+    for _ in range(3):
+        with token_store.lock(key):
+            token_store.save(key, {'sessionToken': 'token', 'tenantId': 3, 'userId': 7})
+
+    assert (token_store.load(key) is not None)
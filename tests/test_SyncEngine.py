@@ -0,0 +1,62 @@
+from typing import List
+
+import tbcs_client
+
+
+def new_specs(count: int) -> List[tbcs_client.TestCaseSpec]:
+    return [
+        tbcs_client.TestCaseSpec(
+            f'sync{index}',
+            f'sync test {index}',
+            'synced',
+            {'Preparation': ['prepare'], 'Test': ['first', 'second', 'third']}
+        )
+        for index in range(count)
+    ]
+
+
+def test_plan_test_steps():
+    existing: list = [('1', 'first'), ('2', 'second'), ('3', 'third')]
+
+    assert (tbcs_client.SyncEngine.plan_test_steps(existing, ['first', 'second', 'third']) == ([], []))
+    assert (tbcs_client.SyncEngine.plan_test_steps(existing, ['first', 'new', 'third', 'last']) == (
+        ['2'], [('1', ['new']), ('3', ['last'])]
+    ))
+    assert (tbcs_client.SyncEngine.plan_test_steps(existing, ['new', 'first']) == (
+        ['1', '2', '3'], [('-1', ['new', 'first'])]
+    ))
+    assert (tbcs_client.SyncEngine.plan_test_steps([], ['first']) == ([], [('-1', ['first'])]))
+
+
+def test_sync_creates_updates_and_skips_unchanged(fake_server, fake_connector):
+    engine: tbcs_client.SyncEngine = tbcs_client.SyncEngine(fake_connector)
+    specs: List[tbcs_client.TestCaseSpec] = new_specs(10)
+
+    assert (tbcs_client.SyncEngine.summary(engine.sync(specs))['created'] == 10)
+    assert ({test_case['testCaseType'] for test_case in fake_server.test_cases.values()} == {tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED})
+
+    fake_server.reset_request_log()
+    results: List[tbcs_client.SyncResult] = engine.sync(specs)
+
+    assert (tbcs_client.SyncEngine.summary(results)['unchanged'] == 10)
+    assert (len(fake_server.request_log) == 11)
+
+    specs[0] = specs[0]._replace(description='changed', test_steps={'Test': ['first', 'inserted', 'third']})
+    results = engine.sync(specs)
+    test_case: dict = fake_connector.get_test_case_by_id(results[0].test_case_id)
+
+    assert (results[0].action == tbcs_client.SyncEngine.ACTION_UPDATED)
+    assert (results[0].changed_fields == ['description'])
+    assert ((results[0].added_test_steps, results[0].removed_test_steps) == (1, 2))
+    assert (test_case['description'] == 'changed')
+    assert ([step['description'] for step in test_case['testSequence']['testStepBlocks'][2]['steps']] == ['first', 'inserted', 'third'])
+    assert (test_case['testSequence']['testStepBlocks'][0]['steps'] == [])
+
+
+def test_sync_reports_failures_per_test_case(fake_connector):
+    results: List[tbcs_client.SyncResult] = tbcs_client.SyncEngine(fake_connector).sync([
+        tbcs_client.TestCaseSpec('broken', 'broken test', test_steps={'Unknown': ['step']})
+    ] + new_specs(1))
+
+    assert (results[0].action == tbcs_client.SyncEngine.ACTION_FAILED)
+    assert (results[1].action == tbcs_client.SyncEngine.ACTION_CREATED)
@@ -0,0 +1,60 @@
+import json
+import sys
+
+import pytest
+
+import tbcs_client
+
+DOCUMENT: str = json.dumps({
+    'id': 12,
+    'name': 'model test',
+    'description': {'text': 'described'},
+    'testCaseType': 'StructuredTestCase',
+    'isAutomated': True,
+    'automation': {'externalId': 'model'},
+    'testSequence': {'testStepBlocks': [
+        {'name': 'Preparation', 'steps': [{'id': 1, 'description': 'prepare'}]},
+        {'name': 'Test', 'steps': [{'id': 2, 'description': 'first'}, {'id': 3, 'description': 'second'}]}
+    ]}
+})
+
+
+def test_test_case_is_parsed_lazily():
+    test_case: tbcs_client.TestCase = tbcs_client.TestCase(DOCUMENT)
+
+    assert (test_case.id == '12')
+    assert (test_case.description == 'described')
+    assert (test_case.external_id == 'model')
+    assert (test_case.block_names == ('Preparation', 'Test'))
+    assert ([test_step.id for test_step in test_case.get_test_steps()] == ['1', '2', '3'])
+    assert ([test_step.description for test_step in test_case.get_test_steps('Test')] == ['first', 'second'])
+    assert (test_case.get_test_step(3).block_name == 'Test')
+    with pytest.raises(tbcs_client.ItemNotFoundError):
+        test_case.get_test_step('4')
+    with pytest.raises(tbcs_client.ItemNotFoundError):
+        test_case.get_test_steps('CleanUp')
+
+
+def test_models_are_smaller_than_documents():
+    test_case: tbcs_client.TestCase = tbcs_client.TestCase(json.loads(DOCUMENT))
+    test_case.get_test_steps()
+
+    assert (not hasattr(test_case, '__dict__'))
+    assert (sys.getsizeof(test_case) < sys.getsizeof(json.loads(DOCUMENT)))
+
+
+def test_connector_returns_models(fake_connector):
+    test_case_id: str = fake_connector.create_test_case('model test', 'described', 'StructuredTestCase', 'model')
+    test_step_id: str = fake_connector.add_test_step(test_case_id, 'first')
+    execution_id: str = fake_connector.start_execution(test_case_id)
+    fake_connector.report_step_result(test_case_id, execution_id, test_step_id, tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED)
+
+    test_case: tbcs_client.TestCase = fake_connector.get_test_case_model_by_external_id('model')
+    execution: tbcs_client.Execution = fake_connector.get_execution_model_by_id(test_case_id, execution_id)
+
+    assert (test_case.id == test_case_id)
+    assert (test_case.get_test_steps('Test')[0].id == test_step_id)
+    assert (execution.test_case_id == test_case_id)
+    assert (execution.get_step_result(test_step_id).result == tbcs_client.APIConnector.TEST_STEP_STATUS_PASSED)
+    assert ([step_result.test_step_id for step_result in execution.get_step_results('Test')] == [test_step_id])
+    assert (fake_connector.get_test_case_by_external_id('model')['name'] == 'model test')
@@ -0,0 +1,84 @@
+import json
+import time
+
+import tbcs_client
+
+
+def new_document(test_case_id: int, external_id: str) -> str:
+    return json.dumps({'id': test_case_id, 'description': 'Description', 'automation': {'externalId': external_id}})
+
+
+def test_get_returns_copy_and_counts_hits():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache()
+    cache.put('1', new_document(1, 'first'))
+
+    test_case: dict = cache.get('1')
+    test_case['description'] = 'Changed'
+
+    assert (cache.get('1')['description'] == 'Description')
+    assert (cache.get('2') is None)
+    assert (cache.hits == 2)
+    assert (cache.misses == 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache(max_size=2)
+    cache.put('1', new_document(1, 'first'))
+    cache.put('2', new_document(2, 'second'))
+    cache.get('1')
+    cache.put('3', new_document(3, 'third'))
+
+    assert (cache.get('2') is None)
+    assert (cache.get('1') is not None)
+    assert (cache.get('3') is not None)
+
+
+def test_entries_expire_after_ttl():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache(ttl=0.01)
+    cache.put('1', new_document(1, 'first'))
+    time.sleep(0.02)
+
+    assert (cache.get('1') is None)
+    assert (cache.get_test_case_id('first') is None)
+
+
+def test_external_id_index():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache()
+    cache.put('1', new_document(1, 'first'))
+    cache.put_test_case_id('second', '2')
+
+    assert (cache.get_test_case_id('first') == '1')
+    assert (cache.get_test_case_id('second') == '2')
+    assert (cache.get_test_case_id('third') is None)
+
+
+def test_patch_and_invalidate():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache()
+    cache.put('1', new_document(1, 'first'))
+    cache.patch('1', {'description': 'New'})
+
+    assert (cache.get('1')['description'] == 'New')
+
+    cache.invalidate('1')
+
+    assert (cache.get('1') is None)
+    assert (cache.get_test_case_id('first') == '1')
+
+
+def test_reads_started_before_invalidation_are_not_stored():
+    cache: tbcs_client.TestCaseCache = tbcs_client.TestCaseCache()
+    generation: int = cache.get_generation('1')
+    cache.invalidate('1')
+    cache.put('1', new_document(1, 'first'), generation)
+
+    assert (cache.get('1') is None)
+
+    generation = cache.get_generation('1')
+    cache.patch('1', {'description': 'New'})
+    cache.put('1', new_document(1, 'first'), generation)
+
+    assert (cache.get('1') is None)
+
+    cache.put('1', new_document(1, 'first'), cache.get_generation('1'))
+
+    assert (cache.get('1')['automation']['externalId'] == 'first')
@@ -0,0 +1,59 @@
+import time
+
+import tbcs_client
+
+
+def new_index() -> tbcs_client.TestCaseIndex:
+    index: tbcs_client.TestCaseIndex = tbcs_client.TestCaseIndex()
+    index.add('1', 'first test', 'first')
+    index.add('2', 'second test', 'second')
+    index.timestamp = time.time()
+    return index
+
+
+def test_lookup_and_remove():
+    index: tbcs_client.TestCaseIndex = new_index()
+
+    assert (index.get_test_case_id_by_external_id('first') == '1')
+    assert (index.get_test_case_id_by_name('second test') == '2')
+
+    index.remove('1')
+
+    assert (index.get_test_case_id_by_external_id('first') is None)
+    assert (index.get_test_case_id_by_name('first test') is None)
+    assert (len(index) == 1)
+
+
+def test_save_and_load_snapshot(tmp_path):
+    snapshot_path: str = str(tmp_path / 'index.json')
+    new_index().save(snapshot_path, 'https://server', '1')
+    index: tbcs_client.TestCaseIndex = tbcs_client.TestCaseIndex()
+
+    assert (index.load(snapshot_path, 'https://server', '1', max_age=60))
+    assert (index.get_test_case_id_by_external_id('second') == '2')
+    assert (index.timestamp is not None)
+
+
+def test_load_rejects_stale_or_foreign_snapshot(tmp_path):
+    snapshot_path: str = str(tmp_path / 'index.json')
+    stale_index: tbcs_client.TestCaseIndex = new_index()
+    stale_index.timestamp = time.time() - 120
+    stale_index.save(snapshot_path, 'https://server', '1')
+    index: tbcs_client.TestCaseIndex = tbcs_client.TestCaseIndex()
+
+    assert (not index.load(snapshot_path, 'https://server', '1', max_age=60))
+    assert (not index.load(snapshot_path, 'https://server', '2'))
+    assert (not index.load(str(tmp_path / 'missing.json'), 'https://server', '1'))
+    assert (len(index) == 0)
+
+
+def test_lookup_ignores_indexed_test_case_with_changed_external_id(fake_server, fake_connector):
+    moved_test_case_id: str = fake_connector.create_test_case('moved', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'login')
+    test_case_id: str = fake_connector.create_test_case('login', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'draft')
+    for _ in fake_connector.prefetch_test_cases():
+        pass
+    fake_server.test_cases[int(moved_test_case_id)]['automation']['externalId'] = 'logout'
+    fake_server.test_cases[int(test_case_id)]['automation']['externalId'] = 'login'
+
+    assert (str(fake_connector.get_test_case_by_external_id('login')['id']) == test_case_id)
+    assert (fake_connector.test_case_index.get_test_case_id_by_external_id('login') is None)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from typing import List
+
+import pytest
+
+import tbcs_client
+
+
+@pytest.mark.parametrize('fake_connector', [{'validator_cache': tbcs_client.ValidatorCache()}], indirect=True, ids=['validator_cache'])
+def test_unchanged_documents_are_revalidated(fake_connector):
+    validator_cache: tbcs_client.ValidatorCache = fake_connector.validator_cache
+    test_case_id: str = fake_connector.create_test_case('conditional', 'unchanged', 'StructuredTestCase', 'conditional')
+    aggregator: tbcs_client.LatencyAggregator = tbcs_client.LatencyAggregator()
+    fake_connector.add_hook(aggregator)
+
+    for _ in range(5):
+        assert (fake_connector.get_test_case_by_id(test_case_id)['description'] == 'unchanged')
+    fake_connector.update_test_case_description(test_case_id, 'changed')
+
+    assert (fake_connector.get_test_case_by_id(test_case_id)['description'] == 'changed')
+    assert (validator_cache.revalidated == 5)
+    assert (aggregator.summary()['GET /api/tenants/{tenantId}/products/{productId}/specifications/testCases/{testCaseId}']['bytes_received'] > 0)
+
+
+def test_concurrent_identical_gets_are_coalesced(fake_server, fake_connector):
+    test_case_id: str = fake_connector.create_test_case('coalesced', '', 'StructuredTestCase', 'coalesced')
+    fake_server.latency = 0.1
+    fake_server.reset_request_log()
+    names: List[str] = []
+
+    def read() -> None:
+        names.append(fake_connector.get_test_case_by_id(test_case_id)['name'])
+
+    threads: List[threading.Thread] = [threading.Thread(target=read) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (names == ['coalesced'] * 10)
+    assert (fake_server.get_request_count('GET') == 1)
+
+
+@pytest.mark.parametrize('fake_server', [{'validator': 'Last-Modified'}], indirect=True, ids=['last_modified'])
+@pytest.mark.parametrize('fake_connector', [{'validator_cache': tbcs_client.ValidatorCache()}], indirect=True, ids=['validator_cache'])
+def test_last_modified_within_the_same_second_is_not_used(fake_server, fake_connector):
+    test_case_id: str = fake_connector.create_test_case('same second', '', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'same_second')
+    fake_connector.get_test_case_by_id(test_case_id)
+    test_step_id: str = fake_connector.add_test_step(test_case_id, 'written in the same second')
+
+    assert ([str(step['id']) for step in fake_connector.get_test_case_by_id(test_case_id)['testSequence']['testStepBlocks'][2]['steps']] == [test_step_id])
+    assert (len(fake_connector.validator_cache) == 0)
+
+
+@pytest.mark.parametrize('fake_server', [{'validator': 'Last-Modified'}], indirect=True, ids=['last_modified'])
+@pytest.mark.parametrize('fake_connector', [{'validator_cache': tbcs_client.ValidatorCache()}], indirect=True, ids=['validator_cache'])
+def test_older_last_modified_is_revalidated(fake_server, fake_connector):
+    test_case_id: str = fake_connector.create_test_case('older', 'unchanged', tbcs_client.APIConnector.TEST_CASE_TYPE_STRUCTURED, 'older')
+    fake_connector.get_test_case_by_id(test_case_id)
+    time.sleep(1.1)
+    fake_connector.get_test_case_by_id(test_case_id)
+
+    assert (fake_connector.get_test_case_by_id(test_case_id)['description'] == 'unchanged')
+    assert (fake_connector.validator_cache.revalidated == 1)
@@ -0,0 +1,71 @@
+from typing import List
+import itertools
+
+import pytest
+
+import tbcs_client
+
+
+def test_fixed_interval_wait_policy_checks_immediately():
+    delays: List[float] = list(itertools.islice(tbcs_client.FixedIntervalWaitPolicy(interval=1.0, timeout=30.0).delays(), 3))
+
+    assert (delays == [0.0, 1.0, 1.0])
+
+
+def test_fixed_interval_wait_policy_stops_at_deadline():
+    delays: List[float] = list(tbcs_client.FixedIntervalWaitPolicy(interval=0.01, timeout=0.0).delays())
+
+    assert (delays == [0.0])
+
+
+def test_exponential_backoff_wait_policy_is_capped():
+    wait_policy: tbcs_client.ExponentialBackoffWaitPolicy = tbcs_client.ExponentialBackoffWaitPolicy(
+        first_delay=0.05,
+        multiplier=2.0,
+        max_delay=0.2,
+        jitter=0.0
+    )
+    delays: List[float] = list(itertools.islice(wait_policy.delays(), 6))
+
+    assert (delays == [0.0, 0.05, 0.1, 0.2, 0.2, 0.2])
+
+
+def test_exponential_backoff_wait_policy_applies_jitter():
+    wait_policy: tbcs_client.ExponentialBackoffWaitPolicy = tbcs_client.ExponentialBackoffWaitPolicy(
+        first_delay=1.0,
+        multiplier=1.0,
+        jitter=0.5
+    )
+
+    for delay in itertools.islice(wait_policy.delays(), 1, 50):
+        assert (0.5 <= delay <= 1.0)
+
+
+def test_no_verification_wait_policy_never_checks():
+    wait_policy: tbcs_client.NoVerificationWaitPolicy = tbcs_client.NoVerificationWaitPolicy()
+
+    assert (not wait_policy.verify)
+    assert (list(wait_policy.delays()) == [])
+
+
+def test_wait_statistics_summary():
+    wait_statistics: tbcs_client.WaitStatistics = tbcs_client.WaitStatistics(max_records=2)
+    wait_statistics.record('add_test_step', 0.1, 1, True)
+    wait_statistics.record('add_test_step', 0.3, 3, True)
+    wait_statistics.record('start_execution', 2.0, 5, False)
+
+    summary: dict = wait_statistics.summary()
+
+    assert (len(wait_statistics.get_records()) == 2)
+    assert (summary['add_test_step']['count'] == 2)
+    assert (summary['add_test_step']['checks'] == 4)
+    assert (abs(summary['add_test_step']['mean_duration'] - 0.2) < 1e-9)
+    assert (summary['start_execution']['timeouts'] == 1)
+
+
+def test_wait_policy_without_delays_cannot_be_created():
+    class IncompleteWaitPolicy(tbcs_client.WaitPolicy):
+        timeout = 1.0
+
+    with pytest.raises(TypeError):
+        IncompleteWaitPolicy()
@@ -0,0 +1,22 @@
+from typing import List
+
+from tests import benchmark
+
+
+def test_flows_send_the_expected_number_of_requests():
+    results: List[benchmark.BenchmarkResult] = benchmark.run_benchmarks(scale=0.01)
+
+    assert ([(result.name, result.operations, result.requests) for result in results] == [
+        ('create_test_case_with_steps', 1, 5),
+        ('report_results_sequentially', 100, 100),
+        ('report_results_with_reporter', 100, 100),
+        ('report_results_async', 100, 100)
+    ])
+
+
+def test_compare_reports_regressions():
+    result: benchmark.BenchmarkResult = benchmark.BenchmarkResult('flow', 100, 1.0, 100.0, 120, 0.01, 0.02, 0.03)
+
+    assert (benchmark.compare([result], {'flow': result._replace(throughput=110.0)._asdict()}) == [])
+    assert (len(benchmark.compare([result], {'flow': result._replace(throughput=200.0, requests=100)._asdict()})) == 2)
+    assert (benchmark.compare([result], {'flow': result._replace(operations=50, throughput=200.0)._asdict()}) == [])